@@ -8,7 +8,7 @@ import time
 import logging
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Set up logging
 logging.basicConfig(
@@ -32,15 +32,24 @@ def is_active_hours():
         return True
     return False
 
+def seconds_until_active():
+    """Seconds from now until the next 9 AM start of the active window"""
+    now = datetime.now()
+    start = now.replace(hour=9, minute=0, second=0, microsecond=0)
+    if now >= start:
+        start += timedelta(days=1)
+    return (start - now).total_seconds()
+
 def wait_until_active():
     """Wait until active hours and log the waiting"""
     while not is_active_hours():
         current_time = datetime.now().strftime("%H:%M")
-        logger.info(f"Waiting for active hours... Current time: {current_time} (Active: 9 AM - 1 AM)")
-        time.sleep(300)  # Check every 5 minutes
+        wait_seconds = seconds_until_active()
+        logger.info("Waiting for active hours... Current time: %s (Active: 9 AM - 1 AM), sleeping %.0f min", current_time, wait_seconds / 60)
+        time.sleep(wait_seconds)  # Sleep straight through to 9 AM
     
     current_time = datetime.now().strftime("%H:%M")
-    logger.info(f"Active hours reached! Starting bot at {current_time}")
+    logger.info("Active hours reached! Starting bot at %s", current_time)
 
 def run_bot():
     """Run the main bot and handle its lifecycle"""
@@ -78,7 +87,7 @@ def run_bot():
         return process.returncode
         
     except Exception as e:
-        logger.error(f"Error running bot: {e}")
+        logger.error("Error running bot: %s", e)
         return 1
 
 def main():
@@ -98,11 +107,11 @@ def main():
             return_code = run_bot()
             
             if return_code != 0:
-                logger.warning(f"Bot exited with code {return_code}")
+                logger.warning("Bot exited with code %s", return_code)
             
             # After bot stops, wait until next active period
             current_time = datetime.now().strftime("%H:%M")
-            logger.info(f"😴 Bot stopped at {current_time}. Waiting for next active period...")
+            logger.info("😴 Bot stopped at %s. Waiting for next active period...", current_time)
             
             # Small delay before checking again
             time.sleep(60)
@@ -111,7 +120,7 @@ def main():
             logger.info("Scheduler stopped by user")
             break
         except Exception as e:
-            logger.error(f"Scheduler error: {e}")
+            logger.error("Scheduler error: %s", e)
             logger.info("Restarting scheduler in 60 seconds...")
             time.sleep(60)
 
@@ -6,15 +6,21 @@ with unhinged commentary and motivational roasting.
 """
 
 import praw
+import prawcore
 import random
 import time
 import logging
 import os
 import pytz
 import json
+import bisect
+import collections
+import functools
 import hashlib
 import re
-from datetime import datetime
+import sys
+import types
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -31,12 +37,1470 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Most comment ids remembered as already replied to; older ones are forgotten
+_PROCESSED_COMMENTS_LIMIT = 10000
+
+# Empty comment polls before the stream yields None. PRAW sleeps with its own
+# exponential backoff between those polls; a negative value would make it yield
+# after every poll and skip the backoff entirely
+_STREAM_PAUSE_AFTER = 3
+
+# Rate-limit backoff when Reddit doesn't say how long to wait: first wait and
+# ceiling in seconds (doubles per consecutive 429). Reddit's comment throttle is
+# minutes long, so the first wait starts at a minute rather than retrying at once
+_BACKOFF_INITIAL = 60.0
+_BACKOFF_MAX = 300.0
+
+# Adaptive reply pacing (replies per second): start at one per 10 s, add a step
+# per successful reply up to one per 5 s, halve on every 429 down to one per 10 min
+_REPLY_RATE_INITIAL = 0.1
+_REPLY_RATE_MAX = 0.2
+_REPLY_RATE_MIN = 1 / 600
+_REPLY_RATE_STEP = 0.01
+
+# Seconds a thread's locked/archived check stays valid when diagnosing 403s
+_THREAD_FLAGS_TTL = 300
+
+# Reconnect backoff after stream errors: first wait and ceiling in seconds
+_RECONNECT_DELAY_INITIAL = 5
+_RECONNECT_DELAY_MAX = 600
+
+# Likely causes logged when a reply, authentication or the stream gets a 403,
+# pre-joined so each 403 is a single log record
+_REPLY_FORBIDDEN_CAUSES = "\n".join((
+    "Possible causes:",
+    "1. Bot account might be shadowbanned or restricted",
+    "2. Subreddit restrictions on new accounts/bots",
+    "3. Comment thread might be locked/archived",
+    "4. Insufficient karma to post in subreddit",
+    "5. Rate limiting (too many requests)"
+))
+_AUTH_FORBIDDEN_CAUSES = "\n".join((
+    "403 FORBIDDEN - Possible causes:",
+    "   • Wrong username/password",
+    "   • Account suspended/banned",
+    "   • Two-factor authentication enabled",
+    "   • Rate limited"
+))
+_RUN_FORBIDDEN_CAUSES = "\n".join((
+    "   Possible causes:",
+    "   • Account banned/suspended",
+    "   • Rate limited",
+    "   • Permission issues",
+    "   • Wrong credentials"
+))
+
+# Failures a Reddit lookup can raise (API errors, network/HTTP errors, missing
+# attributes on deleted objects); anything else is a bug and should surface
+_REDDIT_ERRORS = (praw.exceptions.PRAWException, prawcore.exceptions.PrawcoreException, AttributeError)
+
+
+# Wait stated in a RATELIMIT message, e.g. "Take a break for 5 minutes before trying again."
+_RATELIMIT_WAIT_RE = re.compile(r'(\d+)\s*(second|minute|hour)s?\b')
+_RATELIMIT_UNIT_SECONDS = {'second': 1, 'minute': 60, 'hour': 3600}
+
+
+def _ratelimit_wait(error):
+    """Seconds Reddit asked us to wait in a RATELIMIT API error, or None if it didn't say"""
+    if isinstance(error, praw.exceptions.RedditAPIException):
+        for item in error.items:
+            if item.error_type == 'RATELIMIT':
+                match = _RATELIMIT_WAIT_RE.search(item.message or '')
+                if match:
+                    return int(match.group(1)) * _RATELIMIT_UNIT_SECONDS[match.group(2)]
+    return None
+
+
+def _error_status(error):
+    """HTTP status behind a Reddit error (429 for PRAW's RATELIMIT API error), else None"""
+    if isinstance(error, praw.exceptions.RedditAPIException):
+        if any(item.error_type == 'RATELIMIT' for item in error.items):
+            return 429
+    return getattr(getattr(error, 'response', None), 'status_code', None)
+
+
+# Reddit API error types meaning a comment can no longer be replied to
+_CLOSED_THREAD_ERRORS = frozenset({'THREAD_LOCKED', 'DELETED_COMMENT', 'TOO_OLD'})
+
+
+def _is_closed_thread_error(error):
+    """True when a reply failed because the thread is locked/archived or the comment is gone"""
+    return isinstance(error, praw.exceptions.RedditAPIException) and any(
+        item.error_type in _CLOSED_THREAD_ERRORS for item in error.items
+    )
+
+
+# Static lookup tables shared by the response generators (built once at import)
+
+# Markdown wrappers stripped by _clean_text_formatting, applied in this order;
+# each pass is skipped unless its marker character occurs in the text
+_MARKDOWN_RES = (
+    ('*', re.compile(r'\*\*(.*?)\*\*')),          # Bold **text**
+    ('*', re.compile(r'\*(.*?)\*')),              # Italic *text*
+    ('`', re.compile(r'`(.*?)`')),                # Code `text`
+    ('`', re.compile(r'```(.*?)```', re.DOTALL)), # Code blocks
+    ('~', re.compile(r'~~(.*?)~~')),              # Strikethrough ~~text~~
+    ('^', re.compile(r'\^(.*?)\^')),              # Superscript ^text^
+    ('_', re.compile(r'_(.*?)_')),                # Underline _text_
+)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+class _PunctuationToSpace(dict):
+    """str.translate table sending every _PUNCT_RE character to a space, filled in per code point on first use"""
+
+    def __missing__(self, codepoint):
+        self[codepoint] = mapped = 32 if _PUNCT_RE.match(chr(codepoint)) else codepoint
+        return mapped
+
+
+_PUNCT_TABLE = _PunctuationToSpace()
+
+# Campus keys in display order, interned so dict probes can match on identity
+_CAMPUS_KEYS = tuple(sys.intern(campus) for campus in ('pilani', 'goa', 'hyderabad'))
+
+# Upper-case campus headings, built once instead of per reply
+_CAMPUS_DISPLAY = {campus: campus.upper() for campus in _CAMPUS_KEYS}
+
+# Complete cutoff data (2024-25 Official BITS Data)
+_RAW_CUTOFFS = {
+    'pilani': {
+        'computer science': 327, 'cse': 327, 'cs': 327, 'computer': 327,
+        'electronics and communication': 314, 'ece': 314, 'electronics': 314, 'communication': 314,
+        'electrical and electronics': 292, 'eee': 292, 'electrical': 292,
+        'mechanical': 266, 'mech': 266, 'mechanical engineering': 266,
+        'chemical': 247, 'chemical engineering': 247, 'chem': 247,
+        'civil': 238, 'civil engineering': 238,
+        'manufacturing': 243, 'manufacturing engineering': 243, 'manuf': 243,
+        'mathematics and computing': 318, 'math and computing': 318, 'mathematics computing': 318, 'mnc': 318,
+        'pharmacy': 165, 'pharm': 165, 'b.pharm': 165,
+        'biological sciences': 236, 'biology': 236, 'bio': 236, 'biological': 236,
+        'chemistry msc': 241, 'msc chemistry': 241,
+        'mathematics msc': 256, 'msc mathematics': 256, 'msc math': 256, 'msc maths': 256, 'math': 256, 'maths': 256, 'mathematics': 256,
+        'economics': 271, 'eco': 271, 'msc economics': 271,
+        'physics': 254, 'phy': 254, 'msc physics': 254,
+        'electronics and instrumentation': 282, 'instrumentation': 282, 'instru': 282, 'eni': 282
+    },
+    'goa': {
+        'computer science': 301, 'cse': 301, 'cs': 301, 'computer': 301,
+        'electronics and communication': 287, 'ece': 287, 'electronics': 287, 'communication': 287,
+        'electrical and electronics': 278, 'eee': 278, 'electrical': 278,
+        'mechanical': 254, 'mech': 254, 'mechanical engineering': 254,
+        'chemical': 239, 'chemical engineering': 239, 'chem': 239,
+        'mathematics and computing': 295, 'math and computing': 295, 'mathematics computing': 295, 'mnc': 295,
+        'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
+        'chemistry msc': 236, 'msc chemistry': 236,
+        'mathematics msc': 249, 'msc mathematics': 249, 'msc math': 249, 'msc maths': 249, 'math': 249, 'maths': 249, 'mathematics': 249,
+        'economics': 263, 'eco': 263, 'msc economics': 263,
+        'physics': 248, 'phy': 248, 'msc physics': 248,
+        'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
+    },
+    'hyderabad': {
+        'computer science': 298, 'cse': 298, 'cs': 298, 'computer': 298,
+        'electronics and communication': 284, 'ece': 284, 'electronics': 284, 'communication': 284,
+        'electrical and electronics': 275, 'eee': 275, 'electrical': 275,
+        'mechanical': 251, 'mech': 251, 'mechanical engineering': 251,
+        'chemical': 238, 'chemical engineering': 238, 'chem': 238,
+        'civil': 235, 'civil engineering': 235,
+        'mathematics and computing': 293, 'math and computing': 293, 'mathematics computing': 293, 'mnc': 293,
+        'pharmacy': 161, 'pharm': 161, 'b.pharm': 161,
+        'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
+        'chemistry msc': 235, 'msc chemistry': 235,
+        'mathematics msc': 247, 'msc mathematics': 247, 'msc math': 247, 'msc maths': 247, 'math': 247, 'maths': 247, 'mathematics': 247,
+        'economics': 261, 'eco': 261, 'msc economics': 261,
+        'physics': 245, 'phy': 245, 'msc physics': 245,
+        'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
+    }
+}
+
+# Read-only view of the table handed to the response builders, shared by every call.
+# Keys are interned so the sys.intern'd branch that detection returns matches its
+# dict key on identity; multi-word keys like 'computer science' aren't interned
+# by the compiler
+_CUTOFF_DATA = types.MappingProxyType({
+    sys.intern(campus): types.MappingProxyType(
+        {sys.intern(branch): required for branch, required in branches.items()}
+    )
+    for campus, branches in _RAW_CUTOFFS.items()
+})
+
+# One cutoff key per program; the rest of each campus table is aliases of these
+_CANONICAL_CUTOFF_KEYS = (
+    'cse', 'ece', 'eee', 'mechanical', 'chemical', 'civil', 'manufacturing', 'mnc',
+    'pharmacy', 'biology', 'msc chemistry', 'mathematics', 'economics', 'physics', 'eni'
+)
+
+# Every (required, branch, campus) program ascending by required score, with the
+# scores split out so bisect can find how many programs a user clears
+_CUTOFFS_SORTED = sorted(
+    (branches[branch], branch, campus)
+    for campus, branches in _CUTOFF_DATA.items()
+    for branch in _CANONICAL_CUTOFF_KEYS
+    if branch in branches
+)
+_CUTOFF_SCORES = [required for required, _, _ in _CUTOFFS_SORTED]
+_CUTOFF_OPTION_LINES = [f"• {branch.upper()} at {_CAMPUS_DISPLAY[campus]}" for _, branch, campus in _CUTOFFS_SORTED]
+
+# MSc subject keywords and the cutoff keys they resolve to
+_SUBJECT_MAPPINGS = {
+    'mathematics': ('mathematics msc', 'msc mathematics'),
+    'math': ('mathematics msc', 'msc mathematics'),
+    'maths': ('mathematics msc', 'msc mathematics'),
+    'chemistry': ('chemistry msc', 'msc chemistry'),
+    'physics': ('physics msc', 'msc physics'),
+    'biology': ('biological sciences',),
+    'bio': ('biological sciences',),
+    'economics': ('economics', 'msc economics'),
+    'eco': ('economics', 'msc economics')  # Map eco to economics
+}
+
+# Campus detection with variations
+_CAMPUS_PATTERNS = {
+    'pilani': ('pilani', 'pilani campus', 'bits pilani'),
+    'goa': ('goa', 'goa campus', 'bits goa', 'k k birla goa'),
+    'hyderabad': ('hyderabad', 'hyd', 'hyderabad campus', 'bits hyderabad', 'bits hyd')
+}
+
+# The same, minus patterns that contain a shorter one of their campus ('bits goa'
+# can only appear where 'goa' does), so detection needs one substring test per campus
+_CAMPUS_DETECT_TERMS = tuple(
+    (campus, tuple(p for p in patterns if not any(q != p and q in p for q in patterns)))
+    for campus, patterns in _CAMPUS_PATTERNS.items()
+)
+
+_CAMPUS_NAMES = {'pilani': 'Pilani', 'goa': 'Goa', 'hyderabad': 'Hyderabad'}
+
+# Placement data (based on recent BITS placement reports and industry data)
+_PLACEMENT_DATA = {
+    'cse': {'avg': 28, 'median': 22, 'highest': 65, 'top_companies': 'Google, Microsoft, Amazon'},
+    'ece': {'avg': 24, 'median': 18, 'highest': 55, 'top_companies': 'Intel, Qualcomm, Samsung'},
+    'eee': {'avg': 18, 'median': 14, 'highest': 45, 'top_companies': 'Siemens, ABB, L&T'},
+    'mechanical': {'avg': 16, 'median': 12, 'highest': 40, 'top_companies': 'Tata Motors, Mahindra, Bajaj'},
+    'chemical': {'avg': 17, 'median': 13, 'highest': 42, 'top_companies': 'Reliance, ONGC, ITC'},
+    'civil': {'avg': 14, 'median': 10, 'highest': 35, 'top_companies': 'L&T, Tata Projects, DLF'},
+    'mnc': {'avg': 26, 'median': 20, 'highest': 60, 'top_companies': 'Goldman Sachs, JP Morgan, Google'}
+}
+
+_BRANCH_DESCRIPTIONS = {
+    'cse': {'name': 'Computer Science', 'focus': 'Software, AI/ML, algorithms'},
+    'ece': {'name': 'Electronics & Communication', 'focus': 'Hardware+Software, VLSI, embedded'},
+    'eee': {'name': 'Electrical & Electronics', 'focus': 'Power systems, electrical machines'},
+    'mechanical': {'name': 'Mechanical', 'focus': 'Automotive, aerospace, manufacturing'},
+    'chemical': {'name': 'Chemical', 'focus': 'Process industries, pharma, petrochemicals'},
+    'civil': {'name': 'Civil', 'focus': 'Construction, infrastructure, urban planning'},
+    'mnc': {'name': 'Math & Computing', 'focus': 'Mathematics, programming, finance'},
+    'eni': {'name': 'Electronics & Instrumentation', 'focus': 'Process control, automation, IoT'},
+    'manufacturing': {'name': 'Manufacturing', 'focus': 'Production, industrial engineering'},
+    'pharmacy': {'name': 'Pharmacy', 'focus': 'Drug development, pharmaceutical industry'},
+    'biology': {'name': 'M.Sc Biology', 'focus': 'Life sciences, research, biotechnology'},
+    'physics': {'name': 'M.Sc Physics', 'focus': 'Research, academia, tech applications'},
+    'chemistry': {'name': 'M.Sc Chemistry', 'focus': 'Research, chemical industry, academia'},
+    'mathematics': {'name': 'M.Sc Mathematics', 'focus': 'Research, finance, data science'},
+    'economics': {'name': 'M.Sc Economics', 'focus': 'Policy, consulting, financial analysis'}
+}
+
+
+def _branch_info(branch_key):
+    """Display name and focus for a branch, with a generic fallback"""
+    return _BRANCH_DESCRIPTIONS.get(branch_key, {'name': branch_key.upper(), 'focus': 'Engineering/Science'})
+
+
+_CAREER_INSIGHTS = {
+    'cse': 'Highest demand, remote work options, rapid industry growth',
+    'ece': 'Hardware+software versatility, good for higher studies, stable demand',
+    'eee': 'Core engineering, government opportunities, power sector focus',
+    'mechanical': 'Most versatile, evergreen demand, broad industry applications',
+    'chemical': 'Specialized roles, process industries, research opportunities',
+    'civil': 'Infrastructure focus, government projects, steady demand',
+    'mnc': 'Finance+tech combination, quantitative roles, emerging field'
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _branch_comparison_body(branch1, branch2):
+    """Comparison tables and analysis for an ordered branch pair, cached since the data is static"""
+    # Get branch info
+    info1 = _branch_info(branch1)
+    info2 = _branch_info(branch2)
+
+    # Create detailed comparison table
+    parts = [f"**COMPREHENSIVE COMPARISON**\n\n"]
+    parts.append(f"| Aspect | {info1['name']} | {info2['name']} |\n")
+    parts.append(f"|--------|{'-' * len(info1['name'])}|{'-' * len(info2['name'])}|\n")
+    parts.append(f"| **Focus Area** | {info1['focus']} | {info2['focus']} |\n")
+
+    # Placement comparison
+    if branch1 in _PLACEMENT_DATA and branch2 in _PLACEMENT_DATA:
+        p1, p2 = _PLACEMENT_DATA[branch1], _PLACEMENT_DATA[branch2]
+        parts.append(f"| **Average Package** | ₹{p1['avg']}L | ₹{p2['avg']}L |\n")
+        parts.append(f"| **Median Package** | ₹{p1['median']}L | ₹{p2['median']}L |\n")
+        parts.append(f"| **Highest Package** | ₹{p1['highest']}L | ₹{p2['highest']}L |\n")
+        parts.append(f"| **Top Recruiters** | {p1['top_companies']} | {p2['top_companies']} |\n")
+    elif branch1 in _PLACEMENT_DATA:
+        p1 = _PLACEMENT_DATA[branch1]
+        parts.append(f"| **Average Package** | ₹{p1['avg']}L | Limited data |\n")
+        parts.append(f"| **Top Recruiters** | {p1['top_companies']} | Varies by specialization |\n")
+    elif branch2 in _PLACEMENT_DATA:
+        p2 = _PLACEMENT_DATA[branch2]
+        parts.append(f"| **Average Package** | Limited data | ₹{p2['avg']}L |\n")
+        parts.append(f"| **Top Recruiters** | Varies by specialization | {p2['top_companies']} |\n")
+
+    # Cutoff comparison across campuses
+    parts.append(f"\n**CUTOFF COMPARISON (2024-25)**\n\n")
+    parts.append(f"| Campus | {info1['name']} | {info2['name']} | Difference |\n")
+    parts.append(f"|--------|{'-' * len(info1['name'])}|{'-' * len(info2['name'])}|----------|\n")
+
+    for campus in _CAMPUS_KEYS:
+        cutoff1 = _CUTOFF_DATA[campus].get(branch1, None)
+        cutoff2 = _CUTOFF_DATA[campus].get(branch2, None)
+
+        if cutoff1 and cutoff2:
+            diff = cutoff1 - cutoff2
+            diff_str = f"{diff:+d}"
+            parts.append(f"| {campus.title()} | {cutoff1} | {cutoff2} | {diff_str} |\n")
+        elif cutoff1:
+            parts.append(f"| {campus.title()} | {cutoff1} | Not offered | - |\n")
+        elif cutoff2:
+            parts.append(f"| {campus.title()} | Not offered | {cutoff2} | - |\n")
+
+    # Detailed analysis
+    parts.append(f"\n**ANALYSIS:**\n")
+
+    # Package analysis
+    if branch1 in _PLACEMENT_DATA and branch2 in _PLACEMENT_DATA:
+        p1, p2 = _PLACEMENT_DATA[branch1], _PLACEMENT_DATA[branch2]
+        avg_diff = p1['avg'] - p2['avg']
+        if avg_diff > 2:
+            parts.append(f"• Package advantage: {info1['name']} leads by ₹{avg_diff}L average\n")
+        elif avg_diff < -2:
+            parts.append(f"• Package advantage: {info2['name']} leads by ₹{abs(avg_diff)}L average\n")
+        else:
+            parts.append(f"• Package parity: Both branches have similar placement outcomes\n")
+
+    # Cutoff analysis
+    avg_cutoffs = {}
+    for branch, branch_name in [(branch1, info1['name']), (branch2, info2['name'])]:
+        cutoffs = [_CUTOFF_DATA[campus].get(branch) for campus in _CAMPUS_KEYS]
+        valid_cutoffs = [c for c in cutoffs if c is not None]
+        if valid_cutoffs:
+            avg_cutoffs[branch_name] = sum(valid_cutoffs) / len(valid_cutoffs)
+
+    if len(avg_cutoffs) == 2:
+        names = list(avg_cutoffs.keys())
+        diff = avg_cutoffs[names[0]] - avg_cutoffs[names[1]]
+        if abs(diff) > 10:
+            higher = names[0] if diff > 0 else names[1]
+            parts.append(f"• Competition: {higher} is significantly more competitive (avg {abs(diff):.0f} points higher)\n")
+        else:
+            parts.append(f"• Competition: Both branches have similar competition levels\n")
+
+    # Career prospects
+    if branch1 in _CAREER_INSIGHTS:
+        parts.append(f"• {info1['name']} prospects: {_CAREER_INSIGHTS[branch1]}\n")
+    if branch2 in _CAREER_INSIGHTS:
+        parts.append(f"• {info2['name']} prospects: {_CAREER_INSIGHTS[branch2]}\n")
+
+    return "".join(parts)
+
+
+# Branch keywords for comparisons (avoid partial matches)
+_BRANCH_KEYWORDS = {
+    'cse': ('computer science', 'cse', 'computer'),  # Removed 'cs' to avoid msc conflict
+    'ece': ('electronics and communication', 'electronics communication', 'ece'),
+    'eee': ('electrical and electronics', 'electrical electronics', 'eee'),
+    'mechanical': ('mechanical', 'mech'),
+    'chemical': ('chemical', 'chem'),
+    'civil': ('civil',),
+    'mnc': ('mathematics and computing', 'math and computing', 'mnc'),
+    'eni': ('electronics and instrumentation', 'instrumentation', 'eni'),
+    'manufacturing': ('manufacturing', 'manuf'),
+    'pharmacy': ('pharmacy', 'pharm'),
+    'biology': ('biological sciences', 'msc biology', 'biology', 'bio'),
+    'physics': ('msc physics', 'physics', 'phy'),
+    'chemistry': ('msc chemistry', 'chemistry'),  # Removed 'chem' to avoid chemical conflict
+    'mathematics': ('msc mathematics', 'mathematics', 'maths', 'math'),
+    'economics': ('msc economics', 'economics', 'eco')
+}
+
+# Branch keywords for trend/chance detection (also matches bare 'electronics'/'electrical')
+_BRANCH_MAPPINGS = {
+    'cse': ('computer science', 'cse', 'computer'),
+    'ece': ('electronics and communication', 'electronics communication', 'ece', 'electronics'),
+    'eee': ('electrical and electronics', 'electrical electronics', 'eee', 'electrical'),
+    'mechanical': ('mechanical', 'mech'),
+    'chemical': ('chemical', 'chem'),
+    'civil': ('civil',),
+    'mnc': ('mathematics and computing', 'math and computing', 'mnc'),
+    'eni': ('electronics and instrumentation', 'instrumentation', 'eni'),
+    'manufacturing': ('manufacturing', 'manuf'),
+    'pharmacy': ('pharmacy', 'pharm'),
+    'biology': ('biological sciences', 'msc biology', 'biology', 'bio'),
+    'physics': ('msc physics', 'physics', 'phy'),
+    'chemistry': ('msc chemistry', 'chemistry'),
+    'mathematics': ('msc mathematics', 'mathematics', 'maths', 'math'),
+    'economics': ('msc economics', 'economics', 'eco')
+}
+
+# Every trend/chance keyword with its branch, longest first so the most specific match wins
+_BRANCH_MAPPINGS_SORTED = sorted(
+    ((keyword, branch_key) for branch_key, keywords in _BRANCH_MAPPINGS.items() for keyword in keywords),
+    key=lambda item: len(item[0]),
+    reverse=True
+)
+
+# Campus and branch aliases for cross-campus comparisons like 'goa cse vs pilani ece'
+_CROSS_CAMPUS_ALIASES = {'pilani': 'pilani', 'goa': 'goa', 'hyderabad': 'hyderabad', 'hyd': 'hyderabad'}
+
+_CROSS_CAMPUS_BRANCHES = {
+    'cse': ('cse', 'computer science', 'computer'),
+    'ece': ('ece', 'electronics and communication', 'electronics', 'eco'),  # Added 'eco' for ECE
+    'eee': ('eee', 'electrical and electronics', 'electrical'),
+    'mechanical': ('mechanical', 'mech'),
+    'chemical': ('chemical', 'chem'),
+    'civil': ('civil',),
+    'mnc': ('mnc', 'math and computing', 'mathematics and computing'),
+    'eni': ('eni', 'electronics and instrumentation', 'instrumentation'),
+    'manufacturing': ('manufacturing', 'manuf'),
+    'pharmacy': ('pharmacy', 'pharm'),
+    'biology': ('biology', 'bio', 'biological sciences'),
+    'physics': ('physics', 'phy'),
+    'chemistry': ('chemistry',),
+    'mathematics': ('mathematics', 'math', 'maths'),
+    'economics': ('economics', 'eco')  # Shadowed by ECE's 'eco' above
+}
+
+# First branch listing an alias wins, matching the original dict-order scan
+_CROSS_BRANCH_ALIASES = {}
+for _branch_key, _aliases in _CROSS_CAMPUS_BRANCHES.items():
+    for _alias in _aliases:
+        _CROSS_BRANCH_ALIASES.setdefault(_alias, _branch_key)
+
+
+def _alternation(words):
+    """Regex alternation of literal words, longest first so multi-word aliases win"""
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+# A campus followed by a branch within two words, or a branch followed by a
+# campus. The words in between may not be a comparison separator ('vs', 'or')
+# or cross a comma, so each campus pairs only with a branch on its own side.
+# Wrapped in a lookahead so overlapping pairs ('pilani cse vs goa') are all
+# reported from one scan.
+_CROSS_CAMPUS_ALT = _alternation(_CROSS_CAMPUS_ALIASES)
+_CROSS_BRANCH_ALT = _alternation(_CROSS_BRANCH_ALIASES)
+_PAIR_SEPARATOR_ALT = _alternation(('vs', 'versus', 'or'))
+_PAIR_GAP = rf'(?:[^\w,]+(?!(?:{_PAIR_SEPARATOR_ALT})\b)\w+){{0,2}}?[^\w,]+'
+_CAMPUS_BRANCH_RE = re.compile(
+    rf'\b(?=({_CROSS_CAMPUS_ALT})\b{_PAIR_GAP}({_CROSS_BRANCH_ALT})\b'
+    rf'|({_CROSS_BRANCH_ALT})\b{_PAIR_GAP}({_CROSS_CAMPUS_ALT})\b)'
+)
+
+# Every cutoff key in table order (first occurrence across campuses). The scan
+# reports the longest key starting at each position; ties on length go to the
+# key that comes first in the table
+_CUTOFF_KEY_ORDER = {}
+for _branches in _CUTOFF_DATA.values():
+    for _key in _branches:
+        _CUTOFF_KEY_ORDER.setdefault(_key, len(_CUTOFF_KEY_ORDER))
+_CUTOFF_KEY_RE = re.compile(f'(?=({_alternation(_CUTOFF_KEY_ORDER)}))')
+
+
+# MSc subject keywords mapped to the first of their cutoff keys that exists, for
+# queries that say 'msc' without naming an MSc key directly; subjects with no
+# cutoff key are left out so a match always resolves
+_MSC_SUBJECT_BRANCHES = {
+    subject: next(branch for branch in branches if branch in _CUTOFF_KEY_ORDER)
+    for subject, branches in _SUBJECT_MAPPINGS.items()
+    if any(branch in _CUTOFF_KEY_ORDER for branch in branches)
+}
+_MSC_SUBJECT_RE = re.compile(_alternation(_MSC_SUBJECT_BRANCHES))
+
+# Trend/chance branch keys mapped to the cutoff key they are stored under; most
+# are the same, but e.g. 'chemistry' only exists as 'msc chemistry'
+_BRANCH_CUTOFF_KEYS = {
+    branch_key: next((key for key in (branch_key, *keywords) if key in _CUTOFF_KEY_ORDER), branch_key)
+    for branch_key, keywords in _BRANCH_MAPPINGS.items()
+}
+
+
+def _cutoff_key_rank(key):
+    """Sort key preferring longer cutoff keys, then earlier ones in the table"""
+    return len(key), -_CUTOFF_KEY_ORDER[key]
+
+
+# First campus mentioned in a query; the group number indexes _CAMPUS_KEYS
+_CAMPUS_MENTION_RE = re.compile(r'(pilani)|(goa)|(hyd)')
+
+# Author names (lowercased) that mark AutoModerator, mods and other bots
+_BOT_NAME_RE = re.compile(_alternation((
+    'automoderator', 'automod', 'moderator', 'bot', '_bot', 'reddit',
+    'snapshillbot', 'totesmessenger', 'remindmebot', 'wikisummarizerbot'
+)))
+
+# Trigger vocabulary for natural-language questions; each list is matched as
+# substrings in one regex scan of the cleaned, lowercased comment
+_QUESTION_RE = re.compile(_alternation((
+    'what', 'how', 'can', 'will', 'should', 'which', 'where', 'when',
+    'tell me', 'help me', 'show me', 'give me', 'need to know',
+    'anyone know', 'does anyone', 'can someone', 'help with',
+    'kya', 'kaise', 'kitne', 'batao', 'bata do', 'pata hai',
+    '?'  # Question mark
+)))
+_CUTOFF_TERM_RE = re.compile(_alternation((
+    'cutoff', 'cut-off', 'cutoffs', 'cut-offs',
+    'admission', 'qualify', 'eligible', 'get into',
+    'marks needed', 'score needed', 'minimum marks',
+    'required marks', 'required score'
+)))
+_SPECIFIC_TERM_RE = re.compile(_alternation((
+    'cse', 'computer science', 'ece', 'electronics', 'eee', 'electrical',
+    'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
+    'mnc', 'math and computing', 'mathematics', 'eni', 'instrumentation',
+    'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy',
+    'pilani', 'goa', 'hyderabad', 'hyd', 'bits'
+)))
+_SHARING_RE = re.compile(_alternation((
+    'i got', 'i scored', 'my friend', 'someone i know',
+    'last year', 'previous year', 'heard that', 'saw that',
+    'according to', 'as per', 'i think', 'probably',
+    'maybe', 'might be', 'could be'
+)))
+_DIRECT_ASK_RE = re.compile(_alternation(('what', 'how', 'can', 'will', '?')))
+
+
+def _clean_text_formatting(text):
+    """Remove Reddit formatting and normalize text"""
+    # Remove Reddit markdown formatting
+    for marker, pattern in _MARKDOWN_RES:
+        if marker in text:
+            text = pattern.sub(r'\1', text)
+
+    # Remove special characters and punctuation
+    text = text.translate(_PUNCT_TABLE)
+
+    # Normalize whitespace
+    return ' '.join(text.split())
+
+
+@functools.lru_cache(maxsize=64)
+def _normalized_text(comment_text):
+    """Cleaned, lowercased comment text, computed once and shared by the classifiers"""
+    return _clean_text_formatting(comment_text).lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _is_direct_question_to_bot(comment_text):
+    """Very restrictive detection - only respond to DIRECT questions asking for cutoffs/help"""
+    text_lower = _normalized_text(comment_text)
+
+    # Must be a question (has question words or question mark)
+    if not _QUESTION_RE.search(text_lower):
+        return False
+
+    # Must explicitly mention cutoff/admission related terms
+    if not _CUTOFF_TERM_RE.search(text_lower):
+        return False
+
+    # Must mention specific branch or campus
+    if not _SPECIFIC_TERM_RE.search(text_lower):
+        return False
+
+    # Additional filters to avoid responding to casual mentions
+    # Don't respond if it's just sharing information (not asking)
+    if _SHARING_RE.search(text_lower) and not _DIRECT_ASK_RE.search(text_lower):
+        return False
+
+    # Must be a reasonably short comment (not a long discussion)
+    word_count = len(text_lower.split())
+    if word_count > 50:  # Too long, probably not a direct question
+        return False
+
+    return True
+
+
+# Query-type vocabulary for the _is_*_query classifiers: *_RE lists match as
+# substrings of the cleaned text, *_TOKENS sets match whole words
+_ADMISSION_RE = re.compile(_alternation((
+    'can i get', 'can i qualify', 'will i get', 'chances of getting',
+    'eligible for', 'admission in', 'qualify for', 'get admission',
+    'kya mil jayega', 'mil sakta hai', 'admission mil jayega'
+)))
+_ADMISSION_TOKENS = frozenset({
+    'cse', 'computer', 'science', 'cs', 'ece', 'electronics', 'communication',
+    'eee', 'electrical', 'mechanical', 'mech', 'chemical', 'chem', 'civil',
+    'manufacturing', 'manuf', 'mathematics', 'math', 'maths', 'computing',
+    'biology', 'bio', 'biological', 'physics', 'phy', 'chemistry', 'economics',
+    'eco', 'pharmacy', 'pharm', 'instrumentation', 'instru', 'mnc', 'eni',
+    'msc', 'm.sc', 'pilani', 'goa', 'hyderabad', 'hyd'
+})
+_COMPARISON_RE = re.compile(_alternation((
+    'compare', 'comparison', 'vs', 'versus', 'difference between',
+    'better', 'which is better', 'difference', 'choose between'
+)))
+_COMPARISON_BRANCH_TOKENS = frozenset({
+    'cse', 'computer', 'ece', 'electronics', 'eee', 'electrical',
+    'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
+    'mnc', 'math', 'mathematics', 'computing', 'eni', 'instrumentation',
+    'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy', 'eco'
+})
+_COMPARISON_CAMPUS_TOKENS = frozenset({'pilani', 'goa', 'hyderabad', 'hyd'})
+# Comparison wording that rules out the trend and chance classifiers
+_COMPARISON_EXCLUSION_RE = re.compile(_alternation((
+    'vs', 'versus', 'compare', 'comparison', 'difference between',
+    'better', 'which is better', 'choose between'
+)))
+_TREND_RE = re.compile(_alternation((
+    'trend', 'trends', 'previous year', 'last year', 'past years',
+    'history', 'historical', 'over years', 'year wise', 'yearly',
+    'cutoff trend', 'cutoff history', 'previous cutoff', 'past cutoff',
+    'how has', 'change over', 'annual', 'over time'
+)))
+_TREND_CONTEXT_RE = re.compile(_alternation((
+    'cutoff', 'cut-off', 'score', 'marks', 'cse', 'ece', 'mechanical',
+    'chemical', 'branch', 'admission', 'math', 'maths', 'eee', 'civil'
+)))
+_SUGGESTION_RE = re.compile(_alternation((
+    'suggest', 'suggestion', 'advice', 'recommend', 'what should i',
+    'help me choose', 'guide me', 'confused', 'dilemma', 'options',
+    'what to do', 'best option', 'which branch', 'which campus'
+)))
+_SUGGESTION_CONTEXT_RE = re.compile(_alternation((
+    'score', 'marks', 'got', 'branch', 'campus', 'college',
+    'admission', 'choose', 'select', 'pick'
+)))
+_CHANCE_RE = re.compile(_alternation((
+    'chance', 'chances', 'probability', 'likely', 'possibility',
+    'any chance', 'what are my chances', 'chances of getting',
+    'can i get', 'will i get', 'possible to get'
+)))
+_CHANCE_BRANCH_RE = re.compile(_alternation((
+    'cse', 'computer', 'ece', 'electronics', 'eee', 'electrical',
+    'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
+    'mnc', 'math', 'mathematics', 'computing', 'eni', 'instrumentation',
+    'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy'
+)))
+
+# Bare queries that get the generic cutoff help instead of a table
+_GENERIC_CUTOFF_QUERIES = frozenset({'cutoff', 'cut-off', 'cutoffs'})
+
+# A BITSAT score mentioned in a query (two or three digits)
+_SCORE_RE = re.compile(r'\b(\d{2,3})\b')
+
+# Campus (vibe, pros, cons) for cross-campus comparisons
+_CAMPUS_PROFILES = {
+    'pilani': (
+        'Original campus, traditional culture, extreme weather',
+        'Highest prestige, strong alumni network, established reputation',
+        'Harsh climate, conservative environment, highest competition'
+    ),
+    'goa': (
+        'Beach campus, relaxed atmosphere, pleasant weather',
+        'Best weather, chill vibe, good work-life balance',
+        'Fewer industry connections, party reputation, limited research'
+    ),
+    'hyderabad': (
+        'Modern campus, tech city advantages, growing reputation',
+        'Tech hub location, modern facilities, industry proximity',
+        'Newest campus, still building reputation, limited alumni network'
+    )
+}
+
+# Campus headers for cutoff tables
+_CAMPUS_INFO = {
+    'pilani': ('**PILANI CAMPUS**', 'OG campus vibes'),
+    'goa': ('**GOA CAMPUS**', 'Beach life + studies'),
+    'hyderabad': ('**HYDERABAD CAMPUS**', 'Tech city energy')
+}
+
+# Branch display names for chance analysis
+_BRANCH_NAMES = {
+    'cse': 'Computer Science', 'ece': 'Electronics & Communication',
+    'eee': 'Electrical & Electronics', 'mechanical': 'Mechanical',
+    'chemical': 'Chemical', 'civil': 'Civil', 'mnc': 'Math & Computing',
+    'eni': 'Electronics & Instrumentation', 'manufacturing': 'Manufacturing',
+    'pharmacy': 'Pharmacy', 'biology': 'M.Sc Biology', 'physics': 'M.Sc Physics',
+    'chemistry': 'M.Sc Chemistry', 'mathematics': 'M.Sc Mathematics', 'economics': 'M.Sc Economics'
+}
+
+# Cutoff table rows in display order: B.E. branches, then M.Sc, then pharmacy
+_CUTOFF_TABLE_BRANCHES = (
+    ('computer science', 'CSE'),
+    ('electronics and communication', 'ECE'),
+    ('electrical and electronics', 'EEE'),
+    ('mechanical', 'Mechanical'),
+    ('chemical', 'Chemical'),
+    ('civil', 'Civil'),
+    ('manufacturing', 'Manufacturing'),
+    ('mathematics and computing', 'Math & Computing'),
+    ('electronics and instrumentation', 'Instrumentation'),
+    ('biological sciences', 'Biology (M.Sc)'),
+    ('chemistry msc', 'Chemistry (M.Sc)'),
+    ('mathematics msc', 'Mathematics (M.Sc)'),
+    ('economics', 'Economics (M.Sc)'),
+    ('physics', 'Physics (M.Sc)'),
+    ('pharmacy', 'Pharmacy')
+)
+
+# Program type column of the all-branches cutoff table
+_BRANCH_PROGRAM_TYPES = {
+    'computer science': 'B.E.', 'electronics and communication': 'B.E.', 'electrical and electronics': 'B.E.',
+    'mechanical': 'B.E.', 'chemical': 'B.E.', 'civil': 'B.E.', 'manufacturing': 'B.E.',
+    'mathematics and computing': 'B.E.', 'electronics and instrumentation': 'B.E.',
+    'biological sciences': 'M.Sc', 'chemistry msc': 'M.Sc', 'mathematics msc': 'M.Sc',
+    'economics': 'M.Sc', 'physics': 'M.Sc', 'pharmacy': 'B.Pharm'
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _cutoff_table(specific_branch, specific_campus):
+    """Cutoff table section for a (branch, campus) query, cached since the data is static"""
+    parts = []
+
+    # Specific branch query
+    if specific_branch:
+        if specific_campus:
+            # Specific branch + campus - TABLE FORMAT
+            score = _CUTOFF_DATA[specific_campus].get(specific_branch, 'N/A')
+            campus_emoji, campus_desc = _CAMPUS_INFO[specific_campus]
+            parts.append(f"{campus_emoji}\n*{campus_desc}*\n\n")
+
+            parts.append("| Branch | Campus | Cutoff Score |\n")
+            parts.append("|--------|--------|-------------|\n")
+            parts.append(f"| {specific_branch.upper()} | {specific_campus.title()} | **{score}/390** |\n\n")
+        else:
+            # Specific branch, all campuses - TABLE FORMAT
+            parts.append(f"**{specific_branch.upper()} CUTOFFS ACROSS CAMPUSES:**\n\n")
+            parts.append("| Campus | Cutoff Score |\n")
+            parts.append("|--------|-------------|\n")
+
+            for campus in _CAMPUS_KEYS:
+                score = _CUTOFF_DATA[campus].get(specific_branch, 'N/A')
+                if score != 'N/A':
+                    parts.append(f"| {_CAMPUS_NAMES[campus]} | **{score}/390** |\n")
+            parts.append("\n")
+
+    # Specific campus query - TABLE FORMAT
+    elif specific_campus:
+        campus_emoji, campus_desc = _CAMPUS_INFO[specific_campus]
+        parts.append(f"{campus_emoji}\n*{campus_desc}*\n\n")
+
+        parts.append("| Branch | Cutoff Score |\n")
+        parts.append("|--------|-------------|\n")
+
+        campus_cutoffs = _CUTOFF_DATA[specific_campus]
+
+        for branch_key, display_name in _CUTOFF_TABLE_BRANCHES:
+            score = campus_cutoffs.get(branch_key)
+            if score is not None:
+                parts.append(f"| {display_name} | **{score}/390** |\n")
+
+        parts.append("\n")
+
+    # General query - show ALL branches from ALL campuses - CLEAN TABLE FORMAT
+    else:
+        parts.append("**BITSAT 2024-25 CUTOFFS - ALL BRANCHES**\n\n")
+
+        # Create a clean comprehensive table
+        parts.append("| Branch | Pilani | Goa | Hyderabad | Type |\n")
+        parts.append("|--------|--------|-----|-----------|------|\n")
+
+        pilani_get = _CUTOFF_DATA['pilani'].get
+        goa_get = _CUTOFF_DATA['goa'].get
+        hyd_get = _CUTOFF_DATA['hyderabad'].get
+
+        for branch_key, display_name in _CUTOFF_TABLE_BRANCHES:
+            pilani_score = pilani_get(branch_key, '-')
+            goa_score = goa_get(branch_key, '-')
+            hyd_score = hyd_get(branch_key, '-')
+
+            # Only show row if at least one campus has this branch
+            if pilani_score != '-' or goa_score != '-' or hyd_score != '-':
+                # Clean format without excessive bold
+                program_type = _BRANCH_PROGRAM_TYPES.get(branch_key, 'B.E.')
+
+                parts.append(f"| {display_name} | {pilani_score} | {goa_score} | {hyd_score} | {program_type} |\n")
+
+        parts.append("\n*All scores are out of 390*\n\n")
+
+    return "".join(parts)
+
+
+# Cutoff reply intros by query type, formatted with greeting/author/branch/campus
+_CUTOFF_INTROS_BRANCH_CAMPUS = (
+    "{greeting} {branch} at {campus}? Time for some brutal honesty",
+    "{greeting} {branch} {campus} cutoff? Prepare for emotional damage",
+    "{greeting} {campus} {branch} ka scene - reality check incoming",
+    "{greeting} {branch} for {campus}? Here's your dose of harsh truth",
+    "{greeting} {campus} {branch} numbers? Brace for impact",
+    "{greeting} {branch} at {campus}? Hold onto your dreams"
+)
+_CUTOFF_INTROS_BRANCH = (
+    "Arre {author}, {branch} cutoffs? Time to crush some dreams across campuses",
+    "Yo {author}! {branch} ka complete destruction across all campuses",
+    "Dekh {author}, {branch} cutoffs - campus wise reality slap",
+    "Bhai {author}, {branch} ke liye sabhi campus ka brutal data"
+)
+_CUTOFF_INTROS_CAMPUS = (
+    "Arre {author}, {campus} campus? Prepare for complete emotional devastation",
+    "Yo {author}! {campus} campus - all branches reality check",
+    "Dekh {author}, {campus} ka complete cutoff massacre",
+    "Bhai {author}, {campus} campus cutoffs - full destruction mode"
+)
+_CUTOFF_INTROS_GENERAL = (
+    "Arre {author}, complete BITSAT cutoff data? RIP your mental peace",
+    "Yo {author}! Full cutoff breakdown? Time for existential crisis",
+    "Dekh {author}, complete BITSAT cutoff apocalypse incoming",
+    "Bhai {author}, comprehensive cutoff data - prepare for trauma"
+)
+
+# Italic aside about max marks closing every cutoff reply
+_MAX_MARKS_QUIPS = (
+    "*Though max marks are 426, I don't think you're skilled enough to reach there, so 390 is the realistic ceiling for you*",
+    "*While the paper is out of 426, let's be honest - 390 is probably your upper limit anyway*",
+    "*Maximum possible is 426, but considering your preparation level, 390 seems more achievable*",
+    "*The exam goes up to 426 marks, but realistically speaking, 390 is where most mortals peak*",
+    "*Just so you know, 426 is the theoretical max, but 390 is the practical reality for people like us*"
+)
+
+# Admission verdict tables (score vs one cutoff, and one row per campus)
+_ADMISSION_TABLE_HEADER = (
+    "| Your Score | Required | Status | {delta} |\n"
+    "|------------|----------|--------|{rule}|\n"
+)
+_ADMISSION_TABLE_ROW = "| **{score}/390** | **{required}/390** | **{status}** | {delta} |\n\n"
+_ADMISSION_CAMPUS_HEADER = (
+    "| Campus | Required | Your Score | Status |\n"
+    "|--------|----------|------------|--------|\n"
+)
+_ADMISSION_CAMPUS_ROW = "| {campus} | **{required}/390** | **{score}/390** | {status} |\n"
+
+# Per-campus admission chance table
+_CHANCE_TABLE_HEADER = (
+    "| Campus | 2024 Cutoff | Your Score | Gap | Admission Chance | Verdict |\n"
+    "|--------|-------------|------------|-----|------------------|----------|\n"
+)
+_CHANCE_TABLE_ROW = "| {campus} | {cutoff} | {score} | {gap:+d} | {chance} | {verdict} |\n"
+
+_ADMISSION_ENDINGS = (
+    "\n\nRemember: Your worth isn't defined by cutoffs! Keep pushing!",
+    "\n\nFocus on what you can control - your preparation and attitude!",
+    "\n\nEvery rejection is a redirection to something better! Stay strong!",
+    "\n\nSuccess isn't about the college, it's about what you do there!"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _admission_body(user_score, specific_campus, specific_branch):
+    """Admission verdict below the reader's heading, cached per (score, campus, branch)"""
+    branch_name = specific_branch.upper() if specific_branch else ''
+    campus_name = _CAMPUS_DISPLAY[specific_campus] if specific_campus else ''
+
+    # Determine what to check
+    if specific_branch and specific_campus:
+        # Specific branch + campus
+        required_score = _CUTOFF_DATA[specific_campus][specific_branch]
+
+        if user_score >= required_score:
+            margin = user_score - required_score
+            parts = [f"**YES, you can get {branch_name} at {campus_name}!**\n\n"]
+            parts.append(_ADMISSION_TABLE_HEADER.format(delta="Margin", rule="--------"))
+            parts.append(_ADMISSION_TABLE_ROW.format(score=user_score, required=required_score, status="SAFE", delta=f"+{margin}"))
+            parts.append(f"**{campus_name} CAMPUS** - {branch_name}\n\n")
+            if margin >= 20:
+                parts.append("**EXCELLENT!** You're well above the cutoff! Time to celebrate!")
+            elif margin >= 10:
+                parts.append("**GOOD!** You're comfortably above the cutoff!")
+            else:
+                parts.append("**CLOSE CALL!** You're just above the cutoff. Fingers crossed!")
+        else:
+            deficit = required_score - user_score
+            parts = [f"**Sorry, {branch_name} at {campus_name} might be tough...**\n\n"]
+            parts.append(_ADMISSION_TABLE_HEADER.format(delta="Gap", rule="-----"))
+            parts.append(_ADMISSION_TABLE_ROW.format(score=user_score, required=required_score, status="SHORT", delta=f"-{deficit}"))
+            parts.append(f"**ALTERNATIVES:**\n")
+            parts.append(f"• Try other campuses for {branch_name}\n")
+            parts.append(f"• Consider other branches at {campus_name}\n")
+            parts.append(f"• Look into M.Sc programs (lower cutoffs)\n\n")
+            parts.append("Don't lose hope! There are always options!")
+
+    elif specific_branch:
+        # Specific branch, all campuses
+        parts = [_ADMISSION_CAMPUS_HEADER]
+
+        safe_campuses = []
+        risky_campuses = []
+
+        for campus in _CAMPUS_KEYS:
+            required = _CUTOFF_DATA[campus].get(specific_branch, None)
+            if required:
+                if user_score >= required:
+                    status = "SAFE"
+                    safe_campuses.append(_CAMPUS_DISPLAY[campus])
+                else:
+                    status = f"SHORT (-{required - user_score})"
+                    risky_campuses.append(_CAMPUS_DISPLAY[campus])
+                parts.append(_ADMISSION_CAMPUS_ROW.format(campus=_CAMPUS_NAMES[campus], required=required, score=user_score, status=status))
+
+        parts.append("\n")
+        if safe_campuses:
+            parts.append(f"**GOOD NEWS!** You can get {branch_name} at: {', '.join(safe_campuses)}\n")
+        if risky_campuses:
+            parts.append(f"**TOUGH LUCK** for: {', '.join(risky_campuses)}\n")
+
+    else:
+        # General admission chances
+        parts = ["**SAFE OPTIONS:**\n"]
+
+        # Entries up to idx are all within reach; show the 10 most competitive
+        idx = bisect.bisect_right(_CUTOFF_SCORES, user_score)
+        top_options = _CUTOFF_OPTION_LINES[max(0, idx - 10):idx][::-1]
+
+        if top_options:
+            parts.append("\n".join(top_options))
+            if idx > 10:
+                parts.append(f"\n... and {idx - 10} more options!")
+        else:
+            parts.append("Unfortunately, very limited options with this score. Consider M.Sc programs or other colleges.")
+
+    return "".join(parts)
+
+
+_SUGGESTION_ENDINGS = (
+    "\n\nRemember: Success is 10% college, 90% your effort!",
+    "\n\nYour journey matters more than your destination!",
+    "\n\nEvery BITS student has a success story - write yours!",
+    "\n\nThe best branch is the one that excites you every morning!"
+)
+
+# Suggestion roadmap per score band; bisect_right over the thresholds picks the
+# body, which is then formatted with the score and its ECE cutoff gaps
+_SUGGESTION_SCORE_THRESHOLDS = (230, 250, 270, 285, 300, 315, 330)
+_SUGGESTION_SCORE_BODIES = (
+    # Below 230
+    (
+        "**BELOW 230 - ALTERNATIVE STRATEGIES**\n\n"
+        "| Option | Probability | Package Range | Strategic Advice |\n"
+        "|--------|-------------|---------------|------------------|\n"
+        "| M.Sc Programs | 70% | ₹10-35L | Still possible, worth trying |\n"
+        "| Pharmacy | 60% | ₹8-25L | Specialized field, decent prospects |\n"
+        "| Other Colleges | 100% | ₹8-30L | VIT, SRM, Manipal - good alternatives |\n"
+        "| Drop Year | - | Future potential | Prepare better, try again |\n\n"
+        "**REALISTIC ASSESSMENT:**\n"
+        "• BITS reality: Might be challenging with current score\n"
+        "• M.Sc option: Still worth applying, cutoffs can vary\n"
+        "• Alternative colleges: VIT, SRM, Manipal offer good programs\n"
+        "• Drop year consideration: If BITS is your dream, prepare better\n"
+        "• Important reminder: Success depends more on effort than college\n"
+        "• Career truth: Many successful people didn't go to top colleges\n\n"
+    ),
+    # 230+
+    (
+        "**CHALLENGING SCORE - M.Sc PROGRAMS SHINE**\n\n"
+        "| Program | Campus | Probability | Package Range | Career Trajectory |\n"
+        "|---------|--------|-------------|---------------|-------------------|\n"
+        "| M.Sc Mathematics | All | 100% | ₹15-50L | Finance, data science, quant roles |\n"
+        "| M.Sc Physics | All | 100% | ₹14-45L | Research, tech companies, academia |\n"
+        "| M.Sc Chemistry | All | 100% | ₹13-40L | Pharma, research, chemical industry |\n"
+        "| M.Sc Biology | All | 100% | ₹12-38L | Biotech, pharma, research |\n"
+        "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, banking |\n"
+        "| Pharmacy | Pilani/Hyd | 90% | ₹10-30L | Pharma industry, regulatory affairs |\n\n"
+        "**M.Sc PROGRAM INSIGHTS:**\n"
+        "• Hidden truth: M.Sc students often outperform B.E. in placements\n"
+        "• Mathematics advantage: Quant roles in finance (₹20-50L packages)\n"
+        "• Physics pathway: Research → tech companies → high packages\n"
+        "• Chemistry prospects: Pharma R&D, process development\n"
+        "• Biology future: Biotech boom, pharmaceutical research\n"
+        "• Economics scope: Policy research, economic consulting\n"
+        "• Dual degree option: M.Sc → M.E. (5-year integrated program)\n\n"
+    ),
+    # 250+
+    (
+        "**MODERATE SCORE - STRATEGIC CHOICES NEEDED**\n\n"
+        "| Branch | Campus | Probability | Package Range | Career Path |\n"
+        "|--------|--------|-------------|---------------|-------------|\n"
+        "| Mechanical | All | 90% | ₹14-40L | Manufacturing, automotive, aerospace |\n"
+        "| Chemical | All | 85% | ₹15-42L | Process industries, pharma, oil&gas |\n"
+        "| Civil | Pilani/Hyd | 95% | ₹12-35L | Infrastructure, construction, govt |\n"
+        "| M.Sc Math | All | 100% | ₹15-50L | Finance, data science, research |\n"
+        "| M.Sc Physics | All | 100% | ₹14-45L | Research, tech, academia |\n"
+        "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, banking |\n\n"
+        "**DETAILED GUIDANCE:**\n"
+        "• Engineering reality: Core branches offer solid, stable careers\n"
+        "• Mechanical advantage: Broadest scope, can work in any industry\n"
+        "• Chemical prospects: Specialized knowledge, good in process industries\n"
+        "• M.Sc surprise: Often better placement outcomes than expected\n"
+        "• Math M.Sc secret: Finance sector loves math graduates (₹15-50L range)\n"
+        "• Physics M.Sc path: Research → PhD → Academia or tech industry\n"
+        "• Economics M.Sc: Policy research, think tanks, consulting firms\n\n"
+    ),
+    # 270+
+    (
+        "**DECENT SCORE - CORE ENGINEERING TERRITORY**\n\n"
+        "| Branch | Campus | Probability | Package Range | Industry Demand |\n"
+        "|--------|--------|-------------|---------------|----------------|\n"
+        "| EEE | All | 100% | ₹16-45L | Power sector, government jobs |\n"
+        "| Mechanical | All | 95% | ₹14-40L | Most versatile, evergreen demand |\n"
+        "| ENI | All | 100% | ₹18-40L | Process control, automation |\n"
+        "| Chemical | Goa/Hyd | 85% | ₹15-42L | Process industries, research |\n"
+        "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, analytics |\n\n"
+        "**STRATEGIC INSIGHTS:**\n"
+        "• Reality check: Core engineering branches are undervalued but solid\n"
+        "• EEE advantage: Government sector opportunities, PSU placements\n"
+        "• Mechanical truth: Most versatile branch, opportunities everywhere\n"
+        "• Chemical prospects: Specialized roles, higher packages in specific sectors\n"
+        "• M.Sc option: Economics is excellent for policy/consulting careers\n"
+        "• Long-term view: Core branches often have better job security\n\n"
+    ),
+    # 285+
+    (
+        "**SOLID SCORE - GOOD ENGINEERING OPTIONS**\n\n"
+        "**ADMISSION ANALYSIS BY BRANCH**\n\n"
+        "| Branch | Campus | Cutoff 2024 | Gap | Admission Chance | Recommendation |\n"
+        "|--------|--------|-------------|-----|------------------|----------------|\n"
+        "| ECE | Goa | 287 | +{ece_goa_gap} | 95% | Excellent choice |\n"
+        "| ECE | Hyderabad | 284 | +{ece_hyd_gap} | 98% | Very safe option |\n"
+        "| ECE | Pilani | 314 | {ece_pilani_gap} | 70% | Stretch but possible |\n"
+        "| EEE | All campuses | 292/278/275 | Positive | 100% | Guaranteed admission |\n"
+        "| ENI | All campuses | 282/270/270 | Positive | 100% | Emerging field |\n"
+        "| MnC | Goa/Hyd | 295/293 | {{user_score-295}} | 85% | High-reward option |\n\n"
+        "**CAREER PROSPECTS & PACKAGES**\n\n"
+        "| Branch | Industry Focus | Avg Package | Job Security | Growth Potential |\n"
+        "|--------|----------------|-------------|--------------|------------------|\n"
+        "| ECE | Hardware+Software | ₹24L | High | Excellent |\n"
+        "| EEE | Power & Electronics | ₹18L | Very High | Good |\n"
+        "| ENI | Automation & Control | ₹18L | High | Very Good |\n"
+        "| MnC | Finance+Tech | ₹26L | High | Excellent |\n\n"
+        "**STRATEGIC RECOMMENDATIONS:**\n"
+        "• **Primary Target:** ECE Goa/Hyd (high probability, excellent prospects)\n"
+        "• **Stretch Goal:** ECE Pilani (you're 29 points below, but trends vary)\n"
+        "• **Safe Backup:** EEE at any campus (guaranteed, underrated branch)\n"
+        "• **Unique Option:** ENI (instrumentation + IoT focus, growing demand)\n"
+        "• **High Reward:** MnC if math is your strength (finance sector premium)\n\n"
+    ),
+    # 300+
+    (
+        "**GREAT SCORE - MULTIPLE EXCELLENT OPTIONS**\n\n"
+        "**ADMISSION PROBABILITY ANALYSIS**\n\n"
+        "Branch | Campus | Cutoff 2024 | Your Score | Admission Chance | Risk Level\n"
+        "---|---|---|---|---|---\n"
+        "CSE | Goa | 301 | {score} | 95% | Very Low\n"
+        "CSE | Hyderabad | 298 | {score} | 98% | Very Low\n"
+        "CSE | Pilani | 327 | {score} | 60% | Moderate\n"
+        "ECE | Pilani | 314 | {score} | 100% | None\n"
+        "ECE | Goa/Hyd | 287/284 | {score} | 100% | None\n"
+        "MnC | Any | 318/295/293 | {score} | 100% | None\n\n"
+        "**PLACEMENT & CAREER PROSPECTS**\n\n"
+        "| Branch | Avg Package | Median | Highest | Top Companies | Career Growth |\n"
+        "|--------|-------------|--------|---------|---------------|---------------|\n"
+        "| CSE | ₹28L | ₹22L | ₹65L | Google, Microsoft, Amazon | Excellent |\n"
+        "| ECE | ₹24L | ₹18L | ₹55L | Intel, Qualcomm, Samsung | Very Good |\n"
+        "| MnC | ₹26L | ₹20L | ₹60L | Goldman Sachs, JP Morgan | Excellent |\n\n"
+        "**STRATEGIC RECOMMENDATIONS:**\n"
+        "• **Primary Strategy:** Apply CSE at all campuses, ECE Pilani as guaranteed backup\n"
+        "• **Pilani CSE:** Achievable but competitive - you're 27 points above cutoff\n"
+        "• **Safe Choices:** CSE Goa/Hyd (very high probability), ECE Pilani (guaranteed)\n"
+        "• **Hidden Gem:** MnC if you're strong in math - finance sector loves this combo\n"
+        "• **Campus Decision:** Pilani (prestige) vs Goa (lifestyle) vs Hyderabad (modern)\n\n"
+    ),
+    # 315+
+    (
+        "**EXCELLENT SCORE - TOP 1% CATEGORY**\n\n"
+        "| Branch | Campus | Probability | Package Range | Strategy |\n"
+        "|--------|--------|-------------|---------------|----------|\n"
+        "| CSE | Pilani | 85% | ₹25-65L | Stretch goal, worth the risk |\n"
+        "| CSE | Goa/Hyd | 100% | ₹24-60L | Very safe, excellent choice |\n"
+        "| ECE | Pilani | 100% | ₹22-55L | Safe backup, great prospects |\n"
+        "| MnC | Any | 100% | ₹24-60L | Unique path, finance opportunities |\n\n"
+        "**RECOMMENDED STRATEGY:**\n"
+        "• First preference: CSE at all campuses (Pilani is achievable)\n"
+        "• Safe backup: ECE Pilani (guaranteed admission)\n"
+        "• Consider: MnC if interested in finance+tech combination\n"
+        "• Campus tip: Goa offers best work-life balance\n\n"
+    ),
+    # 330+
+    (
+        "**EXCEPTIONAL SCORE - TOP 0.5% TERRITORY**\n\n"
+        "| Branch | Campus | Probability | Package Range | Why Choose |\n"
+        "|--------|--------|-------------|---------------|------------|\n"
+        "| CSE | Pilani | 100% | ₹25-65L | Ultimate prestige, best alumni network |\n"
+        "| CSE | Goa/Hyd | 100% | ₹24-60L | Excellent academics, better lifestyle |\n"
+        "| ECE | Pilani | 100% | ₹22-55L | Hardware+software, VLSI opportunities |\n"
+        "| MnC | Any | 100% | ₹24-60L | Finance+tech combo, quant roles |\n\n"
+        "**STRATEGIC ADVICE:**\n"
+        "• Primary choice: Pilani CSE (if you want maximum prestige)\n"
+        "• Lifestyle choice: Goa CSE (beach campus, relaxed environment)\n"
+        "• Unique option: MnC (emerging field, finance sector opportunities)\n"
+        "• Reality check: You can literally choose based on campus preference\n\n"
+    )
+)
+
+# No-score suggestion replies: branch guide, campus guide, and usage help
+_SUGGESTION_BRANCH_GUIDE = (
+    "**High Demand (Competitive):**\n"
+    "• CSE: Software, tech companies, highest packages\n"
+    "• ECE: Hardware + software, versatile\n\n"
+    "**Core Engineering (Stable):**\n"
+    "• Mechanical: Broad applications, evergreen\n"
+    "• EEE: Power sector, government jobs\n"
+    "• Chemical: Process industries, good packages\n\n"
+    "**M.Sc Programs (Underrated):**\n"
+    "• Math/Physics: Research, academia, finance\n"
+    "• Economics: Policy, consulting, analytics\n\n"
+    "**Golden Rule:** Choose based on interest, not just cutoffs!"
+)
+
+_SUGGESTION_CAMPUS_GUIDE = (
+    "**PILANI (The OG):**\n"
+    "• Prestige factor, alumni network\n"
+    "• Traditional campus culture\n"
+    "• Harsh weather (extreme hot/cold)\n\n"
+    "**GOA (The Chill):**\n"
+    "• Best weather, beach vibes\n"
+    "• Relaxed atmosphere\n"
+    "• Great for work-life balance\n\n"
+    "**HYDERABAD (The Modern):**\n"
+    "• Newest campus, modern facilities\n"
+    "• Tech city advantages\n"
+    "• Growing industry connections\n\n"
+    "**Truth:** All campuses have excellent academics!"
+)
+
+_SUGGESTION_HELP = (
+    "**Score-based suggestions:**\n"
+    "• *'I got 285 marks, suggest branches'*\n\n"
+    "**Branch selection:**\n"
+    "• *'Help me choose branch'*\n\n"
+    "**Campus selection:**\n"
+    "• *'Which campus should I choose'*\n\n"
+    "**Pro Tip:** Mention your score for personalized advice!"
+)
+
+_TREND_HUMOR_LINES = (
+    "Remember: Past performance doesn't guarantee future results!",
+    "Cutoffs go up faster than your motivation during prep!",
+    "Plot twist: Work hard enough and trends won't matter!",
+    "These trends are scarier than horror movies!"
+)
+
+# Historical cutoffs (Official BITS Data - 2022-2024 confirmed), newest year first
+_TREND_YEARS = ('2024', '2023', '2022')
+_TRENDS = {
+    ('cse', 'pilani'): (327, 331, 320),
+    ('cse', 'goa'): (301, 295, 286),
+    ('cse', 'hyderabad'): (298, 284, 279),
+    ('ece', 'pilani'): (314, 296, 279),
+    ('ece', 'goa'): (287, 267, 256),
+    ('ece', 'hyderabad'): (284, 265, 252),
+    ('eee', 'pilani'): (292, 272, 258),
+    ('eee', 'goa'): (278, 252, 237),
+    ('eee', 'hyderabad'): (275, 251, 230),
+    ('mechanical', 'pilani'): (266, 244, 223),
+    ('mechanical', 'goa'): (254, 223, 191),
+    ('mechanical', 'hyderabad'): (251, 218, 182),
+    ('chemical', 'pilani'): (247, 224, 191),
+    ('chemical', 'goa'): (239, 209, 165),
+    ('chemical', 'hyderabad'): (238, 207, 162),
+    ('civil', 'pilani'): (238, 213, 167),
+    ('civil', 'hyderabad'): (235, 204, 158),
+    ('mnc', 'pilani'): (318, None, None),  # MnC added in 2024
+    ('mnc', 'goa'): (295, None, None),
+    ('mnc', 'hyderabad'): (293, None, None),
+    ('eni', 'pilani'): (282, 266, 249),
+    ('eni', 'goa'): (270, 244, 224),
+    ('eni', 'hyderabad'): (270, 244, 222),
+    ('manufacturing', 'pilani'): (243, 220, 184),
+    ('pharmacy', 'pilani'): (165, 153, 125),
+    ('pharmacy', 'hyderabad'): (161, 135, 109),
+    ('biology', 'pilani'): (236, 212, 171),
+    ('biology', 'goa'): (234, 204, 164),
+    ('biology', 'hyderabad'): (234, 204, 158),
+    ('physics', 'pilani'): (254, 235, 214),
+    ('physics', 'goa'): (248, 222, 188),
+    ('physics', 'hyderabad'): (245, 219, 173),
+    ('chemistry', 'pilani'): (241, 213, 168),
+    ('chemistry', 'goa'): (236, 205, 163),
+    ('chemistry', 'hyderabad'): (235, 205, 160),
+    ('mathematics', 'pilani'): (256, 236, 214),
+    ('mathematics', 'goa'): (249, 221, 187),
+    ('mathematics', 'hyderabad'): (247, 219, 177),
+    ('economics', 'pilani'): (271, 257, 247),
+    ('economics', 'goa'): (263, 239, 230),
+    ('economics', 'hyderabad'): (261, 236, 220)
+}
+_TREND_BRANCHES = frozenset(branch for branch, _ in _TRENDS)
+
+
+@functools.lru_cache(maxsize=128)
+def _trend_analysis(detected_branch, detected_campus):
+    """Trend tables for one campus, or a summary across campuses when detected_campus is None (static, so cached)"""
+    if detected_campus is None:
+        parts = [f"**ALL CAMPUSES - {detected_branch.upper()}:**\n\n"]
+        for campus in _CAMPUS_KEYS:
+            cutoffs = _TRENDS.get((detected_branch, campus))
+            if cutoffs:
+                current, cutoff_2023, cutoff_2022 = cutoffs
+                if cutoff_2022 is not None:
+                    old = cutoff_2022
+                    change = current - old
+                    parts.append(f"**{_CAMPUS_DISPLAY[campus]}:** {old} → {current} ({change:+d} in 2 years)\n")
+                elif cutoff_2023 is not None:
+                    old = cutoff_2023
+                    change = current - old
+                    parts.append(f"**{_CAMPUS_DISPLAY[campus]}:** {old} → {current} ({change:+d} in 1 year)\n")
+                else:
+                    parts.append(f"**{_CAMPUS_DISPLAY[campus]}:** {current} (2024 data)\n")
+
+        parts.append(f"\n**Overall Pattern:** Most branches rising 3-15 points per year\n")
+        return "".join(parts)
+
+    cutoffs = _TRENDS[(detected_branch, detected_campus)]
+
+    # First show the last 3 years cutoffs clearly
+    parts = ["**RECENT CUTOFFS (Last 3 Years)**\n\n"]
+    parts.append("Year | Cutoff Score | Status\n")
+    parts.append("---|---|---\n")
+
+    for year, cutoff in zip(_TREND_YEARS, cutoffs):
+        if cutoff is not None:
+            status = "Latest" if year == _TREND_YEARS[0] else "Previous"
+            parts.append(f"{year} | **{cutoff}** | {status}\n")
+
+    # Then show detailed trend analysis
+    parts.append(f"\n**DETAILED TREND ANALYSIS**\n\n")
+    parts.append("Year | Cutoff | Year-on-Year Change | Trend Pattern\n")
+    parts.append("---|---|---|---\n")
+
+    for i, year in enumerate(_TREND_YEARS):
+        cutoff = cutoffs[i]
+        if cutoff is not None:
+            if i < len(_TREND_YEARS) - 1:
+                prev_cutoff = cutoffs[i+1]
+                if prev_cutoff is not None:
+                    change = cutoff - prev_cutoff
+                    change_str = f"{change:+d}"
+                    if change > 15:
+                        trend_desc = "Sharp Rise"
+                    elif change > 5:
+                        trend_desc = "Rising"
+                    elif change > -5:
+                        trend_desc = "Stable"
+                    elif change > -15:
+                        trend_desc = "Falling"
+                    else:
+                        trend_desc = "Sharp Fall"
+                else:
+                    change_str = "-"
+                    trend_desc = "No data"
+            else:
+                change_str = "-"
+                trend_desc = "Baseline year"
+
+            parts.append(f"{year} | {cutoff} | {change_str} | {trend_desc}\n")
+
+    # Calculate trends and predictions (using available data)
+    latest, cutoff_2023, cutoff_2022 = cutoffs
+    if cutoff_2022 is not None:
+        two_year_change = latest - cutoff_2022
+        avg_change = two_year_change / 2
+        parts.append(f"\n**2-Year Trend (2022-2024):** {two_year_change:+d} points ({avg_change:.1f}/year average)\n")
+
+        # 2025 Prediction based on recent trend
+        predicted_2025 = latest + int(avg_change)
+        parts.append(f"**2025 Prediction:** ~{predicted_2025} (±5 points)\n")
+    elif cutoff_2023 is not None:
+        one_year_change = latest - cutoff_2023
+        parts.append(f"\n**1-Year Change (2023-2024):** {one_year_change:+d} points\n")
+
+        # Conservative prediction
+        predicted_2025 = latest + one_year_change
+        parts.append(f"**2025 Prediction:** ~{predicted_2025} (±7 points)\n")
+
+    return "".join(parts)
+
+
+# Closing one-liners per reply category
+_HUMOR_BANK = {
+    'cutoff_ending': (
+        "Numbers don't define you, but they sure love to humble you daily.",
+        "Fun fact: Every BITS topper was once googling 'backup colleges' at 3 AM.",
+        "These cutoffs hit harder than reality after JEE results.",
+        "Cutoffs are like your ex - they keep rising when you least expect it.",
+        "Remember when 300 seemed impossible? Now it's barely enough for Civil.",
+        "BITSAT cutoffs: Making students question their life choices since 1964.",
+        "Plot twist: The real treasure was the anxiety we gained along the way.",
+        "Cutoffs rise faster than petrol prices and your parents' expectations."
+    ),
+    'comparison_ending': (
+        "Choose wisely - your future therapist will want to know why.",
+        "Both branches are great, but one will make you cry less during exams.",
+        "Pro tip: The branch doesn't matter if you're gonna bunk classes anyway.",
+        "Either way, you'll end up coding for a living. Welcome to reality.",
+        "Plot twist: Your branch choice matters less than your WiFi speed.",
+        "Remember: Every branch leads to the same destination - corporate slavery.",
+        "Fun fact: 90% of BITS students end up in IT regardless of branch.",
+        "Choose based on passion, not package. (Just kidding, choose package.)"
+    ),
+    'trend_ending': (
+        "Past trends are like weather forecasts - mostly wrong but oddly specific.",
+        "These trends change faster than your study schedule during exams.",
+        "Cutoff trends: The only graph that always goes up (unlike your marks).",
+        "Moral of the story: Start preparing yesterday, panic today.",
+        "Trends show cutoffs rising, but your motivation keeps falling.",
+        "Reality check: By the time you analyze trends, cutoffs have already moved.",
+        "These numbers are more unpredictable than your mood during prep.",
+        "Cutoff trends: Making students lose sleep since the dawn of time."
+    ),
+    'suggestion_ending': (
+        "Success is 10% college, 90% surviving the mess food.",
+        "Your branch matters less than your ability to handle all-nighters.",
+        "Every BITS student has a story - most involve crying in the library.",
+        "The best branch is the one where you can still maintain your sanity.",
+        "Plot twist: You'll forget your branch name after the first semester.",
+        "Reality check: All branches lead to the same placement companies.",
+        "Remember: BITS changes you, not the other way around.",
+        "Fun fact: Your branch choice will be irrelevant in 5 years anyway."
+    ),
+    'admission_ending': (
+        "Admission chances are like the weather - unpredictable and disappointing.",
+        "Your score is decent, but BITSAT cutoffs have trust issues.",
+        "Remember: Hope for the best, prepare for disappointment.",
+        "Admission probability: Somewhere between 'maybe' and 'start praying'.",
+        "Your chances look good, but so did your JEE prep schedule.",
+        "Plot twist: Sometimes miracles happen, sometimes they don't.",
+        "Keep calm and have backup plans. Lots of backup plans.",
+        "Admission is like love - you never know until you try."
+    )
+}
+
+_DEFAULT_HUMOR = ("Keep grinding, the struggle is real.",)
+
+# Greeting openers, filled with the author's name
+_GREETING_TEMPLATES = (
+    "Arre {}",
+    "Dekh {}",
+    "Bhai {}",
+    "Listen {}",
+    "Alright {}",
+    "Yaar {}",
+    "Buddy {}",
+    "Dude {}",
+    "Mate {}",
+    "Boss {}",
+    "Champ {}",
+    "Kiddo {}"
+)
+
+# Fallback reply patterns for _create_unique_response - no emojis, more natural
+_UNIQUE_PATTERNS = (
+    # Pattern 1: Direct address with dark motivation
+    "{starter} {author}, {vibe} {motivation} but remember - {wisdom}. {ending_cap}.",
+
+    # Pattern 2: Comment-specific with wisdom
+    "Yo {author}! {vibe} this is just {motivation}. Here's the thing - {wisdom}. {ending_cap}.",
+
+    # Pattern 3: Hinglish mix with motivation
+    "{starter}, {vibe} life threw you this curveball? {motivation_cap} hai yaar. But {wisdom} - {ending}.",
+
+    # Pattern 4: Cool philosophical
+    "Dekh {author}, {vibe} {motivation} is happening. Real talk - {wisdom}. Time to {ending}.",
+
+    # Pattern 5: Sarcastic motivation
+    "{starter} {author}, {motivation}? {vibe} perfect timing. Remember: {wisdom}. Now {ending}."
+)
+# The same plus patterns quoting a word from the comment
+_UNIQUE_PATTERNS_WITH_WORD = _UNIQUE_PATTERNS + (
+    "{starter} {author}, {vibe} {word} is giving you {motivation}? Plot twist: {wisdom}. {ending_cap}.",
+    "Yo {author}! {word} se {motivation}? {vibe} {wisdom} - {ending}.",
+    "{starter}, {word} and {motivation} - {vibe} classic combo. But {wisdom}, so {ending}."
+)
+
+# Static !help reply (it does not use the author)
+_HELP_RESPONSE = (
+    "**BITSAT Bot Help Guide**\n\n"
+
+    "## **HOW TO USE THE BOT**\n\n"
+    "**The bot responds ONLY to:**\n"
+    "1. **Commands starting with `!`** (e.g., `!cutoff cse`)\n"
+    "2. **Direct mentions** (e.g., `@No_Attendance_Bot what's the cutoff?`)\n"
+    "3. **Replies to bot comments**\n"
+    "4. **Direct questions** asking for specific cutoff/admission info\n\n"
+
+    "## **AVAILABLE FEATURES**\n\n"
+    "| Feature | Command/Query | Example |\n"
+    "|---------|---------------|----------|\n"
+    "| **Cutoff Queries** | `!cutoff [branch] [campus]` | `!cutoff cse pilani` |\n"
+    "| | Direct question | `What's the CSE cutoff for Pilani?` |\n"
+    "| **Branch Comparisons** | `!compare [branch1] vs [branch2]` | `!compare cse vs ece` |\n"
+    "| **Cutoff Trends** | `!trends [branch] [campus]` | `!trends cse pilani` |\n"
+    "| **Smart Suggestions** | `!suggest [score]` | `!suggest 285` |\n"
+    "| **Admission Queries** | Direct question | `Can I get CSE with 310 marks?` |\n"
+    "| **Help** | `!help` | `!help` |\n\n"
+
+    "## **SUPPORTED BRANCHES**\n\n"
+    "| Category | Branches |\n"
+    "|----------|----------|\n"
+    "| **Engineering** | CSE, ECE, EEE, Mechanical, Chemical, Civil, MnC, ENI, Manufacturing |\n"
+    "| **M.Sc Programs** | Mathematics, Physics, Chemistry, Biology, Economics |\n"
+    "| **Other** | Pharmacy |\n\n"
+
+    "## **SUPPORTED CAMPUSES**\n\n"
+    "| Campus | Location | Specialties |\n"
+    "|--------|----------|-------------|\n"
+    "| **Pilani** | Rajasthan | Original campus, highest cutoffs |\n"
+    "| **Goa** | Goa | Beach campus, moderate cutoffs |\n"
+    "| **Hyderabad** | Telangana | Modern campus, growing reputation |\n\n"
+
+    "## **DATA ACCURACY**\n\n"
+    "| Data Type | Source | Years |\n"
+    "|-----------|--------|-------|\n"
+    "| **Cutoffs** | Official BITS website | 2024-25 |\n"
+    "| **Trends** | Historical BITS data | 2022-2024 |\n"
+    "| **Placements** | Industry reports | Recent data |\n"
+    "| **Predictions** | Statistical analysis | 2025 forecast |\n\n"
+
+    "## **QUICK EXAMPLES**\n\n"
+    "| Query Type | Example Input |\n"
+    "|------------|---------------|\n"
+    "| Command | `!cutoff cse pilani` |\n"
+    "| Direct question | `What's the ECE cutoff for Goa?` |\n"
+    "| Mention bot | `@No_Attendance_Bot help with cutoffs` |\n"
+    "| Comparison | `!compare cse vs ece` |\n"
+    "| Trends | `!trends mechanical` |\n"
+    "| Suggestions | `!suggest 295` |\n"
+    "| Admission check | `Can I get ECE with 285 marks?` |\n\n"
+
+    "**Important:** Bot only responds to explicit commands (!), mentions, replies, or direct questions. It won't respond to casual mentions of 'cutoff' in discussions.\n\n"
+    "---\n\n"
+    "**NEW: DM CHATBOT FEATURE**\n\n"
+    "Send me a DM starting with 'hi' to activate chatbot mode!\n"
+    "I'll chat with you using funny, sassy responses with a bit of Hinglish.\n"
+    "Perfect for stress relief during BITSAT prep!\n\n"
+    "---\n"
+    "*Created by [u/Difficult-Dig7627](https://www.reddit.com/user/Difficult-Dig7627/) for r/bitsatards*"
+)
+
+# DM chatbot topic keywords (substrings of the lowercased message), tried in this order
+_DM_GREETING_RE = re.compile(_alternation(('hi', 'hello', 'hey', 'namaste', 'sup')))
+_DM_COLLEGE_RE = re.compile(_alternation(('bitsat', 'cutoff', 'admission', 'college', 'bits', 'score')))
+_DM_STRESS_RE = re.compile(_alternation(('stress', 'worried', 'anxious', 'scared', 'nervous', 'tension')))
+_DM_HELP_RE = re.compile(_alternation(('help', 'advice', 'guidance', 'support', 'motivate')))
+
 class BITSATBot:
     def __init__(self):
         """Initialize the BITSAT Reddit Bot"""
         self.reddit = None
         self.subreddit = None
-        self.processed_comments = set()
+        self._username = None  # Bot's own account name, fetched once per authenticate()
+        self._ist = pytz.timezone('Asia/Kolkata')  # Active hours are defined in IST
+        self._active = False  # Last active-hours answer, valid until the monotonic time below
+        self._active_until = 0.0
+        self.processed_comments = collections.OrderedDict()  # Comment ids replied to, oldest first
+        self._backoff = _BACKOFF_INITIAL  # Next rate-limit wait when Reddit sends no Retry-After
+        self._reconnect_delay = _RECONNECT_DELAY_INITIAL  # Next wait before re-authenticating after an error
+        self._thread_flags_cache = collections.OrderedDict()  # Submission id -> (checked at, locked, archived), oldest first
+        self._reply_rate = _REPLY_RATE_INITIAL  # Reply token bucket: refill rate (replies/second),
+        self._reply_tokens = 1.0                # tokens on hand (capacity 1, so no bursts),
+        self._reply_last = time.monotonic()     # and when they were last topped up
         
         # Dynamic response components for generating unique responses
         self.dark_starters = [
@@ -96,7 +1560,7 @@ class BITSATBot:
             missing_vars = [var for var in required_vars if not os.getenv(var)]
 
             if missing_vars:
-                logger.error(f"Missing environment variables: {missing_vars}")
+                logger.error("Missing environment variables: %s", missing_vars)
                 return False
 
             logger.info("Creating Reddit instance...")
@@ -111,213 +1575,153 @@ class BITSATBot:
             # Test authentication
             logger.info("Testing authentication...")
             user = self.reddit.user.me()
-            logger.info(f"Authenticated as: {user}")
+            self._username = user.name
+            logger.info("Authenticated as: %s", user)
 
             # Test subreddit access
             logger.info("Testing subreddit access...")
             self.subreddit = self.reddit.subreddit('bitsatards')
-            logger.info(f"Connected to r/{self.subreddit.display_name}")
+            logger.info("Connected to r/%s", self.subreddit.display_name)
 
             return True
 
         except Exception as e:
-            error_msg = str(e).lower()
-            if "403" in error_msg or "forbidden" in error_msg:
-                logger.error("403 FORBIDDEN - Possible causes:")
-                logger.error("   • Wrong username/password")
-                logger.error("   • Account suspended/banned")
-                logger.error("   • Two-factor authentication enabled")
-                logger.error("   • Rate limited")
-            elif "401" in error_msg or "unauthorized" in error_msg:
+            status = _error_status(e)
+            if status == 403:
+                logger.error("%s\n   Error: %s", _AUTH_FORBIDDEN_CAUSES, e)
+            elif status == 401:
                 logger.error("401 UNAUTHORIZED - Check client_id/client_secret")
             else:
-                logger.error(f"Authentication failed: {e}")
+                logger.error("Authentication failed: %s", e)
 
             logger.error("Failed to authenticate. Please check your credentials.")
             return False
     
     def _is_active_hours(self) -> bool:
         """Check if bot should be active (9 AM to 1 AM IST)"""
+        # The answer only changes at 1 AM / 9 AM, so reuse it until the next boundary
+        if time.monotonic() < self._active_until:
+            return self._active
+
         # Get current time in IST (Indian Standard Time)
-        ist = pytz.timezone('Asia/Kolkata')
-        now_ist = datetime.now(ist)
+        now_ist = datetime.now(self._ist)
         current_hour = now_ist.hour
-        current_time = now_ist.strftime("%H:%M IST")
 
         # Active from 9 AM (09:00) to 1 AM (01:00) next day IST
         # Active hours: 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 0
         # Inactive hours: 1, 2, 3, 4, 5, 6, 7, 8 (1 AM to 9 AM IST)
-        if 1 <= current_hour <= 8:
-            logger.debug(f"Inactive hours detected: {current_time} (hour {current_hour})")
+        self._active = not 1 <= current_hour <= 8
+        next_boundary = now_ist.replace(hour=1 if self._active else 9, minute=0, second=0, microsecond=0)
+        if next_boundary <= now_ist:
+            next_boundary += timedelta(days=1)
+        self._active_until = time.monotonic() + (next_boundary - now_ist).total_seconds()
+
+        if not self._active:
+            logger.debug("Inactive hours detected: %02d:%02d IST (hour %s)", current_hour, now_ist.minute, current_hour)
             return False  # Inactive from 1 AM to 8:59 AM IST
 
-        logger.debug(f"Active hours: {current_time} (hour {current_hour})")
+        logger.debug("Active hours: %02d:%02d IST (hour %s)", current_hour, now_ist.minute, current_hour)
         return True  # Active from 9 AM to 12:59 AM IST
 
     def _can_reply_to_comment(self, comment) -> bool:
         """Check if we can reply to this comment (not locked/archived)"""
         try:
-            # Refresh comment to get latest status
-            comment.refresh()
-
             # Check if comment is deleted/removed
             if comment.author is None:
-                logger.debug(f"Comment {comment.id} author is None (deleted/removed)")
+                logger.debug("Comment %s author is None (deleted/removed)", comment.id)
                 return False
 
             # Check if comment thread is locked
             if hasattr(comment, 'locked') and comment.locked:
-                logger.debug(f"Comment {comment.id} thread is locked")
+                logger.debug("Comment %s thread is locked", comment.id)
                 return False
 
             # Check if comment is archived
             if hasattr(comment, 'archived') and comment.archived:
-                logger.debug(f"Comment {comment.id} is archived")
+                logger.debug("Comment %s is archived", comment.id)
                 return False
 
             # Check submission status
-            submission = comment.submission
-            if hasattr(submission, 'locked') and submission.locked:
-                logger.debug(f"Submission {submission.id} is locked")
+            locked, archived = self._thread_flags(comment)
+            if locked:
+                logger.debug("Submission %s is locked", comment.link_id)
                 return False
 
-            if hasattr(submission, 'archived') and submission.archived:
-                logger.debug(f"Submission {submission.id} is archived")
+            if archived:
+                logger.debug("Submission %s is archived", comment.link_id)
                 return False
 
             return True
 
         except Exception as e:
-            logger.debug(f"Error checking comment {comment.id} status: {e}")
-            return False
-
-    def should_respond(self, comment) -> bool:
-        """Determine if the bot should respond to a comment"""
-        # Check if bot should be active during these hours
-        if not self._is_active_hours():
-            return False
-
-        # Don't respond to own comments
-        if comment.author and comment.author.name == self.reddit.user.me().name:
+            logger.debug("Error checking comment %s status: %s", comment.id, e)
             return False
 
+    def should_respond(self, comment) -> str | None:
+        """Decide whether to respond to a comment, returning why ('command', 'mention',
+        'question' or 'reply') so generate_response can route without re-checking, or None
+        """
+        # Cheap local checks first
         # Don't respond to already processed comments
         if comment.id in self.processed_comments:
-            return False
+            return None
 
         # Don't respond to deleted/removed comments
         if comment.author is None:
-            return False
+            return None
+
+        # Check if bot should be active during these hours
+        if not self._is_active_hours():
+            return None
+
+        # Don't respond to own comments
+        if comment.author.name == self._username:
+            return None
 
         # Don't respond to bots (AutoModerator, other bots)
-        if comment.author:
-            author_name = comment.author.name.lower()
-            bot_names = [
-                'automoderator', 'automod', 'moderator', 'bot', '_bot', 'reddit',
-                'snapshillbot', 'totesmessenger', 'remindmebot', 'wikisummarizerbot'
-            ]
-            if any(bot_name in author_name for bot_name in bot_names):
-                return False
+        if _BOT_NAME_RE.search(comment.author.name.lower()):
+            return None
 
         comment_text = comment.body.strip()
 
-        # Clean formatting to detect commands properly
-        clean_text = self._clean_text_formatting(comment_text)
-
-        # ONLY respond to comments starting with "!" (explicit commands)
-        if clean_text.startswith('!') or comment_text.startswith('!'):
-            return True
+        # ONLY respond to comments starting with "!" (explicit commands); the raw
+        # text is checked since cleaning strips the '!'
+        if comment_text.startswith('!'):
+            return 'command'
 
         # Check if bot is explicitly mentioned by username
-        bot_username = self.reddit.user.me().name.lower()
+        bot_username = self._username.lower()
         if bot_username in comment_text.lower():
-            return True
-
-        # Check if comment is a direct reply to the bot
-        if hasattr(comment, 'parent') and comment.parent():
-            try:
-                parent = comment.parent()
-                if hasattr(parent, 'author') and parent.author and parent.author.name == self.reddit.user.me().name:
-                    return True
-            except:
-                pass
+            return 'mention'
 
         # VERY restrictive natural language detection - only respond to DIRECT QUESTIONS
-        if self._is_direct_question_to_bot(comment.body):
-            return True
+        # (pure text checks, so they run before the parent lookup below hits the API)
+        if _is_direct_question_to_bot(comment_text):
+            return 'question'
 
-        return False
-
-    def _is_direct_question_to_bot(self, comment_text):
-        """Very restrictive detection - only respond to DIRECT questions asking for cutoffs/help"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Must be a question (has question words or question mark)
-        question_indicators = [
-            'what', 'how', 'can', 'will', 'should', 'which', 'where', 'when',
-            'tell me', 'help me', 'show me', 'give me', 'need to know',
-            'anyone know', 'does anyone', 'can someone', 'help with',
-            'kya', 'kaise', 'kitne', 'batao', 'bata do', 'pata hai',
-            '?'  # Question mark
-        ]
-
-        has_question = any(indicator in text_lower for indicator in question_indicators)
-        if not has_question:
-            return False
-
-        # Must explicitly mention cutoff/admission related terms
-        explicit_cutoff_terms = [
-            'cutoff', 'cut-off', 'cutoffs', 'cut-offs',
-            'admission', 'qualify', 'eligible', 'get into',
-            'marks needed', 'score needed', 'minimum marks',
-            'required marks', 'required score'
-        ]
-
-        has_cutoff_term = any(term in text_lower for term in explicit_cutoff_terms)
-        if not has_cutoff_term:
-            return False
-
-        # Must mention specific branch or campus
-        specific_terms = [
-            'cse', 'computer science', 'ece', 'electronics', 'eee', 'electrical',
-            'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
-            'mnc', 'math and computing', 'mathematics', 'eni', 'instrumentation',
-            'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy',
-            'pilani', 'goa', 'hyderabad', 'hyd', 'bits'
-        ]
-
-        has_specific_term = any(term in text_lower for term in specific_terms)
-        if not has_specific_term:
-            return False
-
-        # Additional filters to avoid responding to casual mentions
-        # Don't respond if it's just sharing information (not asking)
-        sharing_indicators = [
-            'i got', 'i scored', 'my friend', 'someone i know',
-            'last year', 'previous year', 'heard that', 'saw that',
-            'according to', 'as per', 'i think', 'probably',
-            'maybe', 'might be', 'could be'
-        ]
+        # Check if comment is a direct reply to the bot (one parent fetch per comment)
+        if self._is_reply_to_bot(comment):
+            return 'reply'
+        return None
 
-        is_sharing = any(indicator in text_lower for indicator in sharing_indicators)
-        if is_sharing and not any(q in text_lower for q in ['what', 'how', 'can', 'will', '?']):
+    def _is_reply_to_bot(self, comment):
+        """Check if a comment replies to one of the bot's own"""
+        if not hasattr(comment, 'parent'):
             return False
-
-        # Must be a reasonably short comment (not a long discussion)
-        word_count = len(text_lower.split())
-        if word_count > 50:  # Too long, probably not a direct question
+        try:
+            parent = comment.parent()
+            return bool(parent and hasattr(parent, 'author') and parent.author and parent.author.name == self._username)
+        except _REDDIT_ERRORS as e:
+            logger.debug("Could not fetch parent of comment %s: %s", comment.id, e)
             return False
 
-        return True
-
-    def generate_response(self, comment) -> str:
-        """Generate intelligent response based on comment analysis"""
+    def generate_response(self, comment, route) -> str:
+        """Generate intelligent response based on comment analysis, for the route should_respond chose"""
         comment_text = comment.body.strip()
         author_name = comment.author.name if comment.author else "anonymous"
 
         # Handle ! commands first (highest priority)
-        if comment_text.startswith('!'):
+        if route == 'command':
             command = comment_text[1:].strip().lower()
             if command == 'help':
                 return self._generate_help_response(author_name)
@@ -326,8 +1730,7 @@ class BITSATBot:
                 return self._generate_cutoff_response(author_name, comment_text)
 
         # Check if bot is mentioned by username
-        bot_username = self.reddit.user.me().name.lower()
-        if bot_username in comment_text.lower():
+        if route == 'mention':
             # If mentioned, try to determine what they want
             if 'help' in comment_text.lower():
                 return self._generate_help_response(author_name)
@@ -335,17 +1738,12 @@ class BITSATBot:
                 return self._generate_cutoff_response(author_name, comment_text)
 
         # Check if it's a reply to bot
-        try:
-            if hasattr(comment, 'parent') and comment.parent():
-                parent = comment.parent()
-                if hasattr(parent, 'author') and parent.author and parent.author.name == self.reddit.user.me().name:
-                    # It's a reply to bot, try to help
-                    return self._generate_cutoff_response(author_name, comment_text)
-        except:
-            pass
+        if route == 'reply':
+            # It's a reply to bot, try to help
+            return self._generate_cutoff_response(author_name, comment_text)
 
         # For direct questions, analyze what type of response is needed
-        if self._is_direct_question_to_bot(comment_text):
+        if route == 'question':
             # Try to determine the type of query and respond appropriately
             if self._is_trend_query(comment_text):
                 return self._generate_trend_response(author_name, comment_text)
@@ -364,91 +1762,34 @@ class BITSATBot:
         # This shouldn't happen with current logic, but just in case
         return self._create_unique_response(author_name, comment_text, [])
 
-    def _clean_text_formatting(self, text):
-        """Remove Reddit formatting and normalize text"""
-        import re
-
-        # Remove Reddit markdown formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold **text**
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # Italic *text*
-        text = re.sub(r'`(.*?)`', r'\1', text)        # Code `text`
-        text = re.sub(r'```(.*?)```', r'\1', text, flags=re.DOTALL)  # Code blocks
-        text = re.sub(r'~~(.*?)~~', r'\1', text)      # Strikethrough ~~text~~
-        text = re.sub(r'\^(.*?)\^', r'\1', text)      # Superscript ^text^
-        text = re.sub(r'_(.*?)_', r'\1', text)        # Underline _text_
-
-        # Remove special characters and punctuation
-        text = re.sub(r'[^\w\s]', ' ', text)
-
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
-
     # Removed _is_specific_cutoff_query - now using more restrictive _is_direct_question_to_bot
 
     def _is_admission_query(self, comment_text):
         """Check if this is a 'can I get' admission query"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Admission query patterns
-        admission_patterns = [
-            'can i get', 'can i qualify', 'will i get', 'chances of getting',
-            'eligible for', 'admission in', 'qualify for', 'get admission',
-            'kya mil jayega', 'mil sakta hai', 'admission mil jayega'
-        ]
+        text_lower = _normalized_text(comment_text)
 
         # Must contain admission pattern
-        has_admission_pattern = any(pattern in text_lower for pattern in admission_patterns)
+        has_admission_pattern = bool(_ADMISSION_RE.search(text_lower))
 
         # Must contain branch or campus terms
-        branch_terms = {
-            'cse', 'computer', 'science', 'cs', 'ece', 'electronics', 'communication',
-            'eee', 'electrical', 'mechanical', 'mech', 'chemical', 'chem', 'civil',
-            'manufacturing', 'manuf', 'mathematics', 'math', 'maths', 'computing',
-            'biology', 'bio', 'biological', 'physics', 'phy', 'chemistry', 'economics',
-            'eco', 'pharmacy', 'pharm', 'instrumentation', 'instru', 'mnc', 'eni',
-            'msc', 'm.sc', 'pilani', 'goa', 'hyderabad', 'hyd'
-        }
-
-        words = text_lower.split()
-        has_branch_or_campus = any(word in branch_terms for word in words)
+        has_branch_or_campus = not _ADMISSION_TOKENS.isdisjoint(text_lower.split())
 
         # Must contain a score (number)
-        import re
-        has_score = bool(re.search(r'\b\d{2,3}\b', text_lower))
+        has_score = bool(_SCORE_RE.search(text_lower))
 
         return has_admission_pattern and has_branch_or_campus and has_score
 
     def _is_branch_comparison_query(self, comment_text):
         """Check if this is a branch comparison query"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Strong comparison patterns (must have explicit comparison words)
-        comparison_patterns = [
-            'compare', 'comparison', 'vs', 'versus', 'difference between',
-            'better', 'which is better', 'difference', 'choose between'
-        ]
+        text_lower = _normalized_text(comment_text)
 
-        # Must contain comparison pattern
-        has_comparison = any(pattern in text_lower for pattern in comparison_patterns)
-
-        # Enhanced branch detection including campus-branch combinations
-        branch_terms = [
-            'cse', 'computer', 'ece', 'electronics', 'eee', 'electrical',
-            'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
-            'mnc', 'math', 'mathematics', 'computing', 'eni', 'instrumentation',
-            'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy', 'eco'
-        ]
-
-        # Campus terms
-        campus_terms = ['pilani', 'goa', 'hyderabad', 'hyd']
+        # Must contain comparison pattern (explicit comparison words)
+        has_comparison = bool(_COMPARISON_RE.search(text_lower))
 
+        # Count branch and campus mentions (repeats count, as in 'cse goa vs cse hyd')
         words = text_lower.split()
-        branch_count = sum(1 for word in words if word in branch_terms)
-        campus_count = sum(1 for word in words if word in campus_terms)
+        branch_count = sum(1 for word in words if word in _COMPARISON_BRANCH_TOKENS)
+        campus_count = sum(1 for word in words if word in _COMPARISON_CAMPUS_TOKENS)
 
         # It's a comparison ONLY if:
         # 1. Has explicit comparison keywords AND multiple branches/campuses
@@ -460,115 +1801,51 @@ class BITSATBot:
 
     def _is_trend_query(self, comment_text):
         """Check if this is a trends/previous year query (improved specificity)"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Strong trend indicators
-        strong_trend_patterns = [
-            'trend', 'trends', 'previous year', 'last year', 'past years',
-            'history', 'historical', 'over years', 'year wise', 'yearly',
-            'cutoff trend', 'cutoff history', 'previous cutoff', 'past cutoff',
-            'how has', 'change over', 'annual', 'over time'
-        ]
-
-        # Exclude comparison patterns to avoid conflicts
-        comparison_exclusions = [
-            'vs', 'versus', 'compare', 'comparison', 'difference between',
-            'better', 'which is better', 'choose between'
-        ]
+        text_lower = _normalized_text(comment_text)
 
         # Must contain strong trend pattern
-        has_trend = any(pattern in text_lower for pattern in strong_trend_patterns)
+        has_trend = bool(_TREND_RE.search(text_lower))
 
         # Must NOT contain comparison patterns
-        has_comparison = any(pattern in text_lower for pattern in comparison_exclusions)
+        has_comparison = bool(_COMPARISON_EXCLUSION_RE.search(text_lower))
 
         # Must mention cutoff or branch
-        cutoff_branch_terms = [
-            'cutoff', 'cut-off', 'score', 'marks', 'cse', 'ece', 'mechanical',
-            'chemical', 'branch', 'admission', 'math', 'maths', 'eee', 'civil'
-        ]
-
-        has_cutoff_branch = any(term in text_lower for term in cutoff_branch_terms)
+        has_cutoff_branch = bool(_TREND_CONTEXT_RE.search(text_lower))
 
         # Only return true if it's clearly a trend query and NOT a comparison
         return has_trend and has_cutoff_branch and not has_comparison
 
     def _is_suggestion_query(self, comment_text):
         """Check if this is asking for suggestions/advice"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Suggestion patterns
-        suggestion_patterns = [
-            'suggest', 'suggestion', 'advice', 'recommend', 'what should i',
-            'help me choose', 'guide me', 'confused', 'dilemma', 'options',
-            'what to do', 'best option', 'which branch', 'which campus'
-        ]
+        text_lower = _normalized_text(comment_text)
 
         # Must contain suggestion pattern
-        has_suggestion = any(pattern in text_lower for pattern in suggestion_patterns)
+        has_suggestion = bool(_SUGGESTION_RE.search(text_lower))
 
         # Must mention score or be asking for branch/campus advice
-        context_terms = [
-            'score', 'marks', 'got', 'branch', 'campus', 'college',
-            'admission', 'choose', 'select', 'pick'
-        ]
-
-        has_context = any(term in text_lower for term in context_terms)
+        has_context = bool(_SUGGESTION_CONTEXT_RE.search(text_lower))
 
         return has_suggestion and has_context
 
     def _is_chance_query(self, comment_text):
         """Check if this is asking for admission chances with specific score"""
-        clean_text = self._clean_text_formatting(comment_text)
-        text_lower = clean_text.lower().strip()
-
-        # Strong chance patterns
-        chance_patterns = [
-            'chance', 'chances', 'probability', 'likely', 'possibility',
-            'any chance', 'what are my chances', 'chances of getting',
-            'can i get', 'will i get', 'possible to get'
-        ]
-
-        # Exclude comparison patterns to avoid conflicts
-        comparison_exclusions = [
-            'vs', 'versus', 'compare', 'comparison', 'difference between',
-            'better', 'which is better', 'choose between'
-        ]
+        text_lower = _normalized_text(comment_text)
 
         # Must contain chance pattern
-        has_chance = any(pattern in text_lower for pattern in chance_patterns)
+        has_chance = bool(_CHANCE_RE.search(text_lower))
 
         # Must NOT contain comparison patterns
-        has_comparison = any(pattern in text_lower for pattern in comparison_exclusions)
+        has_comparison = bool(_COMPARISON_EXCLUSION_RE.search(text_lower))
 
         # Must mention score/marks and branch
-        import re
-        has_score = bool(re.search(r'\b(\d{2,3})\b', text_lower))
-
-        branch_terms = [
-            'cse', 'computer', 'ece', 'electronics', 'eee', 'electrical',
-            'mechanical', 'mech', 'chemical', 'chem', 'civil', 'manufacturing',
-            'mnc', 'math', 'mathematics', 'computing', 'eni', 'instrumentation',
-            'biology', 'bio', 'physics', 'chemistry', 'economics', 'pharmacy'
-        ]
-
-        has_branch = any(term in text_lower for term in branch_terms)
+        has_score = bool(_SCORE_RE.search(text_lower))
+        has_branch = bool(_CHANCE_BRANCH_RE.search(text_lower))
 
         # Only return true if it's clearly a chance query and NOT a comparison
         return has_chance and has_score and has_branch and not has_comparison
 
     def _create_unique_response(self, author, comment_text, meaningful_words):
         """Create a completely unique response every time"""
-        import hashlib
-        import time
-
-        # Create unique seed based on comment content, author, and timestamp
-        unique_seed = f"{author}{comment_text}{time.time()}"
-        seed_hash = int(hashlib.md5(unique_seed.encode()).hexdigest()[:8], 16)
-        random.seed(seed_hash)
-
         # Build response components
         starter = random.choice(self.dark_starters)
         vibe = random.choice(self.hinglish_vibes)
@@ -576,134 +1853,49 @@ class BITSATBot:
         ending = random.choice(self.cool_endings)
         wisdom = random.choice(self.dark_wisdom)
 
-        # Different response patterns for variety - no emojis, more natural
-        patterns = [
-            # Pattern 1: Direct address with dark motivation
-            f"{starter} {author}, {vibe} {motivation} but remember - {wisdom}. {ending.capitalize()}.",
-
-            # Pattern 2: Comment-specific with wisdom
-            f"Yo {author}! {vibe} this is just {motivation}. Here's the thing - {wisdom}. {ending.capitalize()}.",
-
-            # Pattern 3: Hinglish mix with motivation
-            f"{starter}, {vibe} life threw you this curveball? {motivation.capitalize()} hai yaar. But {wisdom} - {ending}.",
-
-            # Pattern 4: Cool philosophical
-            f"Dekh {author}, {vibe} {motivation} is happening. Real talk - {wisdom}. Time to {ending}.",
-
-            # Pattern 5: Sarcastic motivation
-            f"{starter} {author}, {motivation}? {vibe} perfect timing. Remember: {wisdom}. Now {ending}."
-        ]
-
-        # Add comment-specific elements if available
+        # Add comment-specific patterns if available
         if meaningful_words:
             word = random.choice(meaningful_words)
-            specific_patterns = [
-                f"{starter} {author}, {vibe} {word} is giving you {motivation}? Plot twist: {wisdom}. {ending.capitalize()}.",
-                f"Yo {author}! {word} se {motivation}? {vibe} {wisdom} - {ending}.",
-                f"{starter}, {word} and {motivation} - {vibe} classic combo. But {wisdom}, so {ending}."
-            ]
-            patterns.extend(specific_patterns)
-
-        # Reset random seed to avoid affecting other parts
-        random.seed()
+            patterns = _UNIQUE_PATTERNS_WITH_WORD
+        else:
+            word = None
+            patterns = _UNIQUE_PATTERNS
 
-        return random.choice(patterns)
+        return random.choice(patterns).format(
+            starter=starter, author=author, vibe=vibe, motivation=motivation,
+            motivation_cap=motivation.capitalize(), wisdom=wisdom,
+            ending=ending, ending_cap=ending.capitalize(), word=word
+        )
 
     def _generate_cutoff_response(self, author, comment_text):
         """Generate intelligent cutoff response based on specific query"""
-        import hashlib
-        import time
-
         # Clean formatting from the query text
-        clean_query = self._clean_text_formatting(comment_text)
-
-        # Create unique seed for this response
-        unique_seed = f"{author}{clean_query}{time.time()}"
-        seed_hash = int(hashlib.md5(unique_seed.encode()).hexdigest()[:8], 16)
-        random.seed(seed_hash)
-
-        # Helper function to add case variations
-        def add_case_variations(branch_dict):
-            """Add all case variations for branch names"""
-            new_dict = {}
-            for key, value in branch_dict.items():
-                # Add original
-                new_dict[key] = value
-                # Add uppercase
-                new_dict[key.upper()] = value
-                # Add title case
-                new_dict[key.title()] = value
-                # Add first letter uppercase
-                if len(key) > 0:
-                    new_dict[key[0].upper() + key[1:]] = value
-            return new_dict
-
-        # Complete cutoff data (2024-25 Official BITS Data)
-        cutoff_data = {
-            'pilani': {
-                'computer science': 327, 'cse': 327, 'cs': 327, 'computer': 327,
-                'electronics and communication': 314, 'ece': 314, 'electronics': 314, 'communication': 314,
-                'electrical and electronics': 292, 'eee': 292, 'electrical': 292,
-                'mechanical': 266, 'mech': 266, 'mechanical engineering': 266,
-                'chemical': 247, 'chemical engineering': 247, 'chem': 247,
-                'civil': 238, 'civil engineering': 238,
-                'manufacturing': 243, 'manufacturing engineering': 243, 'manuf': 243,
-                'mathematics and computing': 318, 'math and computing': 318, 'mathematics computing': 318, 'mnc': 318,
-                'pharmacy': 165, 'pharm': 165, 'b.pharm': 165,
-                'biological sciences': 236, 'biology': 236, 'bio': 236, 'biological': 236,
-                'chemistry msc': 241, 'msc chemistry': 241,
-                'mathematics msc': 256, 'msc mathematics': 256, 'msc math': 256, 'msc maths': 256, 'math': 256, 'maths': 256, 'mathematics': 256,
-                'economics': 271, 'eco': 271, 'msc economics': 271,
-                'physics': 254, 'phy': 254, 'msc physics': 254,
-                'electronics and instrumentation': 282, 'instrumentation': 282, 'instru': 282, 'eni': 282
-            },
-            'goa': {
-                'computer science': 301, 'cse': 301, 'cs': 301, 'computer': 301,
-                'electronics and communication': 287, 'ece': 287, 'electronics': 287, 'communication': 287,
-                'electrical and electronics': 278, 'eee': 278, 'electrical': 278,
-                'mechanical': 254, 'mech': 254, 'mechanical engineering': 254,
-                'chemical': 239, 'chemical engineering': 239, 'chem': 239,
-                'mathematics and computing': 295, 'math and computing': 295, 'mathematics computing': 295, 'mnc': 295,
-                'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
-                'chemistry msc': 236, 'msc chemistry': 236,
-                'mathematics msc': 249, 'msc mathematics': 249, 'msc math': 249, 'msc maths': 249, 'math': 249, 'maths': 249, 'mathematics': 249,
-                'economics': 263, 'eco': 263, 'msc economics': 263,
-                'physics': 248, 'phy': 248, 'msc physics': 248,
-                'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
-            },
-            'hyderabad': {
-                'computer science': 298, 'cse': 298, 'cs': 298, 'computer': 298,
-                'electronics and communication': 284, 'ece': 284, 'electronics': 284, 'communication': 284,
-                'electrical and electronics': 275, 'eee': 275, 'electrical': 275,
-                'mechanical': 251, 'mech': 251, 'mechanical engineering': 251,
-                'chemical': 238, 'chemical engineering': 238, 'chem': 238,
-                'civil': 235, 'civil engineering': 235,
-                'mathematics and computing': 293, 'math and computing': 293, 'mathematics computing': 293, 'mnc': 293,
-                'pharmacy': 161, 'pharm': 161, 'b.pharm': 161,
-                'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
-                'chemistry msc': 235, 'msc chemistry': 235,
-                'mathematics msc': 247, 'msc mathematics': 247, 'msc math': 247, 'msc maths': 247, 'math': 247, 'maths': 247, 'mathematics': 247,
-                'economics': 261, 'eco': 261, 'msc economics': 261,
-                'physics': 245, 'phy': 245, 'msc physics': 245,
-                'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
-            }
-        }
-
-        # Apply case variations to all campuses
-        for campus in cutoff_data:
-            cutoff_data[campus] = add_case_variations(cutoff_data[campus])
+        clean_query = _clean_text_formatting(comment_text)
 
-        # Parse the query intelligently using cleaned text
+        # Parse the query intelligently using cleaned text (lowercased to match the table keys)
         query = clean_query.lower()
+        specific_branch, specific_campus = self._detect_branch_and_campus(query)
+
+        # Log query understanding in one line
+        branch_str = specific_branch or 'ALL'
+        campus_str = specific_campus or 'ALL'
+        logger.info("Query: '%s' -> Branch: %s, Campus: %s", clean_query, branch_str, campus_str)
+
+        # Handle generic "cutoff" query more helpfully
+        if not specific_branch and not specific_campus and query.strip() in _GENERIC_CUTOFF_QUERIES:
+            return self._generate_generic_cutoff_help(author)
+
+        return self._format_cutoff_response(author, specific_branch, specific_campus)
+
+    def _detect_branch_and_campus(self, query):
+        """Detect the branch and campus mentioned in a lowercased query"""
         specific_branch = None
         specific_campus = None
 
-        # Enhanced branch detection with context understanding and detailed logging
-        branch_matches = []
-        for campus in cutoff_data:
-            for branch in cutoff_data[campus]:
-                if branch in query:
-                    branch_matches.append(branch)
+        # Enhanced branch detection with context understanding: one scan reports
+        # the longest key starting at each position, which always includes the
+        # longest key found anywhere
+        branch_matches = {match.group(1) for match in _CUTOFF_KEY_RE.finditer(query)}
 
         # Prioritize M.Sc programs when "msc" or "m.sc" is mentioned
         if 'msc' in query or 'm.sc' in query or 'm sc' in query:
@@ -711,384 +1903,102 @@ class BITSATBot:
             msc_matches = [branch for branch in branch_matches if 'msc' in branch]
 
             if msc_matches:
-                specific_branch = max(msc_matches, key=len)
+                specific_branch = max(msc_matches, key=_cutoff_key_rank)
             else:
                 # If no direct MSc match, try to infer from subject + msc context
-                # Subject mapping for MSc programs
-                subject_mappings = {
-                    'mathematics': ['mathematics msc', 'msc mathematics'],
-                    'math': ['mathematics msc', 'msc mathematics'],
-                    'maths': ['mathematics msc', 'msc mathematics'],
-                    'chemistry': ['chemistry msc', 'msc chemistry'],
-                    'physics': ['physics msc', 'msc physics'],
-                    'biology': ['biological sciences'],
-                    'bio': ['biological sciences'],
-                    'economics': ['economics', 'msc economics'],
-                    'eco': ['economics', 'msc economics']  # Map eco to economics
-                }
-
-                for subject, possible_branches in subject_mappings.items():
-                    if subject in query:
-                        for branch in possible_branches:
-                            if any(branch in cutoff_data[campus] for campus in cutoff_data):
-                                specific_branch = branch
-                                break
-
-                        if specific_branch:
-                            break
+                subject_match = _MSC_SUBJECT_RE.search(query)
+                if subject_match:
+                    specific_branch = _MSC_SUBJECT_BRANCHES[subject_match.group()]
         else:
             # Get the longest match (most specific) for non-MSc queries
             if branch_matches:
-                specific_branch = max(branch_matches, key=len)
+                specific_branch = max(branch_matches, key=_cutoff_key_rank)
 
         # Enhanced campus detection with variations
-        campus_patterns = {
-            'pilani': ['pilani', 'pilani campus', 'bits pilani'],
-            'goa': ['goa', 'goa campus', 'bits goa', 'k k birla goa'],
-            'hyderabad': ['hyderabad', 'hyd', 'hyderabad campus', 'bits hyderabad', 'bits hyd']
-        }
-
-        for campus, patterns in campus_patterns.items():
-            matched_patterns = [pattern for pattern in patterns if pattern in query]
-            if matched_patterns:
+        for campus, patterns in _CAMPUS_DETECT_TERMS:
+            if any(pattern in query for pattern in patterns):
                 specific_campus = campus
                 break
 
-        # Log query understanding in one line
-        branch_str = specific_branch or 'ALL'
-        campus_str = specific_campus or 'ALL'
-        logger.info(f"Query: '{clean_query}' -> Branch: {branch_str}, Campus: {campus_str}")
-
-        # Handle generic "cutoff" query more helpfully
-        if not specific_branch and not specific_campus and clean_query.strip().lower() in ['cutoff', 'cut-off', 'cutoffs']:
-            return self._generate_generic_cutoff_help(author)
-
-        return self._format_cutoff_response(author, cutoff_data, specific_branch, specific_campus)
+        if specific_branch:
+            specific_branch = sys.intern(specific_branch)
+        return specific_branch, specific_campus
 
     def _generate_admission_response(self, author, clean_query):
         """Generate response for admission queries like 'can I get CSE at 300'"""
-        import re
-
         # Extract score from query
-        score_match = re.search(r'\b(\d{2,3})\b', clean_query)
+        score_match = _SCORE_RE.search(clean_query)
         if not score_match:
             return "Bro, mention your score! How can I predict without knowing your marks?"
 
         user_score = int(score_match.group(1))
         query = clean_query.lower()
 
-        logger.info(f"ADMISSION QUERY ANALYSIS: '{clean_query}'")
-        logger.info(f"User score: {user_score}")
-
-        # Load cutoff data (same as cutoff response)
-        cutoff_data = self._get_cutoff_data()
+        logger.info("ADMISSION QUERY ANALYSIS: '%s'", clean_query)
+        logger.info("User score: %s", user_score)
 
         # Detect branch and campus
-        specific_branch = None
-        specific_campus = None
-
-        # Branch detection with MSc priority
-        if 'msc' in query or 'm.sc' in query:
-            subject_mappings = {
-                'mathematics': ['mathematics msc', 'msc mathematics'],
-                'math': ['mathematics msc', 'msc mathematics'],
-                'maths': ['mathematics msc', 'msc mathematics'],
-                'chemistry': ['chemistry msc', 'msc chemistry'],
-                'physics': ['physics msc', 'msc physics'],
-                'biology': ['biological sciences'],
-                'bio': ['biological sciences'],
-                'economics': ['economics', 'msc economics'],
-                'eco': ['economics', 'msc economics']
-            }
-
-            for subject, possible_branches in subject_mappings.items():
-                if subject in query:
-                    for branch in possible_branches:
-                        if any(branch in cutoff_data[campus] for campus in cutoff_data):
-                            specific_branch = branch
-                            break
-                    if specific_branch:
-                        break
-        else:
-            # Regular branch detection
-            branch_matches = []
-            for campus in cutoff_data:
-                for branch in cutoff_data[campus]:
-                    if branch in query:
-                        branch_matches.append(branch)
-
-            if branch_matches:
-                specific_branch = max(branch_matches, key=len)
+        specific_branch, specific_campus = self._detect_branch_and_campus(query)
 
-        # Campus detection
-        campus_patterns = {
-            'pilani': ['pilani', 'pilani campus', 'bits pilani'],
-            'goa': ['goa', 'goa campus', 'bits goa'],
-            'hyderabad': ['hyderabad', 'hyd', 'hyderabad campus', 'bits hyderabad']
-        }
-
-        for campus, patterns in campus_patterns.items():
-            if any(pattern in query for pattern in patterns):
-                specific_campus = campus
-                break
+        logger.info("Detected branch: %s", specific_branch)
+        logger.info("Detected campus: %s", specific_campus)
 
-        logger.info(f"Detected branch: {specific_branch}")
-        logger.info(f"Detected campus: {specific_campus}")
-
-        return self._format_admission_response(author, user_score, cutoff_data, specific_branch, specific_campus)
-
-    def _get_cutoff_data(self):
-        """Get cutoff data (extracted from _generate_cutoff_response for reuse)"""
-        # Helper function to add case variations
-        def add_case_variations(branch_dict):
-            new_dict = {}
-            for key, value in branch_dict.items():
-                new_dict[key] = value
-                new_dict[key.upper()] = value
-                new_dict[key.title()] = value
-                if len(key) > 0:
-                    new_dict[key[0].upper() + key[1:]] = value
-            return new_dict
-
-        # Complete cutoff data (2024-25 Official BITS Data)
-        cutoff_data = {
-            'pilani': {
-                'computer science': 327, 'cse': 327, 'cs': 327, 'computer': 327,
-                'electronics and communication': 314, 'ece': 314, 'electronics': 314, 'communication': 314,
-                'electrical and electronics': 292, 'eee': 292, 'electrical': 292,
-                'mechanical': 266, 'mech': 266, 'mechanical engineering': 266,
-                'chemical': 247, 'chemical engineering': 247, 'chem': 247,
-                'civil': 238, 'civil engineering': 238,
-                'manufacturing': 243, 'manufacturing engineering': 243, 'manuf': 243,
-                'mathematics and computing': 318, 'math and computing': 318, 'mathematics computing': 318, 'mnc': 318,
-                'pharmacy': 165, 'pharm': 165, 'b.pharm': 165,
-                'biological sciences': 236, 'biology': 236, 'bio': 236, 'biological': 236,
-                'chemistry msc': 241, 'msc chemistry': 241,
-                'mathematics msc': 256, 'msc mathematics': 256, 'msc math': 256, 'msc maths': 256, 'math': 256, 'maths': 256, 'mathematics': 256,
-                'economics': 271, 'eco': 271, 'msc economics': 271,
-                'physics': 254, 'phy': 254, 'msc physics': 254,
-                'electronics and instrumentation': 282, 'instrumentation': 282, 'instru': 282, 'eni': 282
-            },
-            'goa': {
-                'computer science': 301, 'cse': 301, 'cs': 301, 'computer': 301,
-                'electronics and communication': 287, 'ece': 287, 'electronics': 287, 'communication': 287,
-                'electrical and electronics': 278, 'eee': 278, 'electrical': 278,
-                'mechanical': 254, 'mech': 254, 'mechanical engineering': 254,
-                'chemical': 239, 'chemical engineering': 239, 'chem': 239,
-                'mathematics and computing': 295, 'math and computing': 295, 'mathematics computing': 295, 'mnc': 295,
-                'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
-                'chemistry msc': 236, 'msc chemistry': 236,
-                'mathematics msc': 249, 'msc mathematics': 249, 'msc math': 249, 'msc maths': 249, 'math': 249, 'maths': 249, 'mathematics': 249,
-                'economics': 263, 'eco': 263, 'msc economics': 263,
-                'physics': 248, 'phy': 248, 'msc physics': 248,
-                'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
-            },
-            'hyderabad': {
-                'computer science': 298, 'cse': 298, 'cs': 298, 'computer': 298,
-                'electronics and communication': 284, 'ece': 284, 'electronics': 284, 'communication': 284,
-                'electrical and electronics': 275, 'eee': 275, 'electrical': 275,
-                'mechanical': 251, 'mech': 251, 'mechanical engineering': 251,
-                'chemical': 238, 'chemical engineering': 238, 'chem': 238,
-                'civil': 235, 'civil engineering': 235,
-                'mathematics and computing': 293, 'math and computing': 293, 'mathematics computing': 293, 'mnc': 293,
-                'pharmacy': 161, 'pharm': 161, 'b.pharm': 161,
-                'biological sciences': 234, 'biology': 234, 'bio': 234, 'biological': 234,
-                'chemistry msc': 235, 'msc chemistry': 235,
-                'mathematics msc': 247, 'msc mathematics': 247, 'msc math': 247, 'msc maths': 247, 'math': 247, 'maths': 247, 'mathematics': 247,
-                'economics': 261, 'eco': 261, 'msc economics': 261,
-                'physics': 245, 'phy': 245, 'msc physics': 245,
-                'electronics and instrumentation': 270, 'instrumentation': 270, 'instru': 270, 'eni': 270
-            }
-        }
-
-        # Apply case variations to all campuses
-        for campus in cutoff_data:
-            cutoff_data[campus] = add_case_variations(cutoff_data[campus])
-
-        return cutoff_data
+        return self._format_admission_response(author, user_score, specific_branch, specific_campus)
 
-    def _format_admission_response(self, author, user_score, cutoff_data, specific_branch, specific_campus):
+    def _format_admission_response(self, author, user_score, specific_branch, specific_campus):
         """Format admission response based on user score vs cutoffs"""
+        if specific_branch and specific_campus and specific_branch not in _CUTOFF_DATA[specific_campus]:
+            return f"Sorry {author}, {specific_branch.upper()} is not available at {specific_campus.upper()} campus."
 
-        # Determine what to check
+        # Address the reader, then the cached verdict for this score
+        author_name = author.upper()
         if specific_branch and specific_campus:
-            # Specific branch + campus
-            required_score = cutoff_data[specific_campus].get(specific_branch, None)
-            if required_score is None:
-                return f"Sorry {author}, {specific_branch.upper()} is not available at {specific_campus.upper()} campus."
-
-            if user_score >= required_score:
-                margin = user_score - required_score
-                response = f"**GOOD NEWS {author.upper()}!**\n\n"
-                response += f"**YES, you can get {specific_branch.upper()} at {specific_campus.upper()}!**\n\n"
-                response += f"| Your Score | Required | Status | Margin |\n"
-                response += f"|------------|----------|--------|--------|\n"
-                response += f"| **{user_score}/390** | **{required_score}/390** | **SAFE** | +{margin} |\n\n"
-                response += f"**{specific_campus.upper()} CAMPUS** - {specific_branch.upper()}\n\n"
-                if margin >= 20:
-                    response += "**EXCELLENT!** You're well above the cutoff! Time to celebrate!"
-                elif margin >= 10:
-                    response += "**GOOD!** You're comfortably above the cutoff!"
-                else:
-                    response += "**CLOSE CALL!** You're just above the cutoff. Fingers crossed!"
+            if user_score >= _CUTOFF_DATA[specific_campus][specific_branch]:
+                heading = f"**GOOD NEWS {author_name}!**\n\n"
             else:
-                deficit = required_score - user_score
-                response = f"**TOUGH NEWS {author.upper()}...**\n\n"
-                response += f"**Sorry, {specific_branch.upper()} at {specific_campus.upper()} might be tough...**\n\n"
-                response += f"| Your Score | Required | Status | Gap |\n"
-                response += f"|------------|----------|--------|-----|\n"
-                response += f"| **{user_score}/390** | **{required_score}/390** | **SHORT** | -{deficit} |\n\n"
-                response += f"**ALTERNATIVES:**\n"
-                response += f"• Try other campuses for {specific_branch.upper()}\n"
-                response += f"• Consider other branches at {specific_campus.upper()}\n"
-                response += f"• Look into M.Sc programs (lower cutoffs)\n\n"
-                response += "Don't lose hope! There are always options!"
-
+                heading = f"**TOUGH NEWS {author_name}...**\n\n"
         elif specific_branch:
-            # Specific branch, all campuses
-            response = f"**{author.upper()}, here's your {specific_branch.upper()} admission chances:**\n\n"
-            response += f"| Campus | Required | Your Score | Status |\n"
-            response += f"|--------|----------|------------|--------|\n"
-
-            campus_names = {'pilani': 'Pilani', 'goa': 'Goa', 'hyderabad': 'Hyderabad'}
-            safe_campuses = []
-            risky_campuses = []
-
-            for campus in ['pilani', 'goa', 'hyderabad']:
-                required = cutoff_data[campus].get(specific_branch, None)
-                if required:
-                    if user_score >= required:
-                        status = "SAFE"
-                        safe_campuses.append(campus)
-                    else:
-                        status = f"SHORT (-{required - user_score})"
-                        risky_campuses.append(campus)
-                    response += f"| {campus_names[campus]} | **{required}/390** | **{user_score}/390** | {status} |\n"
-
-            response += "\n"
-            if safe_campuses:
-                response += f"**GOOD NEWS!** You can get {specific_branch.upper()} at: {', '.join(safe_campuses).upper()}\n"
-            if risky_campuses:
-                response += f"**TOUGH LUCK** for: {', '.join(risky_campuses).upper()}\n"
-
+            heading = f"**{author_name}, here's your {specific_branch.upper()} admission chances:**\n\n"
         else:
-            # General admission chances
-            response = f"**{author.upper()}, here are your overall admission chances with {user_score}/390:**\n\n"
-            response += "**SAFE OPTIONS:**\n"
-
-            safe_options = []
-            for campus in cutoff_data:
-                for branch, required in cutoff_data[campus].items():
-                    if isinstance(required, int) and user_score >= required:
-                        safe_options.append(f"• {branch.upper()} at {campus.upper()}")
-
-            if safe_options:
-                response += "\n".join(safe_options[:10])  # Show top 10
-                if len(safe_options) > 10:
-                    response += f"\n... and {len(safe_options) - 10} more options!"
-            else:
-                response += "Unfortunately, very limited options with this score. Consider M.Sc programs or other colleges."
+            heading = f"**{author_name}, here are your overall admission chances with {user_score}/390:**\n\n"
 
         # Add motivational ending
-        motivational_endings = [
-            "\n\nRemember: Your worth isn't defined by cutoffs! Keep pushing!",
-            "\n\nFocus on what you can control - your preparation and attitude!",
-            "\n\nEvery rejection is a redirection to something better! Stay strong!",
-            "\n\nSuccess isn't about the college, it's about what you do there!"
-        ]
-
-        import random
-        response += random.choice(motivational_endings)
-
-        return response
+        return heading + _admission_body(user_score, specific_campus, specific_branch) + random.choice(_ADMISSION_ENDINGS)
 
     def _generate_branch_comparison_response(self, author, query):
         """Generate branch comparison response with placement data"""
         query_lower = query.lower()
 
-        # Placement data (based on recent BITS placement reports and industry data)
-        placement_data = {
-            'cse': {'avg': 28, 'median': 22, 'highest': 65, 'top_companies': 'Google, Microsoft, Amazon'},
-            'ece': {'avg': 24, 'median': 18, 'highest': 55, 'top_companies': 'Intel, Qualcomm, Samsung'},
-            'eee': {'avg': 18, 'median': 14, 'highest': 45, 'top_companies': 'Siemens, ABB, L&T'},
-            'mechanical': {'avg': 16, 'median': 12, 'highest': 40, 'top_companies': 'Tata Motors, Mahindra, Bajaj'},
-            'chemical': {'avg': 17, 'median': 13, 'highest': 42, 'top_companies': 'Reliance, ONGC, ITC'},
-            'civil': {'avg': 14, 'median': 10, 'highest': 35, 'top_companies': 'L&T, Tata Projects, DLF'},
-            'mnc': {'avg': 26, 'median': 20, 'highest': 60, 'top_companies': 'Goldman Sachs, JP Morgan, Google'}
-        }
-
-        # Get comprehensive branch info for any comparison
-        def get_branch_info(branch_key):
-            branch_descriptions = {
-                'cse': {'name': 'Computer Science', 'focus': 'Software, AI/ML, algorithms'},
-                'ece': {'name': 'Electronics & Communication', 'focus': 'Hardware+Software, VLSI, embedded'},
-                'eee': {'name': 'Electrical & Electronics', 'focus': 'Power systems, electrical machines'},
-                'mechanical': {'name': 'Mechanical', 'focus': 'Automotive, aerospace, manufacturing'},
-                'chemical': {'name': 'Chemical', 'focus': 'Process industries, pharma, petrochemicals'},
-                'civil': {'name': 'Civil', 'focus': 'Construction, infrastructure, urban planning'},
-                'mnc': {'name': 'Math & Computing', 'focus': 'Mathematics, programming, finance'},
-                'eni': {'name': 'Electronics & Instrumentation', 'focus': 'Process control, automation, IoT'},
-                'manufacturing': {'name': 'Manufacturing', 'focus': 'Production, industrial engineering'},
-                'pharmacy': {'name': 'Pharmacy', 'focus': 'Drug development, pharmaceutical industry'},
-                'biology': {'name': 'M.Sc Biology', 'focus': 'Life sciences, research, biotechnology'},
-                'physics': {'name': 'M.Sc Physics', 'focus': 'Research, academia, tech applications'},
-                'chemistry': {'name': 'M.Sc Chemistry', 'focus': 'Research, chemical industry, academia'},
-                'mathematics': {'name': 'M.Sc Mathematics', 'focus': 'Research, finance, data science'},
-                'economics': {'name': 'M.Sc Economics', 'focus': 'Policy, consulting, financial analysis'}
-            }
-            return branch_descriptions.get(branch_key, {'name': branch_key.upper(), 'focus': 'Engineering/Science'})
-
         # First check for cross-campus comparisons (e.g., "goa cse vs pilani ece")
         campus_branch_pattern = self._detect_campus_branch_comparison(query_lower)
         if campus_branch_pattern:
-            return self._generate_cross_campus_comparison(author, campus_branch_pattern, placement_data)
+            return self._generate_cross_campus_comparison(author, campus_branch_pattern)
 
         # Detect any branch comparisons using universal detection
         detected_branches = self._detect_any_branch_comparison(query_lower)
         if detected_branches:
-            return self._generate_universal_branch_comparison(author, detected_branches, placement_data, get_branch_info)
+            return self._generate_universal_branch_comparison(author, detected_branches)
 
         # If no specific comparison detected, show generic help
-        response = f"Hey {author}! I can compare ANY branches for you:\n\n"
-        response += "**Engineering Branches:**\n"
-        response += "• CSE, ECE, EEE, Mechanical, Chemical, Civil, MnC, ENI\n\n"
-        response += "**M.Sc Programs:**\n"
-        response += "• Math, Physics, Chemistry, Biology, Economics\n\n"
-        response += "**Examples:**\n"
-        response += "• *'compare CSE vs ECE'*\n"
-        response += "• *'mechanical vs chemical difference'*\n"
-        response += "• *'goa cse vs pilani ece'* (cross-campus!)\n\n"
-        response += "Pro tip: The best branch is the one that excites you!"
-
-        return response
+        parts = [f"Hey {author}! I can compare ANY branches for you:\n\n"]
+        parts.append("**Engineering Branches:**\n")
+        parts.append("• CSE, ECE, EEE, Mechanical, Chemical, Civil, MnC, ENI\n\n")
+        parts.append("**M.Sc Programs:**\n")
+        parts.append("• Math, Physics, Chemistry, Biology, Economics\n\n")
+        parts.append("**Examples:**\n")
+        parts.append("• *'compare CSE vs ECE'*\n")
+        parts.append("• *'mechanical vs chemical difference'*\n")
+        parts.append("• *'goa cse vs pilani ece'* (cross-campus!)\n\n")
+        parts.append("Pro tip: The best branch is the one that excites you!")
+
+        return "".join(parts)
 
     def _detect_any_branch_comparison(self, query):
         """Detect any two branches being compared"""
-        # All possible branch keywords (avoid partial matches)
-        branch_keywords = {
-            'cse': ['computer science', 'cse', 'computer'],  # Removed 'cs' to avoid msc conflict
-            'ece': ['electronics and communication', 'electronics communication', 'ece'],
-            'eee': ['electrical and electronics', 'electrical electronics', 'eee'],
-            'mechanical': ['mechanical', 'mech'],
-            'chemical': ['chemical', 'chem'],
-            'civil': ['civil'],
-            'mnc': ['mathematics and computing', 'math and computing', 'mnc'],
-            'eni': ['electronics and instrumentation', 'instrumentation', 'eni'],
-            'manufacturing': ['manufacturing', 'manuf'],
-            'pharmacy': ['pharmacy', 'pharm'],
-            'biology': ['biological sciences', 'msc biology', 'biology', 'bio'],
-            'physics': ['msc physics', 'physics', 'phy'],
-            'chemistry': ['msc chemistry', 'chemistry'],  # Removed 'chem' to avoid chemical conflict
-            'mathematics': ['msc mathematics', 'mathematics', 'maths', 'math'],
-            'economics': ['msc economics', 'economics', 'eco']
-        }
-
         # Find all branches mentioned in query (prioritize longer matches)
         detected_branches = []
-        # Sort keywords by length (longest first) to avoid partial matches
-        for branch_key, keywords in branch_keywords.items():
-            sorted_keywords = sorted(keywords, key=len, reverse=True)
-            if any(keyword in query for keyword in sorted_keywords):
+        for branch_key, keywords in _BRANCH_KEYWORDS.items():
+            if any(keyword in query for keyword in keywords):
                 if branch_key not in detected_branches:
                     detected_branches.append(branch_key)
 
@@ -1098,207 +2008,42 @@ class BITSATBot:
 
         return None
 
-    def _generate_universal_branch_comparison(self, author, branches, placement_data, get_branch_info):
+    def _generate_universal_branch_comparison(self, author, branches):
         """Generate detailed comparison for any two branches"""
         branch1, branch2 = branches
 
-        # Get branch info
-        info1 = get_branch_info(branch1)
-        info2 = get_branch_info(branch2)
-
-        # Get cutoff data for comparison
-        cutoff_data = self._get_cutoff_data()
-
         greeting = self._get_random_greeting(author)
-        response = f"**{greeting}, here's the {info1['name']} vs {info2['name']} breakdown:**\n\n"
-
-        # Create detailed comparison table
-        response += f"**COMPREHENSIVE COMPARISON**\n\n"
-        response += f"| Aspect | {info1['name']} | {info2['name']} |\n"
-        response += f"|--------|{'-' * len(info1['name'])}|{'-' * len(info2['name'])}|\n"
-        response += f"| **Focus Area** | {info1['focus']} | {info2['focus']} |\n"
-
-        # Placement comparison
-        if branch1 in placement_data and branch2 in placement_data:
-            p1, p2 = placement_data[branch1], placement_data[branch2]
-            response += f"| **Average Package** | ₹{p1['avg']}L | ₹{p2['avg']}L |\n"
-            response += f"| **Median Package** | ₹{p1['median']}L | ₹{p2['median']}L |\n"
-            response += f"| **Highest Package** | ₹{p1['highest']}L | ₹{p2['highest']}L |\n"
-            response += f"| **Top Recruiters** | {p1['top_companies']} | {p2['top_companies']} |\n"
-        elif branch1 in placement_data:
-            p1 = placement_data[branch1]
-            response += f"| **Average Package** | ₹{p1['avg']}L | Limited data |\n"
-            response += f"| **Top Recruiters** | {p1['top_companies']} | Varies by specialization |\n"
-        elif branch2 in placement_data:
-            p2 = placement_data[branch2]
-            response += f"| **Average Package** | Limited data | ₹{p2['avg']}L |\n"
-            response += f"| **Top Recruiters** | Varies by specialization | {p2['top_companies']} |\n"
-
-        # Cutoff comparison across campuses
-        response += f"\n**CUTOFF COMPARISON (2024-25)**\n\n"
-        response += f"| Campus | {info1['name']} | {info2['name']} | Difference |\n"
-        response += f"|--------|{'-' * len(info1['name'])}|{'-' * len(info2['name'])}|----------|\n"
-
-        for campus in ['pilani', 'goa', 'hyderabad']:
-            cutoff1 = cutoff_data[campus].get(branch1, None)
-            cutoff2 = cutoff_data[campus].get(branch2, None)
-
-            if cutoff1 and cutoff2:
-                diff = cutoff1 - cutoff2
-                diff_str = f"+{diff}" if diff > 0 else str(diff)
-                response += f"| {campus.title()} | {cutoff1} | {cutoff2} | {diff_str} |\n"
-            elif cutoff1:
-                response += f"| {campus.title()} | {cutoff1} | Not offered | - |\n"
-            elif cutoff2:
-                response += f"| {campus.title()} | Not offered | {cutoff2} | - |\n"
-
-        # Detailed analysis
-        response += f"\n**ANALYSIS:**\n"
-
-        # Package analysis
-        if branch1 in placement_data and branch2 in placement_data:
-            p1, p2 = placement_data[branch1], placement_data[branch2]
-            avg_diff = p1['avg'] - p2['avg']
-            if avg_diff > 2:
-                response += f"• Package advantage: {info1['name']} leads by ₹{avg_diff}L average\n"
-            elif avg_diff < -2:
-                response += f"• Package advantage: {info2['name']} leads by ₹{abs(avg_diff)}L average\n"
-            else:
-                response += f"• Package parity: Both branches have similar placement outcomes\n"
-
-        # Cutoff analysis
-        avg_cutoffs = {}
-        for branch, branch_name in [(branch1, info1['name']), (branch2, info2['name'])]:
-            cutoffs = [cutoff_data[campus].get(branch) for campus in ['pilani', 'goa', 'hyderabad']]
-            valid_cutoffs = [c for c in cutoffs if c is not None]
-            if valid_cutoffs:
-                avg_cutoffs[branch_name] = sum(valid_cutoffs) / len(valid_cutoffs)
-
-        if len(avg_cutoffs) == 2:
-            names = list(avg_cutoffs.keys())
-            diff = avg_cutoffs[names[0]] - avg_cutoffs[names[1]]
-            if abs(diff) > 10:
-                higher = names[0] if diff > 0 else names[1]
-                response += f"• Competition: {higher} is significantly more competitive (avg {abs(diff):.0f} points higher)\n"
-            else:
-                response += f"• Competition: Both branches have similar competition levels\n"
-
-        # Career prospects
-        career_insights = {
-            'cse': 'Highest demand, remote work options, rapid industry growth',
-            'ece': 'Hardware+software versatility, good for higher studies, stable demand',
-            'eee': 'Core engineering, government opportunities, power sector focus',
-            'mechanical': 'Most versatile, evergreen demand, broad industry applications',
-            'chemical': 'Specialized roles, process industries, research opportunities',
-            'civil': 'Infrastructure focus, government projects, steady demand',
-            'mnc': 'Finance+tech combination, quantitative roles, emerging field'
-        }
-
-        if branch1 in career_insights:
-            response += f"• {info1['name']} prospects: {career_insights[branch1]}\n"
-        if branch2 in career_insights:
-            response += f"• {info2['name']} prospects: {career_insights[branch2]}\n"
+        parts = [f"**{greeting}, here's the {_branch_info(branch1)['name']} vs {_branch_info(branch2)['name']} breakdown:**\n\n"]
+        parts.append(_branch_comparison_body(branch1, branch2))
 
         # Final verdict with humor
-        response += f"\n**FINAL VERDICT:**\n"
-        response += f"{self._get_random_humor('comparison_ending')}"
+        parts.append(f"\n**FINAL VERDICT:**\n")
+        parts.append(f"{self._get_random_humor('comparison_ending')}")
 
-        return response
+        return "".join(parts)
 
     def _detect_branch_for_trends(self, query):
         """Detect branch for trend analysis - works for ALL branches"""
-        # Comprehensive branch mapping (avoid partial matches)
-        branch_mappings = {
-            'cse': ['computer science', 'cse', 'computer'],
-            'ece': ['electronics and communication', 'electronics communication', 'ece', 'electronics'],
-            'eee': ['electrical and electronics', 'electrical electronics', 'eee', 'electrical'],
-            'mechanical': ['mechanical', 'mech'],
-            'chemical': ['chemical', 'chem'],
-            'civil': ['civil'],
-            'mnc': ['mathematics and computing', 'math and computing', 'mnc'],
-            'eni': ['electronics and instrumentation', 'instrumentation', 'eni'],
-            'manufacturing': ['manufacturing', 'manuf'],
-            'pharmacy': ['pharmacy', 'pharm'],
-            'biology': ['biological sciences', 'msc biology', 'biology', 'bio'],
-            'physics': ['msc physics', 'physics', 'phy'],
-            'chemistry': ['msc chemistry', 'chemistry'],
-            'mathematics': ['msc mathematics', 'mathematics', 'maths', 'math'],
-            'economics': ['msc economics', 'economics', 'eco']
-        }
-
-        # Find the branch (prioritize longer matches)
-        for branch_key, keywords in branch_mappings.items():
-            sorted_keywords = sorted(keywords, key=len, reverse=True)
-            if any(keyword in query for keyword in sorted_keywords):
+        # Find the branch (longest keyword first, so the first hit is the most specific)
+        for keyword, branch_key in _BRANCH_MAPPINGS_SORTED:
+            if keyword in query:
                 return branch_key
 
         return None
 
     def _detect_campus_branch_comparison(self, query):
         """Detect cross-campus branch comparisons like 'goa cse vs pilani ece' or 'pilani mech vs goa eco'"""
-        # Campus patterns
-        campuses = {
-            'pilani': ['pilani'],
-            'goa': ['goa'],
-            'hyderabad': ['hyderabad', 'hyd']
-        }
-
-        # Enhanced branch patterns including abbreviations
-        branches = {
-            'cse': ['cse', 'computer science', 'computer'],
-            'ece': ['ece', 'electronics and communication', 'electronics', 'eco'],  # Added 'eco' for ECE
-            'eee': ['eee', 'electrical and electronics', 'electrical'],
-            'mechanical': ['mechanical', 'mech'],
-            'chemical': ['chemical', 'chem'],
-            'civil': ['civil'],
-            'mnc': ['mnc', 'math and computing', 'mathematics and computing'],
-            'eni': ['eni', 'electronics and instrumentation', 'instrumentation'],
-            'manufacturing': ['manufacturing', 'manuf'],
-            'pharmacy': ['pharmacy', 'pharm'],
-            'biology': ['biology', 'bio', 'biological sciences'],
-            'physics': ['physics', 'phy'],
-            'chemistry': ['chemistry'],
-            'mathematics': ['mathematics', 'math', 'maths'],
-            'economics': ['economics', 'eco']  # Economics also uses 'eco'
-        }
-
-        # Look for patterns like "campus1 branch1 vs campus2 branch2"
-        words = query.lower().split()
-
-        # Find campus-branch combinations
-        combinations = []
-
-        # Method 1: Look for adjacent campus-branch pairs
-        for i, word in enumerate(words):
-            for campus_key, campus_patterns in campuses.items():
-                if word in campus_patterns:
-                    # Look for branch in next few words
-                    for j in range(i+1, min(len(words), i+4)):
-                        if words[j] not in ['vs', 'versus', 'and', 'or', 'with']:
-                            for branch_key, branch_patterns in branches.items():
-                                if words[j] in branch_patterns:
-                                    combinations.append((campus_key, branch_key))
-                                    break
-                            break
-
-        # Method 2: Look for branch-campus pairs (reverse order)
-        for i, word in enumerate(words):
-            for branch_key, branch_patterns in branches.items():
-                if word in branch_patterns:
-                    # Look for campus in previous or next few words
-                    search_range = list(range(max(0, i-3), i)) + list(range(i+1, min(len(words), i+4)))
-                    for j in search_range:
-                        if words[j] not in ['vs', 'versus', 'and', 'or', 'with']:
-                            for campus_key, campus_patterns in campuses.items():
-                                if words[j] in campus_patterns:
-                                    combinations.append((campus_key, branch_key))
-                                    break
+        # Campus-first pairs ("goa cse") take priority over branch-first ones ("cse at goa")
+        forward = []
+        reverse = []
+        for campus, branch, rev_branch, rev_campus in _CAMPUS_BRANCH_RE.findall(query.lower()):
+            if campus:
+                forward.append((_CROSS_CAMPUS_ALIASES[campus], _CROSS_BRANCH_ALIASES[branch]))
+            else:
+                reverse.append((_CROSS_CAMPUS_ALIASES[rev_campus], _CROSS_BRANCH_ALIASES[rev_branch]))
 
         # Remove duplicates while preserving order
-        unique_combinations = []
-        for combo in combinations:
-            if combo not in unique_combinations:
-                unique_combinations.append(combo)
+        unique_combinations = list(dict.fromkeys(forward + reverse))
 
         # If we found 2 different combinations, it's a cross-campus comparison
         if len(unique_combinations) >= 2:
@@ -1306,804 +2051,256 @@ class BITSATBot:
 
         return None
 
-    def _generate_cross_campus_comparison(self, author, combinations, placement_data):
+    def _generate_cross_campus_comparison(self, author, combinations):
         """Generate detailed cross-campus branch comparison"""
         (campus1, branch1), (campus2, branch2) = combinations
 
-        # Get cutoff data
-        cutoff_data = self._get_cutoff_data()
-
         # Get cutoffs
-        cutoff1 = cutoff_data[campus1].get(branch1, 'N/A')
-        cutoff2 = cutoff_data[campus2].get(branch2, 'N/A')
+        cutoff1 = _CUTOFF_DATA[campus1].get(branch1, 'N/A')
+        cutoff2 = _CUTOFF_DATA[campus2].get(branch2, 'N/A')
 
         greeting = self._get_random_greeting(author)
-        response = f"**{greeting}, here's the detailed comparison:**\n\n"
-
-        # Campus info with more details
-        campus_info = {
-            'pilani': {
-                'vibe': 'Original campus, traditional culture, extreme weather',
-                'pros': 'Highest prestige, strong alumni network, established reputation',
-                'cons': 'Harsh climate, conservative environment, highest competition'
-            },
-            'goa': {
-                'vibe': 'Beach campus, relaxed atmosphere, pleasant weather',
-                'pros': 'Best weather, chill vibe, good work-life balance',
-                'cons': 'Fewer industry connections, party reputation, limited research'
-            },
-            'hyderabad': {
-                'vibe': 'Modern campus, tech city advantages, growing reputation',
-                'pros': 'Tech hub location, modern facilities, industry proximity',
-                'cons': 'Newest campus, still building reputation, limited alumni network'
-            }
-        }
+        parts = [f"**{greeting}, here's the detailed comparison:**\n\n"]
 
         # Detailed comparison table
-        response += f"**DETAILED COMPARISON TABLE**\n\n"
-        response += "| Aspect | " + f"{campus1.title()} {branch1.upper()}" + " | " + f"{campus2.title()} {branch2.upper()}" + " |\n"
-        response += "|--------|" + "-" * (len(campus1) + len(branch1) + 1) + "|" + "-" * (len(campus2) + len(branch2) + 1) + "|\n"
-        response += f"| **Cutoff 2024** | {cutoff1} | {cutoff2} |\n"
+        parts.append(f"**DETAILED COMPARISON TABLE**\n\n")
+        parts.append(f"| Aspect | {campus1.title()} {branch1.upper()} | {campus2.title()} {branch2.upper()} |\n")
+        parts.append(f"|--------|{'-' * (len(campus1) + len(branch1) + 1)}|{'-' * (len(campus2) + len(branch2) + 1)}|\n")
+        parts.append(f"| **Cutoff 2024** | {cutoff1} | {cutoff2} |\n")
 
         # Add placement data if available
-        if branch1 in placement_data and branch2 in placement_data:
-            p1, p2 = placement_data[branch1], placement_data[branch2]
-            response += f"| **Avg Package** | ₹{p1['avg']}L | ₹{p2['avg']}L |\n"
-            response += f"| **Highest Package** | ₹{p1['highest']}L | ₹{p2['highest']}L |\n"
-            response += f"| **Top Companies** | {p1['top_companies'][:30]}... | {p2['top_companies'][:30]}... |\n"
-        elif branch1 in placement_data:
-            p1 = placement_data[branch1]
-            response += f"| **Avg Package** | ₹{p1['avg']}L | Data not available |\n"
-        elif branch2 in placement_data:
-            p2 = placement_data[branch2]
-            response += f"| **Avg Package** | Data not available | ₹{p2['avg']}L |\n"
-
-        response += f"| **Campus Vibe** | {campus_info[campus1]['vibe']} | {campus_info[campus2]['vibe']} |\n"
-        response += f"| **Pros** | {campus_info[campus1]['pros']} | {campus_info[campus2]['pros']} |\n"
-        response += f"| **Cons** | {campus_info[campus1]['cons']} | {campus_info[campus2]['cons']} |\n"
+        if branch1 in _PLACEMENT_DATA and branch2 in _PLACEMENT_DATA:
+            p1, p2 = _PLACEMENT_DATA[branch1], _PLACEMENT_DATA[branch2]
+            parts.append(f"| **Avg Package** | ₹{p1['avg']}L | ₹{p2['avg']}L |\n")
+            parts.append(f"| **Highest Package** | ₹{p1['highest']}L | ₹{p2['highest']}L |\n")
+            parts.append(f"| **Top Companies** | {p1['top_companies'][:30]}... | {p2['top_companies'][:30]}... |\n")
+        elif branch1 in _PLACEMENT_DATA:
+            p1 = _PLACEMENT_DATA[branch1]
+            parts.append(f"| **Avg Package** | ₹{p1['avg']}L | Data not available |\n")
+        elif branch2 in _PLACEMENT_DATA:
+            p2 = _PLACEMENT_DATA[branch2]
+            parts.append(f"| **Avg Package** | Data not available | ₹{p2['avg']}L |\n")
+
+        vibe1, pros1, cons1 = _CAMPUS_PROFILES[campus1]
+        vibe2, pros2, cons2 = _CAMPUS_PROFILES[campus2]
+        parts.append(f"| **Campus Vibe** | {vibe1} | {vibe2} |\n")
+        parts.append(f"| **Pros** | {pros1} | {pros2} |\n")
+        parts.append(f"| **Cons** | {cons1} | {cons2} |\n")
 
         # Analysis
-        response += f"\n**ANALYSIS:**\n"
+        parts.append(f"\n**ANALYSIS:**\n")
         if isinstance(cutoff1, int) and isinstance(cutoff2, int):
             diff = abs(cutoff1 - cutoff2)
             if cutoff1 > cutoff2:
-                response += f"• Cutoff difference: {campus1.title()} {branch1.upper()} is {diff} points higher\n"
-                response += f"• Competition: {campus1.title()} {branch1.upper()} is more competitive\n"
+                parts.append(f"• Cutoff difference: {campus1.title()} {branch1.upper()} is {diff} points higher\n")
+                parts.append(f"• Competition: {campus1.title()} {branch1.upper()} is more competitive\n")
             elif cutoff2 > cutoff1:
-                response += f"• Cutoff difference: {campus2.title()} {branch2.upper()} is {diff} points higher\n"
-                response += f"• Competition: {campus2.title()} {branch2.upper()} is more competitive\n"
+                parts.append(f"• Cutoff difference: {campus2.title()} {branch2.upper()} is {diff} points higher\n")
+                parts.append(f"• Competition: {campus2.title()} {branch2.upper()} is more competitive\n")
             else:
-                response += f"• Both have identical cutoffs - equally competitive\n"
+                parts.append(f"• Both have identical cutoffs - equally competitive\n")
 
         # Package comparison
-        if branch1 in placement_data and branch2 in placement_data:
-            p1, p2 = placement_data[branch1], placement_data[branch2]
+        if branch1 in _PLACEMENT_DATA and branch2 in _PLACEMENT_DATA:
+            p1, p2 = _PLACEMENT_DATA[branch1], _PLACEMENT_DATA[branch2]
             if p1['avg'] > p2['avg']:
-                response += f"• Package advantage: {branch1.upper()} has ₹{p1['avg'] - p2['avg']}L higher average\n"
+                parts.append(f"• Package advantage: {branch1.upper()} has ₹{p1['avg'] - p2['avg']}L higher average\n")
             elif p2['avg'] > p1['avg']:
-                response += f"• Package advantage: {branch2.upper()} has ₹{p2['avg'] - p1['avg']}L higher average\n"
+                parts.append(f"• Package advantage: {branch2.upper()} has ₹{p2['avg'] - p1['avg']}L higher average\n")
             else:
-                response += f"• Both branches have similar placement packages\n"
+                parts.append(f"• Both branches have similar placement packages\n")
 
         # Final verdict with humor
-        response += f"\n**VERDICT:**\n"
-        response += f"{self._get_random_humor('comparison_ending')}"
+        parts.append(f"\n**VERDICT:**\n")
+        parts.append(f"{self._get_random_humor('comparison_ending')}")
 
-        return response
+        return "".join(parts)
 
     def _get_random_humor(self, category):
         """Get random humorous lines for different categories - more unique and funny"""
-        humor_bank = {
-            'cutoff_ending': [
-                "Numbers don't define you, but they sure love to humble you daily.",
-                "Fun fact: Every BITS topper was once googling 'backup colleges' at 3 AM.",
-                "These cutoffs hit harder than reality after JEE results.",
-                "Cutoffs are like your ex - they keep rising when you least expect it.",
-                "Remember when 300 seemed impossible? Now it's barely enough for Civil.",
-                "BITSAT cutoffs: Making students question their life choices since 1964.",
-                "Plot twist: The real treasure was the anxiety we gained along the way.",
-                "Cutoffs rise faster than petrol prices and your parents' expectations."
-            ],
-            'comparison_ending': [
-                "Choose wisely - your future therapist will want to know why.",
-                "Both branches are great, but one will make you cry less during exams.",
-                "Pro tip: The branch doesn't matter if you're gonna bunk classes anyway.",
-                "Either way, you'll end up coding for a living. Welcome to reality.",
-                "Plot twist: Your branch choice matters less than your WiFi speed.",
-                "Remember: Every branch leads to the same destination - corporate slavery.",
-                "Fun fact: 90% of BITS students end up in IT regardless of branch.",
-                "Choose based on passion, not package. (Just kidding, choose package.)"
-            ],
-            'trend_ending': [
-                "Past trends are like weather forecasts - mostly wrong but oddly specific.",
-                "These trends change faster than your study schedule during exams.",
-                "Cutoff trends: The only graph that always goes up (unlike your marks).",
-                "Moral of the story: Start preparing yesterday, panic today.",
-                "Trends show cutoffs rising, but your motivation keeps falling.",
-                "Reality check: By the time you analyze trends, cutoffs have already moved.",
-                "These numbers are more unpredictable than your mood during prep.",
-                "Cutoff trends: Making students lose sleep since the dawn of time."
-            ],
-            'suggestion_ending': [
-                "Success is 10% college, 90% surviving the mess food.",
-                "Your branch matters less than your ability to handle all-nighters.",
-                "Every BITS student has a story - most involve crying in the library.",
-                "The best branch is the one where you can still maintain your sanity.",
-                "Plot twist: You'll forget your branch name after the first semester.",
-                "Reality check: All branches lead to the same placement companies.",
-                "Remember: BITS changes you, not the other way around.",
-                "Fun fact: Your branch choice will be irrelevant in 5 years anyway."
-            ],
-            'admission_ending': [
-                "Admission chances are like the weather - unpredictable and disappointing.",
-                "Your score is decent, but BITSAT cutoffs have trust issues.",
-                "Remember: Hope for the best, prepare for disappointment.",
-                "Admission probability: Somewhere between 'maybe' and 'start praying'.",
-                "Your chances look good, but so did your JEE prep schedule.",
-                "Plot twist: Sometimes miracles happen, sometimes they don't.",
-                "Keep calm and have backup plans. Lots of backup plans.",
-                "Admission is like love - you never know until you try."
-            ]
-        }
-
-        import random
-        return random.choice(humor_bank.get(category, ["Keep grinding, the struggle is real."]))
+        return random.choice(_HUMOR_BANK.get(category, _DEFAULT_HUMOR))
 
     def _get_random_greeting(self, author):
         """Get random humorous greetings with more personality"""
-        greetings = [
-            f"Arre {author}",
-            f"Dekh {author}",
-            f"Bhai {author}",
-            f"Listen {author}",
-            f"Alright {author}",
-            f"Yaar {author}",
-            f"Buddy {author}",
-            f"Dude {author}",
-            f"Mate {author}",
-            f"Boss {author}",
-            f"Champ {author}",
-            f"Kiddo {author}"
-        ]
-
-        import random
-        return random.choice(greetings)
+        return random.choice(_GREETING_TEMPLATES).format(author)
 
     def _generate_trend_response(self, author, query):
         """Generate trends/previous year response"""
         query_lower = query.lower()
 
-        # Comprehensive historical trend data (Official BITS Data - 2022-2024 confirmed)
-        trend_data = {
-            'cse': {
-                'pilani': {'2024': 327, '2023': 331, '2022': 320},
-                'goa': {'2024': 301, '2023': 295, '2022': 286},
-                'hyderabad': {'2024': 298, '2023': 284, '2022': 279}
-            },
-            'ece': {
-                'pilani': {'2024': 314, '2023': 296, '2022': 279},
-                'goa': {'2024': 287, '2023': 267, '2022': 256},
-                'hyderabad': {'2024': 284, '2023': 265, '2022': 252}
-            },
-            'eee': {
-                'pilani': {'2024': 292, '2023': 272, '2022': 258},
-                'goa': {'2024': 278, '2023': 252, '2022': 237},
-                'hyderabad': {'2024': 275, '2023': 251, '2022': 230}
-            },
-            'mechanical': {
-                'pilani': {'2024': 266, '2023': 244, '2022': 223},
-                'goa': {'2024': 254, '2023': 223, '2022': 191},
-                'hyderabad': {'2024': 251, '2023': 218, '2022': 182}
-            },
-            'chemical': {
-                'pilani': {'2024': 247, '2023': 224, '2022': 191},
-                'goa': {'2024': 239, '2023': 209, '2022': 165},
-                'hyderabad': {'2024': 238, '2023': 207, '2022': 162}
-            },
-            'civil': {
-                'pilani': {'2024': 238, '2023': 213, '2022': 167},
-                'hyderabad': {'2024': 235, '2023': 204, '2022': 158}
-            },
-            'mnc': {
-                'pilani': {'2024': 318, '2023': None, '2022': None},  # MnC added in 2024
-                'goa': {'2024': 295, '2023': None, '2022': None},
-                'hyderabad': {'2024': 293, '2023': None, '2022': None}
-            },
-            'eni': {
-                'pilani': {'2024': 282, '2023': 266, '2022': 249},
-                'goa': {'2024': 270, '2023': 244, '2022': 224},
-                'hyderabad': {'2024': 270, '2023': 244, '2022': 222}
-            },
-            'manufacturing': {
-                'pilani': {'2024': 243, '2023': 220, '2022': 184}
-            },
-            'pharmacy': {
-                'pilani': {'2024': 165, '2023': 153, '2022': 125},
-                'hyderabad': {'2024': 161, '2023': 135, '2022': 109}
-            },
-            'biology': {
-                'pilani': {'2024': 236, '2023': 212, '2022': 171},
-                'goa': {'2024': 234, '2023': 204, '2022': 164},
-                'hyderabad': {'2024': 234, '2023': 204, '2022': 158}
-            },
-            'physics': {
-                'pilani': {'2024': 254, '2023': 235, '2022': 214},
-                'goa': {'2024': 248, '2023': 222, '2022': 188},
-                'hyderabad': {'2024': 245, '2023': 219, '2022': 173}
-            },
-            'chemistry': {
-                'pilani': {'2024': 241, '2023': 213, '2022': 168},
-                'goa': {'2024': 236, '2023': 205, '2022': 163},
-                'hyderabad': {'2024': 235, '2023': 205, '2022': 160}
-            },
-            'mathematics': {
-                'pilani': {'2024': 256, '2023': 236, '2022': 214},
-                'goa': {'2024': 249, '2023': 221, '2022': 187},
-                'hyderabad': {'2024': 247, '2023': 219, '2022': 177}
-            },
-            'economics': {
-                'pilani': {'2024': 271, '2023': 257, '2022': 247},
-                'goa': {'2024': 263, '2023': 239, '2022': 230},
-                'hyderabad': {'2024': 261, '2023': 236, '2022': 220}
-            }
-        }
-
         # Universal branch detection for trends
         detected_branch = self._detect_branch_for_trends(query_lower)
 
         # Detect campus
-        detected_campus = None
-        if 'pilani' in query_lower:
-            detected_campus = 'pilani'
-        elif 'goa' in query_lower:
-            detected_campus = 'goa'
-        elif 'hyderabad' in query_lower or 'hyd' in query_lower:
-            detected_campus = 'hyderabad'
-
-        if detected_branch and detected_branch in trend_data:
-            response = f"**{author.upper()}, here are the {detected_branch.upper()} cutoff trends:**\n\n"
-
-            if detected_campus and detected_campus in trend_data[detected_branch]:
+        campus_match = _CAMPUS_MENTION_RE.search(query_lower)
+        detected_campus = _CAMPUS_KEYS[campus_match.lastindex - 1] if campus_match else None
+
+        if detected_branch and detected_branch in _TREND_BRANCHES:
+            if (detected_branch, detected_campus) in _TRENDS:
                 # Specific campus trend
-                campus_data = trend_data[detected_branch][detected_campus]
                 greeting = self._get_random_greeting(author)
-                response = f"**{greeting}, here are the {detected_campus.upper()} {detected_branch.upper()} cutoffs:**\n\n"
-
-                # First show the last 3 years cutoffs clearly
-                response += "**RECENT CUTOFFS (Last 3 Years)**\n\n"
-                response += "Year | Cutoff Score | Status\n"
-                response += "---|---|---\n"
-
-                years = sorted(campus_data.keys(), reverse=True)
-                recent_years = years[:3]  # Last 3 years
-
-                for year in recent_years:
-                    cutoff = campus_data[year]
-                    if cutoff is not None:
-                        status = "Latest" if year == years[0] else "Previous"
-                        response += f"{year} | **{cutoff}** | {status}\n"
-
-                # Then show detailed trend analysis
-                response += f"\n**DETAILED TREND ANALYSIS**\n\n"
-                response += "Year | Cutoff | Year-on-Year Change | Trend Pattern\n"
-                response += "---|---|---|---\n"
-
-                for i, year in enumerate(years):
-                    cutoff = campus_data[year]
-                    if cutoff is not None:
-                        if i < len(years) - 1:
-                            prev_year = years[i+1]
-                            prev_cutoff = campus_data[prev_year]
-                            if prev_cutoff is not None:
-                                change = cutoff - prev_cutoff
-                                change_str = f"+{change}" if change > 0 else str(change)
-                                if change > 15:
-                                    trend_desc = "Sharp Rise"
-                                elif change > 5:
-                                    trend_desc = "Rising"
-                                elif change > -5:
-                                    trend_desc = "Stable"
-                                elif change > -15:
-                                    trend_desc = "Falling"
-                                else:
-                                    trend_desc = "Sharp Fall"
-                            else:
-                                change_str = "-"
-                                trend_desc = "No data"
-                        else:
-                            change_str = "-"
-                            trend_desc = "Baseline year"
-
-                        response += f"{year} | {cutoff} | {change_str} | {trend_desc}\n"
-
-                # Calculate trends and predictions (using available data)
-                if '2024' in campus_data and '2022' in campus_data and campus_data['2022'] is not None:
-                    two_year_change = campus_data['2024'] - campus_data['2022']
-                    avg_change = two_year_change / 2
-                    response += f"\n**2-Year Trend (2022-2024):** +{two_year_change} points ({avg_change:.1f}/year average)\n"
-
-                    # 2025 Prediction based on recent trend
-                    predicted_2025 = campus_data['2024'] + int(avg_change)
-                    response += f"**2025 Prediction:** ~{predicted_2025} (±5 points)\n"
-                elif '2024' in campus_data and '2023' in campus_data and campus_data['2023'] is not None:
-                    one_year_change = campus_data['2024'] - campus_data['2023']
-                    response += f"\n**1-Year Change (2023-2024):** {one_year_change:+d} points\n"
-
-                    # Conservative prediction
-                    predicted_2025 = campus_data['2024'] + one_year_change
-                    response += f"**2025 Prediction:** ~{predicted_2025} (±7 points)\n"
-
+                parts = [f"**{greeting}, here are the {_CAMPUS_DISPLAY[detected_campus]} {detected_branch.upper()} cutoffs:**\n\n"]
+                parts.append(_trend_analysis(detected_branch, detected_campus))
             else:
                 # All campuses trend
-                response += f"**ALL CAMPUSES - {detected_branch.upper()}:**\n\n"
-                for campus in ['pilani', 'goa', 'hyderabad']:
-                    if campus in trend_data[detected_branch]:
-                        campus_data = trend_data[detected_branch][campus]
-                        current = campus_data['2024']
-                        if '2022' in campus_data and campus_data['2022'] is not None:
-                            old = campus_data['2022']
-                            change = current - old
-                            response += f"**{campus.upper()}:** {old} → {current} (+{change} in 2 years)\n"
-                        elif '2023' in campus_data and campus_data['2023'] is not None:
-                            old = campus_data['2023']
-                            change = current - old
-                            response += f"**{campus.upper()}:** {old} → {current} ({change:+d} in 1 year)\n"
-                        else:
-                            response += f"**{campus.upper()}:** {current} (2024 data)\n"
-
-                response += f"\n**Overall Pattern:** Most branches rising 3-15 points per year\n"
+                parts = [f"**{author.upper()}, here are the {detected_branch.upper()} cutoff trends:**\n\n"]
+                parts.append(_trend_analysis(detected_branch, None))
 
             # Add prediction
-            response += f"\n**2025 Prediction:** Expect 3-8 point increase based on recent trends\n"
-            response += f"**Reality Check:** Trends can change based on difficulty & applications!\n\n"
+            parts.append(f"\n**2025 Prediction:** Expect 3-8 point increase based on recent trends\n")
+            parts.append(f"**Reality Check:** Trends can change based on difficulty & applications!\n\n")
 
             # Add humor
-            humor_lines = [
-                "Remember: Past performance doesn't guarantee future results!",
-                "Cutoffs go up faster than your motivation during prep!",
-                "Plot twist: Work hard enough and trends won't matter!",
-                "These trends are scarier than horror movies!"
-            ]
-            import random
-            response += random.choice(humor_lines)
+            parts.append(random.choice(_TREND_HUMOR_LINES))
 
         else:
             # Comprehensive trend response showing all available branches
-            response = f"**{author}, I can show cutoff trends for ALL branches:**\n\n"
-            response += "**High-Demand Branches:**\n"
-            response += "• CSE, ECE, EEE, MnC (Math & Computing)\n\n"
-            response += "**Core Engineering:**\n"
-            response += "• Mechanical, Chemical, Civil, ENI, Manufacturing\n\n"
-            response += "**M.Sc Programs:**\n"
-            response += "• Mathematics, Physics, Chemistry, Biology, Economics\n\n"
-            response += "**Other Programs:**\n"
-            response += "• Pharmacy\n\n"
-            response += "**Usage Examples:**\n"
-            response += "• *'CSE cutoff trends'* - for all campuses\n"
-            response += "• *'Mechanical trends pilani'* - for specific campus\n"
-            response += "• *'M.Sc Physics previous year cutoffs'*\n\n"
-            response += "**General Trend:** Most cutoffs rising 4-7 points annually!\n"
-            response += "**2025 Prediction:** Expect continued upward trend!"
-
-        return response
+            parts = [f"**{author}, I can show cutoff trends for ALL branches:**\n\n"]
+            parts.append("**High-Demand Branches:**\n")
+            parts.append("• CSE, ECE, EEE, MnC (Math & Computing)\n\n")
+            parts.append("**Core Engineering:**\n")
+            parts.append("• Mechanical, Chemical, Civil, ENI, Manufacturing\n\n")
+            parts.append("**M.Sc Programs:**\n")
+            parts.append("• Mathematics, Physics, Chemistry, Biology, Economics\n\n")
+            parts.append("**Other Programs:**\n")
+            parts.append("• Pharmacy\n\n")
+            parts.append("**Usage Examples:**\n")
+            parts.append("• *'CSE cutoff trends'* - for all campuses\n")
+            parts.append("• *'Mechanical trends pilani'* - for specific campus\n")
+            parts.append("• *'M.Sc Physics previous year cutoffs'*\n\n")
+            parts.append("**General Trend:** Most cutoffs rising 4-7 points annually!\n")
+            parts.append("**2025 Prediction:** Expect continued upward trend!")
+
+        return "".join(parts)
 
     def _generate_suggestion_response(self, author, query):
         """Generate detailed, accurate and informative suggestions based on user query"""
         query_lower = query.lower()
 
         # Extract score if mentioned
-        import re
-        score_match = re.search(r'\b(\d{2,3})\b', query_lower)
+        score_match = _SCORE_RE.search(query_lower)
         user_score = int(score_match.group(1)) if score_match else None
 
         if user_score:
             greeting = self._get_random_greeting(author)
-            response = f"**{greeting}, here's your detailed roadmap for {user_score}/390:**\n\n"
-
-            if user_score >= 330:
-                response += "**EXCEPTIONAL SCORE - TOP 0.5% TERRITORY**\n\n"
-                response += "| Branch | Campus | Probability | Package Range | Why Choose |\n"
-                response += "|--------|--------|-------------|---------------|------------|\n"
-                response += "| CSE | Pilani | 100% | ₹25-65L | Ultimate prestige, best alumni network |\n"
-                response += "| CSE | Goa/Hyd | 100% | ₹24-60L | Excellent academics, better lifestyle |\n"
-                response += "| ECE | Pilani | 100% | ₹22-55L | Hardware+software, VLSI opportunities |\n"
-                response += "| MnC | Any | 100% | ₹24-60L | Finance+tech combo, quant roles |\n\n"
-                response += "**STRATEGIC ADVICE:**\n"
-                response += "• Primary choice: Pilani CSE (if you want maximum prestige)\n"
-                response += "• Lifestyle choice: Goa CSE (beach campus, relaxed environment)\n"
-                response += "• Unique option: MnC (emerging field, finance sector opportunities)\n"
-                response += "• Reality check: You can literally choose based on campus preference\n\n"
-
-            elif user_score >= 315:
-                response += "**EXCELLENT SCORE - TOP 1% CATEGORY**\n\n"
-                response += "| Branch | Campus | Probability | Package Range | Strategy |\n"
-                response += "|--------|--------|-------------|---------------|----------|\n"
-                response += "| CSE | Pilani | 85% | ₹25-65L | Stretch goal, worth the risk |\n"
-                response += "| CSE | Goa/Hyd | 100% | ₹24-60L | Very safe, excellent choice |\n"
-                response += "| ECE | Pilani | 100% | ₹22-55L | Safe backup, great prospects |\n"
-                response += "| MnC | Any | 100% | ₹24-60L | Unique path, finance opportunities |\n\n"
-                response += "**RECOMMENDED STRATEGY:**\n"
-                response += "• First preference: CSE at all campuses (Pilani is achievable)\n"
-                response += "• Safe backup: ECE Pilani (guaranteed admission)\n"
-                response += "• Consider: MnC if interested in finance+tech combination\n"
-                response += "• Campus tip: Goa offers best work-life balance\n\n"
-
-            elif user_score >= 300:
-                response += "**GREAT SCORE - MULTIPLE EXCELLENT OPTIONS**\n\n"
-                response += "**ADMISSION PROBABILITY ANALYSIS**\n\n"
-                response += "Branch | Campus | Cutoff 2024 | Your Score | Admission Chance | Risk Level\n"
-                response += "---|---|---|---|---|---\n"
-                response += f"CSE | Goa | 301 | {user_score} | 95% | Very Low\n"
-                response += f"CSE | Hyderabad | 298 | {user_score} | 98% | Very Low\n"
-                response += f"CSE | Pilani | 327 | {user_score} | 60% | Moderate\n"
-                response += f"ECE | Pilani | 314 | {user_score} | 100% | None\n"
-                response += f"ECE | Goa/Hyd | 287/284 | {user_score} | 100% | None\n"
-                response += f"MnC | Any | 318/295/293 | {user_score} | 100% | None\n\n"
-
-                response += "**PLACEMENT & CAREER PROSPECTS**\n\n"
-                response += "| Branch | Avg Package | Median | Highest | Top Companies | Career Growth |\n"
-                response += "|--------|-------------|--------|---------|---------------|---------------|\n"
-                response += "| CSE | ₹28L | ₹22L | ₹65L | Google, Microsoft, Amazon | Excellent |\n"
-                response += "| ECE | ₹24L | ₹18L | ₹55L | Intel, Qualcomm, Samsung | Very Good |\n"
-                response += "| MnC | ₹26L | ₹20L | ₹60L | Goldman Sachs, JP Morgan | Excellent |\n\n"
-
-                response += "**STRATEGIC RECOMMENDATIONS:**\n"
-                response += "• **Primary Strategy:** Apply CSE at all campuses, ECE Pilani as guaranteed backup\n"
-                response += "• **Pilani CSE:** Achievable but competitive - you're 27 points above cutoff\n"
-                response += "• **Safe Choices:** CSE Goa/Hyd (very high probability), ECE Pilani (guaranteed)\n"
-                response += "• **Hidden Gem:** MnC if you're strong in math - finance sector loves this combo\n"
-                response += "• **Campus Decision:** Pilani (prestige) vs Goa (lifestyle) vs Hyderabad (modern)\n\n"
-
-            elif user_score >= 285:
-                response += "**SOLID SCORE - GOOD ENGINEERING OPTIONS**\n\n"
-                response += "**ADMISSION ANALYSIS BY BRANCH**\n\n"
-                response += "| Branch | Campus | Cutoff 2024 | Gap | Admission Chance | Recommendation |\n"
-                response += "|--------|--------|-------------|-----|------------------|----------------|\n"
-                response += f"| ECE | Goa | 287 | +{user_score-287} | 95% | Excellent choice |\n"
-                response += f"| ECE | Hyderabad | 284 | +{user_score-284} | 98% | Very safe option |\n"
-                response += f"| ECE | Pilani | 314 | {user_score-314} | 70% | Stretch but possible |\n"
-                response += "| EEE | All campuses | 292/278/275 | Positive | 100% | Guaranteed admission |\n"
-                response += "| ENI | All campuses | 282/270/270 | Positive | 100% | Emerging field |\n"
-                response += "| MnC | Goa/Hyd | 295/293 | {user_score-295} | 85% | High-reward option |\n\n"
-
-                response += "**CAREER PROSPECTS & PACKAGES**\n\n"
-                response += "| Branch | Industry Focus | Avg Package | Job Security | Growth Potential |\n"
-                response += "|--------|----------------|-------------|--------------|------------------|\n"
-                response += "| ECE | Hardware+Software | ₹24L | High | Excellent |\n"
-                response += "| EEE | Power & Electronics | ₹18L | Very High | Good |\n"
-                response += "| ENI | Automation & Control | ₹18L | High | Very Good |\n"
-                response += "| MnC | Finance+Tech | ₹26L | High | Excellent |\n\n"
-
-                response += "**STRATEGIC RECOMMENDATIONS:**\n"
-                response += "• **Primary Target:** ECE Goa/Hyd (high probability, excellent prospects)\n"
-                response += "• **Stretch Goal:** ECE Pilani (you're 29 points below, but trends vary)\n"
-                response += "• **Safe Backup:** EEE at any campus (guaranteed, underrated branch)\n"
-                response += "• **Unique Option:** ENI (instrumentation + IoT focus, growing demand)\n"
-                response += "• **High Reward:** MnC if math is your strength (finance sector premium)\n\n"
-
-            elif user_score >= 270:
-                response += "**DECENT SCORE - CORE ENGINEERING TERRITORY**\n\n"
-                response += "| Branch | Campus | Probability | Package Range | Industry Demand |\n"
-                response += "|--------|--------|-------------|---------------|----------------|\n"
-                response += "| EEE | All | 100% | ₹16-45L | Power sector, government jobs |\n"
-                response += "| Mechanical | All | 95% | ₹14-40L | Most versatile, evergreen demand |\n"
-                response += "| ENI | All | 100% | ₹18-40L | Process control, automation |\n"
-                response += "| Chemical | Goa/Hyd | 85% | ₹15-42L | Process industries, research |\n"
-                response += "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, analytics |\n\n"
-                response += "**STRATEGIC INSIGHTS:**\n"
-                response += "• Reality check: Core engineering branches are undervalued but solid\n"
-                response += "• EEE advantage: Government sector opportunities, PSU placements\n"
-                response += "• Mechanical truth: Most versatile branch, opportunities everywhere\n"
-                response += "• Chemical prospects: Specialized roles, higher packages in specific sectors\n"
-                response += "• M.Sc option: Economics is excellent for policy/consulting careers\n"
-                response += "• Long-term view: Core branches often have better job security\n\n"
-
-            elif user_score >= 250:
-                response += "**MODERATE SCORE - STRATEGIC CHOICES NEEDED**\n\n"
-                response += "| Branch | Campus | Probability | Package Range | Career Path |\n"
-                response += "|--------|--------|-------------|---------------|-------------|\n"
-                response += "| Mechanical | All | 90% | ₹14-40L | Manufacturing, automotive, aerospace |\n"
-                response += "| Chemical | All | 85% | ₹15-42L | Process industries, pharma, oil&gas |\n"
-                response += "| Civil | Pilani/Hyd | 95% | ₹12-35L | Infrastructure, construction, govt |\n"
-                response += "| M.Sc Math | All | 100% | ₹15-50L | Finance, data science, research |\n"
-                response += "| M.Sc Physics | All | 100% | ₹14-45L | Research, tech, academia |\n"
-                response += "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, banking |\n\n"
-                response += "**DETAILED GUIDANCE:**\n"
-                response += "• Engineering reality: Core branches offer solid, stable careers\n"
-                response += "• Mechanical advantage: Broadest scope, can work in any industry\n"
-                response += "• Chemical prospects: Specialized knowledge, good in process industries\n"
-                response += "• M.Sc surprise: Often better placement outcomes than expected\n"
-                response += "• Math M.Sc secret: Finance sector loves math graduates (₹15-50L range)\n"
-                response += "• Physics M.Sc path: Research → PhD → Academia or tech industry\n"
-                response += "• Economics M.Sc: Policy research, think tanks, consulting firms\n\n"
-
-            elif user_score >= 230:
-                response += "**CHALLENGING SCORE - M.Sc PROGRAMS SHINE**\n\n"
-                response += "| Program | Campus | Probability | Package Range | Career Trajectory |\n"
-                response += "|---------|--------|-------------|---------------|-------------------|\n"
-                response += "| M.Sc Mathematics | All | 100% | ₹15-50L | Finance, data science, quant roles |\n"
-                response += "| M.Sc Physics | All | 100% | ₹14-45L | Research, tech companies, academia |\n"
-                response += "| M.Sc Chemistry | All | 100% | ₹13-40L | Pharma, research, chemical industry |\n"
-                response += "| M.Sc Biology | All | 100% | ₹12-38L | Biotech, pharma, research |\n"
-                response += "| M.Sc Economics | All | 100% | ₹12-35L | Policy, consulting, banking |\n"
-                response += "| Pharmacy | Pilani/Hyd | 90% | ₹10-30L | Pharma industry, regulatory affairs |\n\n"
-                response += "**M.Sc PROGRAM INSIGHTS:**\n"
-                response += "• Hidden truth: M.Sc students often outperform B.E. in placements\n"
-                response += "• Mathematics advantage: Quant roles in finance (₹20-50L packages)\n"
-                response += "• Physics pathway: Research → tech companies → high packages\n"
-                response += "• Chemistry prospects: Pharma R&D, process development\n"
-                response += "• Biology future: Biotech boom, pharmaceutical research\n"
-                response += "• Economics scope: Policy research, economic consulting\n"
-                response += "• Dual degree option: M.Sc → M.E. (5-year integrated program)\n\n"
+            parts = [f"**{greeting}, here's your detailed roadmap for {user_score}/390:**\n\n"]
 
-            else:
-                response += "**BELOW 230 - ALTERNATIVE STRATEGIES**\n\n"
-                response += "| Option | Probability | Package Range | Strategic Advice |\n"
-                response += "|--------|-------------|---------------|------------------|\n"
-                response += "| M.Sc Programs | 70% | ₹10-35L | Still possible, worth trying |\n"
-                response += "| Pharmacy | 60% | ₹8-25L | Specialized field, decent prospects |\n"
-                response += "| Other Colleges | 100% | ₹8-30L | VIT, SRM, Manipal - good alternatives |\n"
-                response += "| Drop Year | - | Future potential | Prepare better, try again |\n\n"
-                response += "**REALISTIC ASSESSMENT:**\n"
-                response += "• BITS reality: Might be challenging with current score\n"
-                response += "• M.Sc option: Still worth applying, cutoffs can vary\n"
-                response += "• Alternative colleges: VIT, SRM, Manipal offer good programs\n"
-                response += "• Drop year consideration: If BITS is your dream, prepare better\n"
-                response += "• Important reminder: Success depends more on effort than college\n"
-                response += "• Career truth: Many successful people didn't go to top colleges\n\n"
+            band = bisect.bisect_right(_SUGGESTION_SCORE_THRESHOLDS, user_score)
+            parts.append(_SUGGESTION_SCORE_BODIES[band].format(
+                score=user_score,
+                ece_goa_gap=user_score - 287,
+                ece_hyd_gap=user_score - 284,
+                ece_pilani_gap=user_score - 314
+            ))
 
         else:
             # General suggestions without score
             if 'branch' in query_lower or 'choose' in query_lower:
-                response = f"**{author}, here's how to choose the right branch:**\n\n"
-                response += "**High Demand (Competitive):**\n"
-                response += "• CSE: Software, tech companies, highest packages\n"
-                response += "• ECE: Hardware + software, versatile\n\n"
-                response += "**Core Engineering (Stable):**\n"
-                response += "• Mechanical: Broad applications, evergreen\n"
-                response += "• EEE: Power sector, government jobs\n"
-                response += "• Chemical: Process industries, good packages\n\n"
-                response += "**M.Sc Programs (Underrated):**\n"
-                response += "• Math/Physics: Research, academia, finance\n"
-                response += "• Economics: Policy, consulting, analytics\n\n"
-                response += "**Golden Rule:** Choose based on interest, not just cutoffs!"
+                parts = [f"**{author}, here's how to choose the right branch:**\n\n", _SUGGESTION_BRANCH_GUIDE]
 
             elif 'campus' in query_lower:
-                response = f"**{author}, here's the campus breakdown:**\n\n"
-                response += "**PILANI (The OG):**\n"
-                response += "• Prestige factor, alumni network\n"
-                response += "• Traditional campus culture\n"
-                response += "• Harsh weather (extreme hot/cold)\n\n"
-                response += "**GOA (The Chill):**\n"
-                response += "• Best weather, beach vibes\n"
-                response += "• Relaxed atmosphere\n"
-                response += "• Great for work-life balance\n\n"
-                response += "**HYDERABAD (The Modern):**\n"
-                response += "• Newest campus, modern facilities\n"
-                response += "• Tech city advantages\n"
-                response += "• Growing industry connections\n\n"
-                response += "**Truth:** All campuses have excellent academics!"
+                parts = [f"**{author}, here's the campus breakdown:**\n\n", _SUGGESTION_CAMPUS_GUIDE]
 
             else:
-                response = f"**{author}, I can help you with:**\n\n"
-                response += "**Score-based suggestions:**\n"
-                response += "• *'I got 285 marks, suggest branches'*\n\n"
-                response += "**Branch selection:**\n"
-                response += "• *'Help me choose branch'*\n\n"
-                response += "**Campus selection:**\n"
-                response += "• *'Which campus should I choose'*\n\n"
-                response += "**Pro Tip:** Mention your score for personalized advice!"
+                parts = [f"**{author}, I can help you with:**\n\n", _SUGGESTION_HELP]
 
         # Add motivational ending
-        motivational_endings = [
-            "\n\nRemember: Success is 10% college, 90% your effort!",
-            "\n\nYour journey matters more than your destination!",
-            "\n\nEvery BITS student has a success story - write yours!",
-            "\n\nThe best branch is the one that excites you every morning!"
-        ]
-
-        import random
-        response += random.choice(motivational_endings)
+        parts.append(random.choice(_SUGGESTION_ENDINGS))
 
-        return response
+        return "".join(parts)
 
-    def _format_cutoff_response(self, author, cutoff_data, specific_branch, specific_campus):
+    def _format_cutoff_response(self, author, specific_branch, specific_campus):
         """Format the cutoff response based on query specificity"""
 
         # Dark and funny intros based on query type
         greeting = self._get_random_greeting(author)
         if specific_branch and specific_campus:
-            intros = [
-                f"{greeting} {specific_branch.upper()} at {specific_campus.upper()}? Time for some brutal honesty",
-                f"{greeting} {specific_branch.upper()} {specific_campus.upper()} cutoff? Prepare for emotional damage",
-                f"{greeting} {specific_campus.upper()} {specific_branch.upper()} ka scene - reality check incoming",
-                f"{greeting} {specific_branch.upper()} for {specific_campus.upper()}? Here's your dose of harsh truth",
-                f"{greeting} {specific_campus.upper()} {specific_branch.upper()} numbers? Brace for impact",
-                f"{greeting} {specific_branch.upper()} at {specific_campus.upper()}? Hold onto your dreams"
-            ]
+            intros = _CUTOFF_INTROS_BRANCH_CAMPUS
         elif specific_branch:
-            intros = [
-                f"Arre {author}, {specific_branch.upper()} cutoffs? Time to crush some dreams across campuses",
-                f"Yo {author}! {specific_branch.upper()} ka complete destruction across all campuses",
-                f"Dekh {author}, {specific_branch.upper()} cutoffs - campus wise reality slap",
-                f"Bhai {author}, {specific_branch.upper()} ke liye sabhi campus ka brutal data"
-            ]
+            intros = _CUTOFF_INTROS_BRANCH
         elif specific_campus:
-            intros = [
-                f"Arre {author}, {specific_campus.upper()} campus? Prepare for complete emotional devastation",
-                f"Yo {author}! {specific_campus.upper()} campus - all branches reality check",
-                f"Dekh {author}, {specific_campus.upper()} ka complete cutoff massacre",
-                f"Bhai {author}, {specific_campus.upper()} campus cutoffs - full destruction mode"
-            ]
+            intros = _CUTOFF_INTROS_CAMPUS
         else:
-            intros = [
-                f"Arre {author}, complete BITSAT cutoff data? RIP your mental peace",
-                f"Yo {author}! Full cutoff breakdown? Time for existential crisis",
-                f"Dekh {author}, complete BITSAT cutoff apocalypse incoming",
-                f"Bhai {author}, comprehensive cutoff data - prepare for trauma"
-            ]
+            intros = _CUTOFF_INTROS_GENERAL
 
-        # Campus descriptions
-        campus_info = {
-            'pilani': ('**PILANI CAMPUS**', 'OG campus vibes'),
-            'goa': ('**GOA CAMPUS**', 'Beach life + studies'),
-            'hyderabad': ('**HYDERABAD CAMPUS**', 'Tech city energy')
-        }
-
-        response = random.choice(intros) + ":\n\n"
-
-        # Specific branch query
-        if specific_branch:
-            if specific_campus:
-                # Specific branch + campus - TABLE FORMAT
-                score = cutoff_data[specific_campus].get(specific_branch, 'N/A')
-                campus_emoji, campus_desc = campus_info[specific_campus]
-                response += f"{campus_emoji}\n*{campus_desc}*\n\n"
-
-                response += "| Branch | Campus | Cutoff Score |\n"
-                response += "|--------|--------|-------------|\n"
-                response += f"| {specific_branch.upper()} | {specific_campus.title()} | **{score}/390** |\n\n"
-            else:
-                # Specific branch, all campuses - TABLE FORMAT
-                response += f"**{specific_branch.upper()} CUTOFFS ACROSS CAMPUSES:**\n\n"
-                response += "| Campus | Cutoff Score |\n"
-                response += "|--------|-------------|\n"
-
-                campus_names = {'pilani': 'Pilani', 'goa': 'Goa', 'hyderabad': 'Hyderabad'}
-                for campus in ['pilani', 'goa', 'hyderabad']:
-                    score = cutoff_data[campus].get(specific_branch, 'N/A')
-                    if score != 'N/A':
-                        response += f"| {campus_names[campus]} | **{score}/390** |\n"
-                response += "\n"
-
-        # Specific campus query - TABLE FORMAT
-        elif specific_campus:
-            campus_emoji, campus_desc = campus_info[specific_campus]
-            response += f"{campus_emoji}\n*{campus_desc}*\n\n"
-
-            response += "| Branch | Cutoff Score |\n"
-            response += "|--------|-------------|\n"
-
-            # Group branches by type with proper display names
-            engineering_branches = [
-                ('computer science', 'CSE'),
-                ('electronics and communication', 'ECE'),
-                ('electrical and electronics', 'EEE'),
-                ('mechanical', 'Mechanical'),
-                ('chemical', 'Chemical'),
-                ('civil', 'Civil'),
-                ('manufacturing', 'Manufacturing'),
-                ('mathematics and computing', 'Math & Computing'),
-                ('electronics and instrumentation', 'Instrumentation')
-            ]
-
-            science_branches = [
-                ('biological sciences', 'Biology (M.Sc)'),
-                ('chemistry msc', 'Chemistry (M.Sc)'),
-                ('mathematics msc', 'Mathematics (M.Sc)'),
-                ('economics', 'Economics (M.Sc)'),
-                ('physics', 'Physics (M.Sc)')
-            ]
-
-            pharmacy_branches = [
-                ('pharmacy', 'Pharmacy')
-            ]
-
-            # Add engineering branches to table
-            for branch_key, display_name in engineering_branches:
-                if branch_key in cutoff_data[specific_campus]:
-                    score = cutoff_data[specific_campus][branch_key]
-                    response += f"| {display_name} | **{score}/390** |\n"
-
-            # Add science branches to table
-            for branch_key, display_name in science_branches:
-                if branch_key in cutoff_data[specific_campus]:
-                    score = cutoff_data[specific_campus][branch_key]
-                    response += f"| {display_name} | **{score}/390** |\n"
-
-            # Add pharmacy to table
-            for branch_key, display_name in pharmacy_branches:
-                if branch_key in cutoff_data[specific_campus]:
-                    score = cutoff_data[specific_campus][branch_key]
-                    response += f"| {display_name} | **{score}/390** |\n"
-
-            response += "\n"
-
-        # General query - show ALL branches from ALL campuses - CLEAN TABLE FORMAT
-        else:
-            response += "**BITSAT 2024-25 CUTOFFS - ALL BRANCHES**\n\n"
-
-            # Create a clean comprehensive table
-            response += "| Branch | Pilani | Goa | Hyderabad | Type |\n"
-            response += "|--------|--------|-----|-----------|------|\n"
-
-            # All branches with proper display names
-            all_branches = [
-                ('computer science', 'CSE'),
-                ('electronics and communication', 'ECE'),
-                ('electrical and electronics', 'EEE'),
-                ('mechanical', 'Mechanical'),
-                ('chemical', 'Chemical'),
-                ('civil', 'Civil'),
-                ('manufacturing', 'Manufacturing'),
-                ('mathematics and computing', 'Math & Computing'),
-                ('electronics and instrumentation', 'Instrumentation'),
-                ('biological sciences', 'Biology (M.Sc)'),
-                ('chemistry msc', 'Chemistry (M.Sc)'),
-                ('mathematics msc', 'Mathematics (M.Sc)'),
-                ('economics', 'Economics (M.Sc)'),
-                ('physics', 'Physics (M.Sc)'),
-                ('pharmacy', 'Pharmacy')
-            ]
-
-            # Add program type to branches
-            branch_types = {
-                'computer science': 'B.E.', 'electronics and communication': 'B.E.', 'electrical and electronics': 'B.E.',
-                'mechanical': 'B.E.', 'chemical': 'B.E.', 'civil': 'B.E.', 'manufacturing': 'B.E.',
-                'mathematics and computing': 'B.E.', 'electronics and instrumentation': 'B.E.',
-                'biological sciences': 'M.Sc', 'chemistry msc': 'M.Sc', 'mathematics msc': 'M.Sc',
-                'economics': 'M.Sc', 'physics': 'M.Sc', 'pharmacy': 'B.Pharm'
-            }
-
-            for branch_key, display_name in all_branches:
-                pilani_score = cutoff_data['pilani'].get(branch_key, '-')
-                goa_score = cutoff_data['goa'].get(branch_key, '-')
-                hyd_score = cutoff_data['hyderabad'].get(branch_key, '-')
-
-                # Only show row if at least one campus has this branch
-                if pilani_score != '-' or goa_score != '-' or hyd_score != '-':
-                    # Clean format without excessive bold
-                    pilani_display = str(pilani_score) if pilani_score != '-' else '-'
-                    goa_display = str(goa_score) if goa_score != '-' else '-'
-                    hyd_display = str(hyd_score) if hyd_score != '-' else '-'
-                    program_type = branch_types.get(branch_key, 'B.E.')
-
-                    response += f"| {display_name} | {pilani_display} | {goa_display} | {hyd_display} | {program_type} |\n"
+        intro = random.choice(intros).format(
+            greeting=greeting,
+            author=author,
+            branch=specific_branch.upper() if specific_branch else '',
+            campus=_CAMPUS_DISPLAY[specific_campus] if specific_campus else ''
+        )
+        parts = [f"{intro}:\n\n"]
 
-            response += "\n*All scores are out of 390*\n\n"
+        parts.append(_cutoff_table(specific_branch, specific_campus))
 
         # Use random humorous ending
         ending = self._get_random_humor('cutoff_ending')
 
-        response += f"\n{ending}\n"
+        parts.append(f"\n{ending}\n")
 
         # Add sassy italic message about max marks
-        sassy_messages = [
-            "*Though max marks are 426, I don't think you're skilled enough to reach there, so 390 is the realistic ceiling for you*",
-            "*While the paper is out of 426, let's be honest - 390 is probably your upper limit anyway*",
-            "*Maximum possible is 426, but considering your preparation level, 390 seems more achievable*",
-            "*The exam goes up to 426 marks, but realistically speaking, 390 is where most mortals peak*",
-            "*Just so you know, 426 is the theoretical max, but 390 is the practical reality for people like us*"
-        ]
+        parts.append(f"\n{random.choice(_MAX_MARKS_QUIPS)}\n")
+        parts.append(f"\nMore detailed info: https://www.bitsadmission.com/FD/BITSAT_cutoffs.html?06012025")
 
-        response += f"\n{random.choice(sassy_messages)}\n"
-        response += f"\nMore detailed info: https://www.bitsadmission.com/FD/BITSAT_cutoffs.html?06012025"
+        return "".join(parts)
 
-        # Reset random seed
-        random.seed()
+    def _rate_limit_delay(self, error):
+        """Seconds to wait after a rate-limit error: the wait Reddit stated (Retry-After header or
+        RATELIMIT message) if any, else jittered exponential backoff starting at _BACKOFF_INITIAL
+        """
+        response = getattr(error, 'response', None)
+        retry_after = getattr(response, 'headers', {}).get('retry-after')
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = _ratelimit_wait(error)
+            if delay is None:
+                delay = self._backoff * random.uniform(1.0, 1.5)
+        self._backoff = min(self._backoff * 2, _BACKOFF_MAX)
+        return delay
+
+    def _wait_for_reply_slot(self):
+        """Block until the reply token bucket holds a token, then spend it"""
+        now = time.monotonic()
+        self._reply_tokens = min(1.0, self._reply_tokens + (now - self._reply_last) * self._reply_rate)
+        self._reply_last = now
+        if self._reply_tokens < 1.0:
+            time.sleep((1.0 - self._reply_tokens) / self._reply_rate)
+            self._reply_tokens = 1.0
+            self._reply_last = time.monotonic()
+        self._reply_tokens -= 1.0
+
+    def _thread_flags(self, comment):
+        """(locked, archived) for a comment and its thread; the thread's flags are looked up
+        at most once per thread every _THREAD_FLAGS_TTL seconds
+        """
+        now = time.monotonic()
+        cached = self._thread_flags_cache.get(comment.link_id)
+        if cached and now - cached[0] < _THREAD_FLAGS_TTL:
+            thread_locked, thread_archived = cached[1], cached[2]
+        else:
+            # A single /api/info lookup instead of refresh() re-downloading the whole tree
+            submission = next(self.reddit.info(fullnames=[comment.link_id]), None)
+            thread_locked = getattr(submission, 'locked', False)
+            thread_archived = getattr(submission, 'archived', False)
+
+            # Entries are kept in check order, so expired ones are all at the front
+            self._thread_flags_cache.pop(comment.link_id, None)
+            while self._thread_flags_cache and now - next(iter(self._thread_flags_cache.values()))[0] >= _THREAD_FLAGS_TTL:
+                self._thread_flags_cache.popitem(last=False)
+            self._thread_flags_cache[comment.link_id] = (now, thread_locked, thread_archived)
+
+        # The streamed comment carries its own flags, which apply to it alone
+        locked = getattr(comment, 'locked', False) or thread_locked
+        archived = getattr(comment, 'archived', False) or thread_archived
+        return locked, archived
+
+    def _remember_comment(self, comment_id):
+        """Record a replied-to comment, evicting the oldest ids beyond the cap"""
+        self.processed_comments[comment_id] = None
+        if len(self.processed_comments) > _PROCESSED_COMMENTS_LIMIT:
+            self.processed_comments.popitem(last=False)
 
-        return response
-    
     def process_comments(self):
         """Process new comments in the subreddit and monitor DMs"""
         processed_messages = set()
@@ -2114,72 +2311,78 @@ class BITSATBot:
 
             # Skip old comments, only monitor new ones
             logger.info("Starting to monitor new comments only...")
-            for comment in self.subreddit.stream.comments(skip_existing=True):
+            # After _STREAM_PAUSE_AFTER backed-off empty polls the stream yields None,
+            # so the active-hours check below still runs on a quiet subreddit
+            for comment in self.subreddit.stream.comments(skip_existing=True, pause_after=_STREAM_PAUSE_AFTER):
                 # Check time during stream (bot will exit if inactive)
                 if not self._is_active_hours():
-                    ist = pytz.timezone('Asia/Kolkata')
-                    current_time_ist = datetime.now(ist)
+                    current_time_ist = datetime.now(self._ist)
                     current_time = current_time_ist.strftime("%H:%M IST")
                     current_hour = current_time_ist.hour
-                    logger.info(f"STREAM SHUTDOWN: Reached inactive hours at {current_time} (hour {current_hour})")
+                    logger.info("STREAM SHUTDOWN: Reached inactive hours at %s (hour %s)", current_time, current_hour)
                     logger.info("Exiting comment stream to save Railway hours")
                     break
 
-                if self.should_respond(comment):
-                    response = self.generate_response(comment)
+                if comment is None:
+                    continue
+
+                route = self.should_respond(comment)
+                if route:
+                    response = self.generate_response(comment, route)
 
                     try:
+                        self._wait_for_reply_slot()
                         comment.reply(response)
-                        logger.info(f"Replied to comment {comment.id} by {comment.author.name}")
-                        self.processed_comments.add(comment.id)
-
-                        # Reduced delay for faster responses
-                        time.sleep(random.uniform(5, 15))
+                        logger.info("Replied to comment %s by %s", comment.id, comment.author.name)
+                        self._remember_comment(comment.id)
+                        self._backoff = _BACKOFF_INITIAL
+                        self._reply_rate = min(self._reply_rate + _REPLY_RATE_STEP, _REPLY_RATE_MAX)
 
                     except Exception as e:
-                        error_msg = str(e).lower()
-                        if "403" in error_msg or "forbidden" in error_msg:
-                            logger.error(f"403 FORBIDDEN - Failed to reply to comment {comment.id}: {e}")
-                            logger.error("Possible causes:")
-                            logger.error("1. Bot account might be shadowbanned or restricted")
-                            logger.error("2. Subreddit restrictions on new accounts/bots")
-                            logger.error("3. Comment thread might be locked/archived")
-                            logger.error("4. Insufficient karma to post in subreddit")
-                            logger.error("5. Rate limiting (too many requests)")
+                        status = _error_status(e)
+                        if _is_closed_thread_error(e):
+                            # Reddit already told us why; no need to look the thread up
+                            logger.info("Skipping comment %s: %s", comment.id, e)
+                            self._remember_comment(comment.id)
+
+                        elif status == 403:
+                            logger.error("403 FORBIDDEN - Failed to reply to comment %s: %s\n%s",
+                                         comment.id, e, _REPLY_FORBIDDEN_CAUSES)
 
                             # Check if we can still access the comment
                             try:
-                                comment.refresh()
-                                if hasattr(comment, 'locked') and comment.locked:
+                                locked, archived = self._thread_flags(comment)
+                                if locked:
                                     logger.error("Comment thread is LOCKED")
-                                if hasattr(comment, 'archived') and comment.archived:
+                                if archived:
                                     logger.error("Comment thread is ARCHIVED")
-                            except:
-                                logger.error("Cannot access comment details - might be deleted/removed")
-
-                        elif "429" in error_msg or "rate" in error_msg:
-                            logger.error(f"RATE LIMITED - Failed to reply to comment {comment.id}: {e}")
-                            logger.error("Waiting longer before next attempt...")
-                            time.sleep(60)  # Wait 1 minute for rate limiting
+                            except _REDDIT_ERRORS as flags_error:
+                                logger.error("Cannot access comment details - might be deleted/removed: %s", flags_error)
+
+                        elif status == 429:
+                            logger.error("RATE LIMITED - Failed to reply to comment %s: %s", comment.id, e)
+                            self._reply_rate = max(self._reply_rate / 2, _REPLY_RATE_MIN)
+                            delay = self._rate_limit_delay(e)
+                            logger.error("Waiting %.1f seconds before next attempt...", delay)
+                            time.sleep(delay)
                         else:
-                            logger.error(f"Failed to reply to comment {comment.id}: {e}")
+                            logger.error("Failed to reply to comment %s: %s", comment.id, e)
 
         except Exception as e:
-            logger.error(f"Error processing comments: {e}")
+            logger.error("Error processing comments: %s", e)
     
     def run(self):
         """Main bot loop with smart Railway hour management"""
         # Get current time in IST
-        ist = pytz.timezone('Asia/Kolkata')
-        current_time_ist = datetime.now(ist)
+        current_time_ist = datetime.now(self._ist)
         current_hour = current_time_ist.hour
         time_str = current_time_ist.strftime("%H:%M IST")
 
-        logger.info(f"Bot starting at {time_str} (hour {current_hour})")
+        logger.info("Bot starting at %s (hour %s)", time_str, current_hour)
 
         # Check if bot should be active before even starting
         if not self._is_active_hours():
-            logger.info(f"Bot starting during inactive hours ({time_str}). Exiting to save Railway hours.")
+            logger.info("Bot starting during inactive hours (%s). Exiting to save Railway hours.", time_str)
             logger.info("Inactive hours: 1 AM - 8:59 AM IST")
             logger.info("Active hours: 9 AM - 12:59 AM IST")
             logger.info("Bot will restart automatically during active hours")
@@ -2188,29 +2391,28 @@ class BITSATBot:
         # Retry authentication up to 3 times
         max_auth_retries = 3
         for attempt in range(max_auth_retries):
-            logger.info(f"Authentication attempt {attempt + 1}/{max_auth_retries}")
+            logger.info("Authentication attempt %s/%s", attempt + 1, max_auth_retries)
             if self.authenticate():
                 break
             elif attempt < max_auth_retries - 1:
-                logger.info(f"Retrying authentication in 60 seconds...")
+                logger.info("Retrying authentication in 60 seconds...")
                 time.sleep(60)
             else:
                 logger.error("Failed to authenticate after 3 attempts. Exiting.")
                 return
 
         logger.info("BITSAT Bot started successfully!")
-        logger.info(f"Monitoring r/{self.subreddit.display_name}")
+        logger.info("Monitoring r/%s", self.subreddit.display_name)
         logger.info("Active hours: 9 AM - 1 AM (saves Railway hours during night)")
 
         while True:
             try:
                 # Check if we should stop to save Railway hours
                 if not self._is_active_hours():
-                    ist = pytz.timezone('Asia/Kolkata')
-                    current_time_ist = datetime.now(ist)
+                    current_time_ist = datetime.now(self._ist)
                     current_time = current_time_ist.strftime("%H:%M IST")
                     current_hour = current_time_ist.hour
-                    logger.info(f"SHUTDOWN: Reached inactive hours at {current_time} (hour {current_hour})")
+                    logger.info("SHUTDOWN: Reached inactive hours at %s (hour %s)", current_time, current_hour)
                     logger.info("Stopping bot to save Railway hours during night (1 AM - 9 AM IST)")
                     logger.info("Bot will restart automatically at 9 AM IST. Good night!")
                     break
@@ -2220,113 +2422,49 @@ class BITSATBot:
                 logger.info("Bot stopped by user")
                 break
             except Exception as e:
-                error_msg = str(e).lower()
-
-                if "403" in error_msg or "forbidden" in error_msg:
-                    logger.error(f"403 FORBIDDEN: {e}")
-                    logger.error("   Possible causes:")
-                    logger.error("   • Account banned/suspended")
-                    logger.error("   • Rate limited")
-                    logger.error("   • Permission issues")
-                    logger.error("   • Wrong credentials")
-                elif "429" in error_msg or "rate" in error_msg:
-                    logger.error(f"RATE LIMITED: {e}")
-                    logger.info("Waiting 5 minutes for rate limit to reset...")
-                    time.sleep(300)  # Wait 5 minutes
+                status = _error_status(e)
+
+                if status == 403:
+                    logger.error("403 FORBIDDEN: %s\n%s", e, _RUN_FORBIDDEN_CAUSES)
+                elif status == 429:
+                    logger.error("RATE LIMITED: %s", e)
+                    delay = self._rate_limit_delay(e)
+                    logger.info("Waiting %.1f seconds for rate limit to reset...", delay)
+                    time.sleep(delay)
                     continue
-                elif "401" in error_msg or "unauthorized" in error_msg:
-                    logger.error(f"401 UNAUTHORIZED: {e}")
+                elif status == 401:
+                    logger.error("401 UNAUTHORIZED: %s", e)
                     logger.error("   Check client_id and client_secret")
                 else:
-                    logger.error(f"Unexpected error: {e}")
+                    logger.error("Unexpected error: %s", e)
 
-                logger.info("Restarting in 60 seconds...")
-                time.sleep(60)
+                # Wait longer after each consecutive failure, up to the cap
+                delay = self._reconnect_delay + random.random()
+                self._reconnect_delay = min(self._reconnect_delay * 2, _RECONNECT_DELAY_MAX)
+                logger.info("Restarting in %.0f seconds...", delay)
+                time.sleep(delay)
 
                 # Try to reconnect
                 try:
                     logger.info("Attempting to reconnect...")
                     if self.authenticate():
                         logger.info("Reconnected successfully")
+                        self._reconnect_delay = _RECONNECT_DELAY_INITIAL
                     else:
                         logger.error("Reconnection failed")
                 except Exception as reconnect_error:
-                    logger.error(f"Reconnection error: {reconnect_error}")
-                    time.sleep(60)
+                    logger.error("Reconnection error: %s", reconnect_error)
 
     def _generate_help_response(self, author):
         """Generate comprehensive help response in clean table format"""
-        response = f"**BITSAT Bot Help Guide**\n\n"
-
-        response += "## **HOW TO USE THE BOT**\n\n"
-        response += "**The bot responds ONLY to:**\n"
-        response += "1. **Commands starting with `!`** (e.g., `!cutoff cse`)\n"
-        response += "2. **Direct mentions** (e.g., `@No_Attendance_Bot what's the cutoff?`)\n"
-        response += "3. **Replies to bot comments**\n"
-        response += "4. **Direct questions** asking for specific cutoff/admission info\n\n"
-
-        response += "## **AVAILABLE FEATURES**\n\n"
-        response += "| Feature | Command/Query | Example |\n"
-        response += "|---------|---------------|----------|\n"
-        response += "| **Cutoff Queries** | `!cutoff [branch] [campus]` | `!cutoff cse pilani` |\n"
-        response += "| | Direct question | `What's the CSE cutoff for Pilani?` |\n"
-        response += "| **Branch Comparisons** | `!compare [branch1] vs [branch2]` | `!compare cse vs ece` |\n"
-        response += "| **Cutoff Trends** | `!trends [branch] [campus]` | `!trends cse pilani` |\n"
-        response += "| **Smart Suggestions** | `!suggest [score]` | `!suggest 285` |\n"
-        response += "| **Admission Queries** | Direct question | `Can I get CSE with 310 marks?` |\n"
-        response += "| **Help** | `!help` | `!help` |\n\n"
-
-        response += "## **SUPPORTED BRANCHES**\n\n"
-        response += "| Category | Branches |\n"
-        response += "|----------|----------|\n"
-        response += "| **Engineering** | CSE, ECE, EEE, Mechanical, Chemical, Civil, MnC, ENI, Manufacturing |\n"
-        response += "| **M.Sc Programs** | Mathematics, Physics, Chemistry, Biology, Economics |\n"
-        response += "| **Other** | Pharmacy |\n\n"
-
-        response += "## **SUPPORTED CAMPUSES**\n\n"
-        response += "| Campus | Location | Specialties |\n"
-        response += "|--------|----------|-------------|\n"
-        response += "| **Pilani** | Rajasthan | Original campus, highest cutoffs |\n"
-        response += "| **Goa** | Goa | Beach campus, moderate cutoffs |\n"
-        response += "| **Hyderabad** | Telangana | Modern campus, growing reputation |\n\n"
-
-        response += "## **DATA ACCURACY**\n\n"
-        response += "| Data Type | Source | Years |\n"
-        response += "|-----------|--------|-------|\n"
-        response += "| **Cutoffs** | Official BITS website | 2024-25 |\n"
-        response += "| **Trends** | Historical BITS data | 2022-2024 |\n"
-        response += "| **Placements** | Industry reports | Recent data |\n"
-        response += "| **Predictions** | Statistical analysis | 2025 forecast |\n\n"
-
-        response += "## **QUICK EXAMPLES**\n\n"
-        response += "| Query Type | Example Input |\n"
-        response += "|------------|---------------|\n"
-        response += "| Command | `!cutoff cse pilani` |\n"
-        response += "| Direct question | `What's the ECE cutoff for Goa?` |\n"
-        response += "| Mention bot | `@No_Attendance_Bot help with cutoffs` |\n"
-        response += "| Comparison | `!compare cse vs ece` |\n"
-        response += "| Trends | `!trends mechanical` |\n"
-        response += "| Suggestions | `!suggest 295` |\n"
-        response += "| Admission check | `Can I get ECE with 285 marks?` |\n\n"
-
-        response += "**Important:** Bot only responds to explicit commands (!), mentions, replies, or direct questions. It won't respond to casual mentions of 'cutoff' in discussions.\n\n"
-        response += "---\n\n"
-        response += "**NEW: DM CHATBOT FEATURE**\n\n"
-        response += "Send me a DM starting with 'hi' to activate chatbot mode!\n"
-        response += "I'll chat with you using funny, sassy responses with a bit of Hinglish.\n"
-        response += "Perfect for stress relief during BITSAT prep!\n\n"
-        response += "---\n"
-        response += "*Created by [u/Difficult-Dig7627](https://www.reddit.com/user/Difficult-Dig7627/) for r/bitsatards*"
-
-        return response
+        return _HELP_RESPONSE
 
     def _generate_chance_response(self, author, query):
         """Generate admission chance response for specific branch and score"""
         query_lower = query.lower()
 
         # Extract score
-        import re
-        score_match = re.search(r'\b(\d{2,3})\b', query_lower)
+        score_match = _SCORE_RE.search(query_lower)
         user_score = int(score_match.group(1)) if score_match else None
 
         if not user_score:
@@ -2338,36 +2476,23 @@ class BITSATBot:
         if not detected_branch:
             return f"Hey {author}, I couldn't identify the branch you're asking about. Please mention a specific branch!"
 
-        # Get cutoff data
-        cutoff_data = self._get_cutoff_data()
-
         greeting = self._get_random_greeting(author)
-        response = f"**{greeting}, here's your admission chance analysis:**\n\n"
-
-        # Branch display names
-        branch_names = {
-            'cse': 'Computer Science', 'ece': 'Electronics & Communication',
-            'eee': 'Electrical & Electronics', 'mechanical': 'Mechanical',
-            'chemical': 'Chemical', 'civil': 'Civil', 'mnc': 'Math & Computing',
-            'eni': 'Electronics & Instrumentation', 'manufacturing': 'Manufacturing',
-            'pharmacy': 'Pharmacy', 'biology': 'M.Sc Biology', 'physics': 'M.Sc Physics',
-            'chemistry': 'M.Sc Chemistry', 'mathematics': 'M.Sc Mathematics', 'economics': 'M.Sc Economics'
-        }
+        parts = [f"**{greeting}, here's your admission chance analysis:**\n\n"]
 
-        branch_name = branch_names.get(detected_branch, detected_branch.upper())
-        response += f"**ADMISSION CHANCES FOR {branch_name.upper()} WITH {user_score}/390**\n\n"
+        branch_name = _BRANCH_NAMES.get(detected_branch, detected_branch.upper())
+        parts.append(f"**ADMISSION CHANCES FOR {branch_name.upper()} WITH {user_score}/390**\n\n")
 
         # Campus-wise analysis
-        response += "| Campus | 2024 Cutoff | Your Score | Gap | Admission Chance | Verdict |\n"
-        response += "|--------|-------------|------------|-----|------------------|----------|\n"
+        parts.append(_CHANCE_TABLE_HEADER)
 
-        campuses = ['pilani', 'goa', 'hyderabad']
+        campuses = _CAMPUS_KEYS
         chances_found = False
         best_gap = -999
         best_campus = None
 
+        cutoff_key = _BRANCH_CUTOFF_KEYS[detected_branch]
         for campus in campuses:
-            cutoff = cutoff_data.get(campus, {}).get(detected_branch)
+            cutoff = _CUTOFF_DATA.get(campus, {}).get(cutoff_key)
             if cutoff:
                 chances_found = True
                 gap = user_score - cutoff
@@ -2391,37 +2516,36 @@ class BITSATBot:
                 else:
                     chance, verdict = "<5%", "Extremely Difficult"
 
-                gap_str = f"+{gap}" if gap >= 0 else str(gap)
-                response += f"| {campus.title()} | {cutoff} | {user_score} | {gap_str} | {chance} | {verdict} |\n"
+                parts.append(_CHANCE_TABLE_ROW.format(campus=_CAMPUS_NAMES[campus], cutoff=cutoff, score=user_score, gap=gap, chance=chance, verdict=verdict))
 
         if not chances_found:
-            response += f"| - | Not offered | {user_score} | - | 0% | Not available |\n"
-            response += f"\n**{branch_name} is not offered at any BITS campus.**\n\n"
-            return response
+            parts.append(f"| - | Not offered | {user_score} | - | 0% | Not available |\n")
+            parts.append(f"\n**{branch_name} is not offered at any BITS campus.**\n\n")
+            return "".join(parts)
 
         # Overall assessment
-        response += f"\n**DETAILED ANALYSIS:**\n"
+        parts.append(f"\n**DETAILED ANALYSIS:**\n")
 
         if best_gap >= 10:
-            response += f"• **Strong Position:** You're well above cutoffs, especially at {best_campus.title()} (+{best_gap} points)\n"
-            response += f"• **Strategy:** Apply confidently, you can choose based on campus preference\n"
+            parts.append(f"• **Strong Position:** You're well above cutoffs, especially at {best_campus.title()} (+{best_gap} points)\n")
+            parts.append(f"• **Strategy:** Apply confidently, you can choose based on campus preference\n")
         elif best_gap >= 0:
-            response += f"• **Decent Position:** You're above cutoffs but margins are tight\n"
-            response += f"• **Strategy:** Apply but have backup branches ready\n"
+            parts.append(f"• **Decent Position:** You're above cutoffs but margins are tight\n")
+            parts.append(f"• **Strategy:** Apply but have backup branches ready\n")
         elif best_gap >= -10:
-            response += f"• **Borderline Case:** You're close to cutoffs, outcome depends on competition\n"
-            response += f"• **Strategy:** Apply as stretch goal, focus on safer alternatives\n"
+            parts.append(f"• **Borderline Case:** You're close to cutoffs, outcome depends on competition\n")
+            parts.append(f"• **Strategy:** Apply as stretch goal, focus on safer alternatives\n")
         else:
-            response += f"• **Challenging Situation:** Significantly below last year's cutoffs\n"
-            response += f"• **Strategy:** Consider this unlikely, explore other options\n"
+            parts.append(f"• **Challenging Situation:** Significantly below last year's cutoffs\n")
+            parts.append(f"• **Strategy:** Consider this unlikely, explore other options\n")
 
-        response += f"• **Reality Check:** Cutoffs can vary ±5-10 points based on paper difficulty and competition\n"
-        response += f"• **Important:** This analysis is based on 2024 data, actual results may differ\n\n"
+        parts.append(f"• **Reality Check:** Cutoffs can vary ±5-10 points based on paper difficulty and competition\n")
+        parts.append(f"• **Important:** This analysis is based on 2024 data, actual results may differ\n\n")
 
         # Add humorous ending
-        response += f"{self._get_random_humor('admission_ending')}"
+        parts.append(f"{self._get_random_humor('admission_ending')}")
 
-        return response
+        return "".join(parts)
 
     def _monitor_dms(self, processed_messages):
         """Monitor and respond to DMs with chatbot functionality"""
@@ -2446,18 +2570,18 @@ class BITSATBot:
                                 message.reply(chatbot_response)
                                 message.mark_read()
 
-                                logger.info(f"Chatbot replied to {author_name}: {message_body[:30]}...")
+                                logger.info("Chatbot replied to %s: %.30s...", author_name, message_body)
                                 time.sleep(3)  # Rate limiting for DMs
 
                             except Exception as dm_error:
-                                logger.error(f"Error in DM chatbot: {dm_error}")
+                                logger.error("Error in DM chatbot: %s", dm_error)
                                 message.mark_read()
                         else:
                             # Mark non-chatbot DMs as read
                             message.mark_read()
 
         except Exception as dm_error:
-            logger.error(f"Error monitoring DMs: {dm_error}")
+            logger.error("Error monitoring DMs: %s", dm_error)
 
     def _generate_chatbot_response(self, user_message, username):
         """Generate unique, funny, sassy chatbot response with a bit of Hinglish"""
@@ -2488,7 +2612,7 @@ class BITSATBot:
         """Get response templates based on message content"""
 
         # Greeting responses
-        if any(word in message_lower for word in ['hi', 'hello', 'hey', 'namaste', 'sup']):
+        if _DM_GREETING_RE.search(message_lower):
             return [
                 "Arre {username}! Welcome to my DM dungeon. I'm your friendly neighborhood BITSAT bot who's seen more cutoff tears than a tissue company. {hinglish} What's cooking?",
                 "Hey {username}! You've entered the sacred DMs of the cutoff prophet. I predict... you're here because you're stressed about admissions. {unique_element}",
@@ -2498,7 +2622,7 @@ class BITSATBot:
             ]
 
         # BITSAT/College related
-        elif any(word in message_lower for word in ['bitsat', 'cutoff', 'admission', 'college', 'bits', 'score']):
+        elif _DM_COLLEGE_RE.search(message_lower):
             return [
                 "Ah {username}, talking about BITSAT? I've seen more dreams crushed than a hydraulic press. {hinglish} But hey, I'm here to help! {unique_element}",
                 "BITSAT ke baare mein baat kar rahe hain? {username}, I'm like WebMD but for college admissions - everything seems scary but usually works out. {unique_element}",
@@ -2508,7 +2632,7 @@ class BITSATBot:
             ]
 
         # Stress/Anxiety related
-        elif any(word in message_lower for word in ['stress', 'worried', 'anxious', 'scared', 'nervous', 'tension']):
+        elif _DM_STRESS_RE.search(message_lower):
             return [
                 "Stress kar rahe ho {username}? I'm like a stress ball but with better conversation skills. {unique_element} Take a deep breath!",
                 "Anxiety attack? {username}, I've seen more panic than a fire drill. {hinglish} Remember: your worth isn't defined by one exam!",
@@ -2518,7 +2642,7 @@ class BITSATBot:
             ]
 
         # Motivational/Encouragement
-        elif any(word in message_lower for word in ['help', 'advice', 'guidance', 'support', 'motivate']):
+        elif _DM_HELP_RE.search(message_lower):
             return [
                 "Need advice, {username}? I'm like your wise uncle but with better memes. {hinglish} {unique_element}",
                 "Looking for guidance? {username}, I'm like GPS but for life decisions - sometimes I take you through weird routes but you reach the destination. {unique_element}",
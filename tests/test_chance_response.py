@@ -0,0 +1,25 @@
+"""Chance replies must find a real cutoff for every branch alias"""
+
+import pytest
+
+from reddit_bot import BITSATBot, _BRANCH_MAPPINGS
+
+
+@pytest.fixture(scope='module')
+def bot():
+    return BITSATBot()
+
+
+@pytest.mark.parametrize('alias', [alias for aliases in _BRANCH_MAPPINGS.values() for alias in aliases])
+def test_chance_response_finds_cutoff(bot, alias):
+    response = bot._generate_chance_response('someone', f'can i get {alias} with 300 marks?')
+
+    assert '| - | Not offered |' not in response
+    assert 'not offered at any BITS campus' not in response
+
+
+def test_chemistry_uses_msc_cutoffs(bot):
+    response = bot._generate_chance_response('someone', 'can i get chemistry goa with 300 admission?')
+
+    for campus, cutoff in (('Pilani', 241), ('Goa', 236), ('Hyderabad', 235)):
+        assert f'| {campus} | {cutoff} |' in response
@@ -0,0 +1,15 @@
+"""Cross-campus comparisons pair each campus with the branch on its own side"""
+
+import pytest
+
+from reddit_bot import BITSATBot
+
+
+@pytest.mark.parametrize('query,expected', [
+    ('goa cse vs pilani ece', [('goa', 'cse'), ('pilani', 'ece')]),
+    ('cse at hyderabad vs msc mathematics at pilani', [('hyderabad', 'cse'), ('pilani', 'mathematics')]),
+    ('cse in goa or ece in pilani', [('goa', 'cse'), ('pilani', 'ece')]),
+    ('goa cse, pilani ece', [('goa', 'cse'), ('pilani', 'ece')]),
+])
+def test_campus_branch_pairs(query, expected):
+    assert BITSATBot()._detect_campus_branch_comparison(query) == expected
@@ -0,0 +1,26 @@
+"""Rate-limit waits follow what Reddit says, with a minute-long floor otherwise"""
+
+import praw
+
+from reddit_bot import BITSATBot, _BACKOFF_INITIAL
+
+
+def _ratelimit_error(message):
+    return praw.exceptions.RedditAPIException([['RATELIMIT', message, 'ratelimit']])
+
+
+def test_waits_for_the_duration_in_the_ratelimit_message():
+    bot = BITSATBot()
+
+    assert bot._rate_limit_delay(_ratelimit_error(
+        "Looks like you've been doing that a lot. Take a break for 5 minutes before trying again."
+    )) == 300
+    assert bot._rate_limit_delay(_ratelimit_error("Take a break for 40 seconds before trying again.")) == 40
+
+
+def test_backoff_without_a_stated_wait_starts_at_the_floor():
+    bot = BITSATBot()
+
+    delay = bot._rate_limit_delay(_ratelimit_error("you are doing that too much"))
+
+    assert _BACKOFF_INITIAL <= delay <= _BACKOFF_INITIAL * 1.5